@@ -38,13 +38,21 @@ class Settings:
     
     # Download Configuration
     DOWNLOAD_DIR: Path = Path(os.getenv("DOWNLOAD_DIR", "./downloads"))
+    # 0 = derive from the CPU count (see DownloadManager)
     MAX_CONCURRENT_DOWNLOADS: int = int(os.getenv("MAX_CONCURRENT_DOWNLOADS", "10"))
+    # Grow/shrink the image worker pool between chapters based on throttling
+    ADAPTIVE_DOWNLOADS: bool = os.getenv("ADAPTIVE_DOWNLOADS", "false").lower() == "true"
+    # Chapters downloaded at the same time (they share the image workers above)
+    CHAPTER_CONCURRENCY: int = int(os.getenv("CHAPTER_CONCURRENCY", "3"))
     CHUNK_SIZE: int = int(os.getenv("CHUNK_SIZE", "8192"))
     
     # Rate Limiting Configuration
     # Mangadx API allows ~5 requests/second. Default 0.25s = 4 req/s to stay safe
     # See: https://api.mangadex.org/docs/2-limitations/
     RATE_LIMIT_DELAY: float = float(os.getenv("RATE_LIMIT_DELAY", "0.25"))
+    # Requests that may go out back-to-back before RATE_LIMIT_DELAY spacing
+    # applies (token bucket capacity; 1 = strict spacing)
+    RATE_LIMIT_BURST: int = int(os.getenv("RATE_LIMIT_BURST", "1"))
     # Maximum number of retry attempts for failed requests
     MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
     # Base delay between retries (uses exponential backoff)
@@ -53,8 +61,14 @@ class Settings:
     # Request Configuration
     # Timeout for HTTP requests in seconds
     REQUEST_TIMEOUT: int = int(os.getenv("REQUEST_TIMEOUT", "30"))
+    # Timeout for establishing a connection, so unreachable hosts fail fast
+    CONNECT_TIMEOUT: float = float(os.getenv("CONNECT_TIMEOUT", "5"))
     # User agent string for API requests
     USER_AGENT: str = os.getenv("USER_AGENT", "MangadxDownloader/1.0")
+    # Per-host connection pools kept by the HTTP client, and keep-alive
+    # connections per pool (callers wait for a free one beyond that)
+    POOL_CONNECTIONS: int = int(os.getenv("POOL_CONNECTIONS", "16"))
+    POOL_MAXSIZE: int = int(os.getenv("POOL_MAXSIZE", "64"))
     
     # Default Filters
     DEFAULT_LANGUAGE: str = os.getenv("DEFAULT_LANGUAGE", "en")
@@ -91,14 +105,20 @@ class Settings:
         cls._validate_url(cls.UPLOADS_URL, "UPLOADS_URL")
         
         # Validate numeric settings
-        if cls.MAX_CONCURRENT_DOWNLOADS < 1:
-            raise ValueError("MAX_CONCURRENT_DOWNLOADS must be at least 1")
+        if cls.MAX_CONCURRENT_DOWNLOADS < 0:
+            raise ValueError("MAX_CONCURRENT_DOWNLOADS must be non-negative (0 = automatic)")
         
         if cls.MAX_CONCURRENT_DOWNLOADS > 50:
             raise ValueError("MAX_CONCURRENT_DOWNLOADS should not exceed 50 to avoid overwhelming the server")
+
+        if cls.CHAPTER_CONCURRENCY < 1:
+            raise ValueError("CHAPTER_CONCURRENCY must be at least 1")
             
         if cls.RATE_LIMIT_DELAY < 0:
             raise ValueError("RATE_LIMIT_DELAY must be non-negative")
+
+        if cls.RATE_LIMIT_BURST < 1:
+            raise ValueError("RATE_LIMIT_BURST must be at least 1")
             
         if cls.RATE_LIMIT_DELAY < 0.1:
             raise ValueError("RATE_LIMIT_DELAY should be at least 0.1 seconds to respect Mangadx API limits")
@@ -117,6 +137,12 @@ class Settings:
             
         if cls.REQUEST_TIMEOUT > 300:
             raise ValueError("REQUEST_TIMEOUT should not exceed 300 seconds")
+
+        if cls.CONNECT_TIMEOUT <= 0:
+            raise ValueError("CONNECT_TIMEOUT must be positive")
+
+        if cls.POOL_CONNECTIONS < 1 or cls.POOL_MAXSIZE < 1:
+            raise ValueError("POOL_CONNECTIONS and POOL_MAXSIZE must be at least 1")
         
         if cls.CHUNK_SIZE < 1024:
             raise ValueError("CHUNK_SIZE should be at least 1024 bytes")
@@ -174,13 +200,19 @@ class Settings:
             },
             "rate_limiting": {
                 "delay": cls.RATE_LIMIT_DELAY,
+                "burst": cls.RATE_LIMIT_BURST,
                 "max_retries": cls.MAX_RETRIES,
                 "retry_delay": cls.RETRY_DELAY,
                 "request_timeout": cls.REQUEST_TIMEOUT,
+                "connect_timeout": cls.CONNECT_TIMEOUT,
+                "pool_connections": cls.POOL_CONNECTIONS,
+                "pool_maxsize": cls.POOL_MAXSIZE,
             },
             "downloads": {
                 "directory": str(cls.DOWNLOAD_DIR),
                 "max_concurrent": cls.MAX_CONCURRENT_DOWNLOADS,
+                "chapter_concurrency": cls.CHAPTER_CONCURRENCY,
+                "adaptive": cls.ADAPTIVE_DOWNLOADS,
                 "chunk_size": cls.CHUNK_SIZE,
             },
             "defaults": {
@@ -25,31 +25,63 @@ CLI Usage:
     $ mangadx-scrapper  # Interactive mode
 """
 
-# Import API modules for convenience
-from .api import (
-    AtHomeAPI,
-    AuthorAPI,
-    ChapterAPI,
-    CoverAPI,
-    MangaAPI,
-    ScanlationGroupAPI,
-)
-from .client import MangaDxClient
-from .downloader import DownloadManager
-from .exceptions import (
-    APIException,
-    AuthenticationException,
-    AuthorizationException,
-    DownloadException,
-    MangaDxException,
-    NetworkException,
-    NotFoundException,
-    RateLimitException,
-    ServerException,
-    TimeoutException,
-    ValidationException,
-)
-from .models import Chapter, LocalizedString, Manga, Relationship
+# Public names are imported lazily (PEP 562) so that importing the package,
+# e.g. for a CLI entry point's --help, does not load the HTTP stack
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "MangaDxClient": ".client",
+    "DownloadManager": ".downloader",
+    "AtHomeAPI": ".api",
+    "AuthorAPI": ".api",
+    "ChapterAPI": ".api",
+    "CoverAPI": ".api",
+    "MangaAPI": ".api",
+    "ScanlationGroupAPI": ".api",
+    "APIException": ".exceptions",
+    "AuthenticationException": ".exceptions",
+    "AuthorizationException": ".exceptions",
+    "DownloadException": ".exceptions",
+    "MangaDxException": ".exceptions",
+    "NetworkException": ".exceptions",
+    "NotFoundException": ".exceptions",
+    "RateLimitException": ".exceptions",
+    "ServerException": ".exceptions",
+    "TimeoutException": ".exceptions",
+    "ValidationException": ".exceptions",
+    "Chapter": ".models",
+    "LocalizedString": ".models",
+    "Manga": ".models",
+    "Relationship": ".models",
+}
+
+if TYPE_CHECKING:
+    from .api import (
+        AtHomeAPI,
+        AuthorAPI,
+        ChapterAPI,
+        CoverAPI,
+        MangaAPI,
+        ScanlationGroupAPI,
+    )
+    from .client import MangaDxClient
+    from .downloader import DownloadManager
+    from .exceptions import (
+        APIException,
+        AuthenticationException,
+        AuthorizationException,
+        DownloadException,
+        MangaDxException,
+        NetworkException,
+        NotFoundException,
+        RateLimitException,
+        ServerException,
+        TimeoutException,
+        ValidationException,
+    )
+    from .models import Chapter, LocalizedString, Manga, Relationship
 
 __version__ = "1.0.0"
 __author__ = "MangaDx Scrapper Team"
@@ -93,4 +125,20 @@ __all__ = [
     "__author__",
     "__email__",
     "__license__",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily imported names in dir()."""
+    return sorted(set(globals()) | set(__all__))
@@ -62,4 +62,6 @@ class AtHomeAPI:
             images = chapter_data.get("data", [])
             quality = "data"
 
-        return [f"{base_url}/{quality}/{chapter_hash}/{image}" for image in images]
\ No newline at end of file
+        # Every page shares the same prefix: format it once
+        prefix = f"{base_url}/{quality}/{chapter_hash}/"
+        return [prefix + image for image in images]
\ No newline at end of file
@@ -55,12 +55,13 @@ class AuthorAPI:
         if name:
             params["name"] = name
         if order:
-            params["order"] = order
+            # MangaDx expects bracket notation: order[field]=direction
+            params.update({f"order[{field}]": direction for field, direction in order.items()})
         if includes:
             params["includes[]"] = includes
 
         response = self.client.get("/author", params=params)
-        return [Author.from_dict(item) for item in response.get("data", [])]
+        return Author.from_dict_list(response.get("data", []))
 
     def get(self, author_id: str, includes: Optional[List[str]] = None) -> Author:
         """
@@ -272,12 +272,13 @@ class ChapterAPI:
         if publish_at_since:
             params["publishAtSince"] = publish_at_since
         if order:
-            params["order"] = order
+            # MangaDx expects bracket notation: order[field]=direction
+            params.update({f"order[{field}]": direction for field, direction in order.items()})
         if includes:
             params["includes[]"] = includes
 
         response = self.client.get("/chapter", params=params)
-        return [Chapter.from_dict(item) for item in response.get("data", [])]
+        return Chapter.from_dict_list(response.get("data", []))
 
     def get(self, chapter_id: str, includes: Optional[List[str]] = None) -> Chapter:
         """
@@ -30,12 +30,25 @@ Example Usage:
     >>> url = cover_api.get_cover_url("manga-uuid", "cover-filename")
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
+from ..config import Settings
 from ..exceptions import ValidationException
 from ..http_client import HTTPClient
 from ..models import Cover
 
+# Resolved once at import; Settings is read from the environment on load
+_COVERS_URL = f"{Settings.UPLOADS_URL}/covers"
+
+CoverSize = Literal["original", "512", "256"]
+
+# File name suffix of each thumbnail size served by the uploads host
+_COVER_SUFFIXES: Dict[str, str] = {
+    "original": "",
+    "512": ".512.jpg",
+    "256": ".256.jpg",
+}
+
 
 class CoverAPI:
     """
@@ -103,12 +116,13 @@ class CoverAPI:
         if locales:
             params["locales[]"] = locales
         if order:
-            params["order"] = order
+            # MangaDx expects bracket notation: order[field]=direction
+            params.update({f"order[{field}]": direction for field, direction in order.items()})
         if includes:
             params["includes[]"] = includes
 
         response = self.client.get("/cover", params=params)
-        return [Cover.from_dict(item) for item in response.get("data", [])]
+        return Cover.from_dict_list(response.get("data", []))
 
     def get(self, cover_id: str, includes: Optional[List[str]] = None) -> Cover:
         """
@@ -128,7 +142,7 @@ class CoverAPI:
         response = self.client.get(f"/cover/{cover_id}", params=params)
         return Cover.from_dict(response["data"])
 
-    def get_cover_url(self, manga_id: str, file_name: str, size: str = "original") -> str:
+    def get_cover_url(self, manga_id: str, file_name: str, size: CoverSize = "original") -> str:
         """
         Get cover image URL.
 
@@ -140,9 +154,12 @@ class CoverAPI:
         Returns:
             Cover image URL
         """
-        from ..config import Settings
+        return _cover_url(manga_id, file_name, size)
+
 
-        if size == "original":
-            return f"{Settings.UPLOADS_URL}/covers/{manga_id}/{file_name}"
-        else:
-            return f"{Settings.UPLOADS_URL}/covers/{manga_id}/{file_name}.{size}.jpg"
\ No newline at end of file
+def _cover_url(manga_id: str, file_name: str, size: str) -> str:
+    """Build a cover image URL."""
+    suffix = _COVER_SUFFIXES.get(size)
+    if suffix is None:
+        suffix = f".{size}.jpg"
+    return f"{_COVERS_URL}/{manga_id}/{file_name}{suffix}"
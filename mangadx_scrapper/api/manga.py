@@ -24,7 +24,7 @@ Authentication:
     Some advanced features may require API authentication in the future.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from ..exceptions import NotFoundException, ValidationException
 from ..http_client import HTTPClient
@@ -270,7 +270,8 @@ class MangaAPI:
         if updated_at_since:
             params["updatedAtSince"] = updated_at_since
         if order:
-            params["order"] = order
+            # MangaDx expects bracket notation: order[field]=direction
+            params.update({f"order[{field}]": direction for field, direction in order.items()})
         if includes:
             params["includes[]"] = includes
         if has_available_chapters is not None:
@@ -279,7 +280,7 @@ class MangaAPI:
             params["group"] = group
 
         response = self.client.get("/manga", params=params)
-        return [Manga.from_dict(item) for item in response.get("data", [])]
+        return Manga.from_dict_list(response.get("data", []))
 
     def get(self, manga_id: str, includes: Optional[List[str]] = None) -> Manga:
         """
@@ -463,20 +464,43 @@ class MangaAPI:
         Returns:
             List of chapter dictionaries with chapter number and ID
         """
-        volumes = self.get_aggregate(manga_id, translated_language, groups)
-        chapters = []
+        return list(self.iter_chapters_list(manga_id, translated_language, groups))
 
-        for volume_data in volumes.values():
-            for chapter_data in volume_data.get("chapters", {}).values():
-                chapters.append({
-                    "volume": volume_data.get("volume"),
-                    "chapter": chapter_data.get("chapter"),
-                    "id": chapter_data.get("id"),
-                    "others": chapter_data.get("others", []),
-                    "count": chapter_data.get("count", 0),
-                })
+    def iter_chapters_list(
+        self,
+        manga_id: str,
+        translated_language: Optional[List[str]] = None,
+        groups: Optional[List[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the chapters of a manga's aggregate data.
+
+        Same entries as get_chapters_list(), yielded one by one so callers
+        can stop early without building the full list.
 
-        return chapters
+        Args:
+            manga_id: Manga UUID
+            translated_language: Filter by translated languages
+            groups: Filter by scanlation group UUIDs
+
+        Returns:
+            Iterator of chapter dictionaries with chapter number and ID
+        """
+        volumes = self.get_aggregate(manga_id, translated_language, groups)
+        return (
+            {
+                "volume": volume,
+                "chapter": chapter_data.get("chapter"),
+                "id": chapter_data.get("id"),
+                "others": chapter_data.get("others", []),
+                "count": chapter_data.get("count", 0),
+            }
+            for volume, chapters in (
+                (volume_data.get("volume"), volume_data.get("chapters", {}))
+                for volume_data in volumes.values()
+            )
+            for chapter_data in chapters.values()
+        )
 
     def get_feed(
         self,
@@ -545,7 +569,8 @@ class MangaAPI:
         if publish_at_since:
             params["publishAtSince"] = publish_at_since
         if order:
-            params["order"] = order
+            # MangaDx expects bracket notation: order[field]=direction
+            params.update({f"order[{field}]": direction for field, direction in order.items()})
         if includes:
             params["includes[]"] = includes
 
@@ -59,12 +59,13 @@ class ScanlationGroupAPI:
         if focused_language:
             params["focusedLanguage"] = focused_language
         if order:
-            params["order"] = order
+            # MangaDx expects bracket notation: order[field]=direction
+            params.update({f"order[{field}]": direction for field, direction in order.items()})
         if includes:
             params["includes[]"] = includes
 
         response = self.client.get("/group", params=params)
-        return [ScanlationGroup.from_dict(item) for item in response.get("data", [])]
+        return ScanlationGroup.from_dict_list(response.get("data", []))
 
     def get(self, group_id: str, includes: Optional[List[str]] = None) -> ScanlationGroup:
         """
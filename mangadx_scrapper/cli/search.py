@@ -121,7 +121,7 @@ def search_manga(
             for manga in manga_list:
                 result = {
                     "id": manga.id,
-                    "title": manga.title.values,
+                    "title": dict(manga.title),
                     "status": manga.status,
                     "content_rating": manga.content_rating,
                     "year": manga.year,
@@ -16,7 +16,7 @@ from .api import (
     ScanlationGroupAPI,
 )
 from .config import Settings
-from .http_client import HTTPClient
+from .http_client import get_client, release_client
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +37,10 @@ class MangaDxClient:
             access_token: Optional access token for authenticated requests
         """
         self.base_url = base_url or Settings.BASE_URL
-        self.http_client = HTTPClient(self.base_url, access_token)
+        # Shared with other clients for the same base URL and token; released
+        # (and closed once unused) by close()
+        self.http_client = get_client(self.base_url, access_token)
+        self._released = False
 
         # Initialize API modules
         self.manga = MangaAPI(self.http_client)
@@ -58,14 +61,23 @@ class MangaDxClient:
         """
         try:
             response = self.http_client.get("/ping", skip_rate_limit=True)
-            return response.get("result") == "ok" or "pong" in str(response).lower()
+            # /ping answers with a plain-text "pong", which the HTTP client
+            # hands back as {"content": "pong"}
+            return response.get("result") == "ok" or response.get("content", "").strip() == "pong"
         except Exception as e:
             logger.error(f"Ping failed: {e}")
             return False
 
     def close(self) -> None:
-        """Close the HTTP client session."""
-        self.http_client.close()
+        """
+        Release the HTTP client.
+
+        The underlying HTTPClient is shared via get_client() and is closed
+        once every MangaDxClient using it has been closed.
+        """
+        if not self._released:
+            self._released = True
+            release_client(self.http_client)
 
     def __enter__(self):
         """Context manager entry."""
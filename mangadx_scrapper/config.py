@@ -39,6 +39,9 @@ class Settings:
     # MangaDx API allows ~5 requests/second. Default 0.25s = 4 req/s to stay safe
     # See: https://api.mangadex.org/docs/2-limitations/
     RATE_LIMIT_DELAY: float = float(os.getenv("RATE_LIMIT_DELAY", "0.25"))
+    # Requests that may go out back-to-back before RATE_LIMIT_DELAY spacing
+    # applies (token bucket capacity; 1 = strict spacing)
+    RATE_LIMIT_BURST: int = int(os.getenv("RATE_LIMIT_BURST", "1"))
     # Maximum number of retry attempts for failed requests
     MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
     # Base delay between retries (uses exponential backoff)
@@ -47,8 +50,14 @@ class Settings:
     # Request Configuration
     # Timeout for HTTP requests in seconds
     REQUEST_TIMEOUT: int = int(os.getenv("REQUEST_TIMEOUT", "30"))
+    # Timeout for establishing a connection, so unreachable hosts fail fast
+    CONNECT_TIMEOUT: float = float(os.getenv("CONNECT_TIMEOUT", "5"))
     # User agent string for API requests
     USER_AGENT: str = os.getenv("USER_AGENT", "MangadxDownloader/1.0")
+    # Per-host connection pools kept by the HTTP client, and keep-alive
+    # connections per pool (callers wait for a free one beyond that)
+    POOL_CONNECTIONS: int = int(os.getenv("POOL_CONNECTIONS", "16"))
+    POOL_MAXSIZE: int = int(os.getenv("POOL_MAXSIZE", "64"))
     
     # Default Filters
     DEFAULT_LANGUAGE: str = os.getenv("DEFAULT_LANGUAGE", "en")
@@ -74,9 +83,18 @@ class Settings:
         
         if cls.RATE_LIMIT_DELAY < 0:
             raise ValueError("RATE_LIMIT_DELAY must be non-negative")
+
+        if cls.RATE_LIMIT_BURST < 1:
+            raise ValueError("RATE_LIMIT_BURST must be at least 1")
         
         if cls.REQUEST_TIMEOUT < 1:
             raise ValueError("REQUEST_TIMEOUT must be at least 1")
+
+        if cls.CONNECT_TIMEOUT <= 0:
+            raise ValueError("CONNECT_TIMEOUT must be positive")
+
+        if cls.POOL_CONNECTIONS < 1 or cls.POOL_MAXSIZE < 1:
+            raise ValueError("POOL_CONNECTIONS and POOL_MAXSIZE must be at least 1")
         
         # Create necessary directories
         cls.DOWNLOAD_DIR.mkdir(parents=True, exist_ok=True)
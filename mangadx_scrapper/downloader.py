@@ -11,7 +11,6 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
-import requests
 from tqdm import tqdm
 
 from .config import Settings
@@ -203,13 +202,19 @@ class DownloadManager:
         Raises:
             DownloadException: If download fails
         """
+        # Stream into a temporary file so an interrupted download is never
+        # mistaken for a finished page
+        part_path = path.with_name(path.name + ".part")
         try:
-            response = requests.get(url, timeout=Settings.REQUEST_TIMEOUT)
-            response.raise_for_status()
-            
-            with open(path, "wb") as f:
-                f.write(response.content)
-                
+            try:
+                with open(part_path, "wb") as f:
+                    for chunk in self.client.http_client.stream_get(url):
+                        f.write(chunk)
+                part_path.replace(path)
+            except BaseException:
+                part_path.unlink(missing_ok=True)
+                raise
+
         except Exception as e:
             logger.error(f"Failed to download {url}: {e}")
             raise DownloadException(f"Failed to download file: {e}")
\ No newline at end of file
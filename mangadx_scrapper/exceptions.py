@@ -17,6 +17,9 @@ class MangaDxException(Exception):
     request IDs, error details, and user-friendly messages.
     """
 
+    # Slotted attributes keep the lazily created instance __dict__ unallocated
+    __slots__ = ("message", "status_code", "response_data", "request_id", "error_details", "retry_info")
+
     def __init__(
         self, 
         message: str, 
@@ -70,6 +73,15 @@ class MangaDxException(Exception):
             f")"
         )
 
+    def __reduce__(self):
+        """Pickle slot values too (BaseException only pickles __dict__)."""
+        state = {
+            name: getattr(self, name, None)
+            for klass in type(self).__mro__
+            for name in klass.__dict__.get("__slots__", ())
+        }
+        return type(self), (self.message,), state
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert exception to dictionary for serialization.
@@ -147,6 +159,8 @@ class APIException(MangaDxException):
     This is the base class for all API-related exceptions that don't
     fit into more specific categories.
     """
+
+    __slots__ = ()
     
     def get_user_message(self) -> str:
         """Get user-friendly message for API errors."""
@@ -161,6 +175,8 @@ class AuthenticationException(MangaDxException):
     
     This typically indicates missing or invalid authentication credentials.
     """
+
+    __slots__ = ()
     
     def get_user_message(self) -> str:
         """Get user-friendly message for authentication errors."""
@@ -178,6 +194,8 @@ class AuthorizationException(MangaDxException):
     This indicates the user is authenticated but lacks permission
     for the requested resource or action.
     """
+
+    __slots__ = ()
     
     def get_user_message(self) -> str:
         """Get user-friendly message for authorization errors."""
@@ -195,6 +213,8 @@ class NotFoundException(MangaDxException):
     This typically indicates the requested manga, chapter, or other
     resource does not exist or has been removed.
     """
+
+    __slots__ = ("resource_type", "resource_id")
     
     def __init__(self, message: str, resource_type: Optional[str] = None, resource_id: Optional[str] = None, **kwargs):
         """
@@ -231,6 +251,8 @@ class RateLimitException(MangaDxException):
     The exception includes information about when to retry.
     """
 
+    __slots__ = ("retry_after", "rate_limit_info")
+
     def __init__(
         self, 
         message: str, 
@@ -275,6 +297,8 @@ class ValidationException(MangaDxException):
     
     This indicates the request parameters or data are invalid.
     """
+
+    __slots__ = ("validation_errors",)
     
     def __init__(
         self, 
@@ -321,6 +345,8 @@ class ServerException(MangaDxException):
     This indicates an error on the server side that is typically
     temporary and may be resolved by retrying.
     """
+
+    __slots__ = ()
     
     def get_user_message(self) -> str:
         """Get user-friendly message for server errors."""
@@ -338,6 +364,8 @@ class NetworkException(MangaDxException):
     This includes connection errors, DNS resolution failures,
     and other network-level issues.
     """
+
+    __slots__ = ("original_error",)
     
     def __init__(self, message: str, original_error: Optional[Exception] = None, **kwargs):
         """
@@ -366,6 +394,8 @@ class TimeoutException(MangaDxException):
     
     This indicates the request took longer than the configured timeout period.
     """
+
+    __slots__ = ("timeout_duration",)
     
     def __init__(self, message: str, timeout_duration: Optional[float] = None, **kwargs):
         """
@@ -397,6 +427,8 @@ class DownloadException(MangaDxException):
     This includes errors during file downloads, image processing,
     and file system operations.
     """
+
+    __slots__ = ("file_path", "bytes_downloaded", "total_size")
     
     def __init__(
         self, 
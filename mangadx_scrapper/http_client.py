@@ -15,12 +15,18 @@ Features:
 
 import json
 import logging
+import socket
+import threading
 import time
-from typing import Any, Dict, List, Optional, Union
-from urllib.parse import urljoin
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from urllib.parse import urljoin, urlparse
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 from urllib3.util.retry import Retry
 
 from .config import Settings
@@ -36,11 +42,136 @@ from .exceptions import (
     ValidationException,
 )
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import brotli  # noqa: F401  - enables "br" decoding in urllib3
+    _ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:  # pragma: no cover - optional dependency
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = "br, gzip, deflate"
+    except ImportError:
+        _ACCEPT_ENCODING = "gzip, deflate"
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+try:
+    import diskcache
+except ImportError:  # pragma: no cover - optional dependency
+    diskcache = None
+
 logger = logging.getLogger(__name__)
 
+# orjson parses large feed/aggregate payloads several times faster than the
+# stdlib; both raise a ValueError subclass on malformed input
+_json_loads = orjson.loads if orjson is not None else json.loads
+_JSONDecodeError = orjson.JSONDecodeError if orjson is not None else json.JSONDecodeError
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize a JSON request body (compact UTF-8, via orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+# Shared across clients: Retry objects are immutable (urllib3 creates a new
+# one per attempt), so there is no need to build one per session.
+# Retry-After is honoured on 429/503, and once retries run out the last
+# response is returned so _handle_response raises the matching exception.
+# POST is not idempotent and is never retried.
+_RETRY_KWARGS: Dict[str, Any] = {
+    "total": Settings.MAX_RETRIES,
+    "backoff_factor": Settings.RETRY_DELAY,
+    "status_forcelist": frozenset({429, 500, 502, 503, 504}),
+    "allowed_methods": frozenset({"HEAD", "GET", "OPTIONS", "PUT", "DELETE"}),
+    "respect_retry_after_header": True,
+    "raise_on_status": False,
+}
+try:
+    # Jitter spreads out retries from clients sharing an IP (urllib3 >= 2.0)
+    _RETRY = Retry(backoff_jitter=0.5, **_RETRY_KWARGS)
+except TypeError:  # pragma: no cover - urllib3 1.26
+    _RETRY = Retry(**_RETRY_KWARGS)
+
+_DEFAULT_HEADERS = MappingProxyType({
+    "User-Agent": Settings.USER_AGENT,
+    "Content-Type": "application/json",
+    "Connection": "keep-alive",
+    # Only advertise brotli when urllib3 can actually decode it
+    "Accept-Encoding": _ACCEPT_ENCODING,
+})
+
+_EMPTY_HEADERS = MappingProxyType({})
+
+# Header names (lowercase) masked in debug logs
+_SENSITIVE_HEADERS = frozenset({"authorization", "x-api-key", "cookie", "set-cookie"})
+
+# Client errors that map directly to an exception type. 429 and 5xx are
+# handled separately in _handle_response.
+_STATUS_EXCEPTIONS = {
+    400: ValidationException,
+    401: AuthenticationException,
+    403: AuthorizationException,
+    404: NotFoundException,
+}
+
+# Concurrent requests allowed by HTTPClient.gather (MangaDx allows ~5 req/s)
+GATHER_MAX_WORKERS = 5
+
+# Maximum number of conditional-GET entries kept in memory
+ETAG_CACHE_MAXSIZE = 1024
+
+# Bytes read per chunk by HTTPClient.stream_get
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+# TCP keep-alive probes stop idle pooled connections from being dropped by
+# NAT/firewalls between bursts of requests, so the next request does not pay
+# a fresh TCP + TLS handshake. urllib3's defaults already disable Nagle
+# (TCP_NODELAY). The idle/interval knobs are Linux-specific.
+_KEEPALIVE_SOCKET_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)] + [
+    (socket.IPPROTO_TCP, getattr(socket, name), value)
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 30))
+    if hasattr(socket, name)
+]
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections use TCP keep-alive."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        """Create the pool manager with keep-alive socket options."""
+        kwargs.setdefault(
+            "socket_options", HTTPConnection.default_socket_options + _KEEPALIVE_SOCKET_OPTIONS
+        )
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert query parameter values into a hashable form for cache keys."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
 
 class HTTPClient:
-    """HTTP client with retry logic and error handling."""
+    """
+    HTTP client with retry logic and error handling.
+
+    A single instance is safe to share across threads: rate limiting, the
+    response caches and lazily created helpers are guarded by locks, and
+    the pooled session hands each request its own connection.
+    """
 
     def __init__(self, base_url: str = None, access_token: Optional[str] = None):
         """
@@ -51,9 +182,43 @@ class HTTPClient:
             access_token: Optional access token for authenticated requests
         """
         self.base_url = base_url or Settings.BASE_URL
-        self.access_token = access_token
+        # Normalized prefix so request URLs are built by plain concatenation
+        self._base = self.base_url.rstrip("/") + "/"
+        self.access_token = access_token  # also builds the cached auth headers
         self.session = self._create_session()
-        self.last_request_time = 0
+        # Settings read once instead of on every request
+        self._connect_timeout = Settings.CONNECT_TIMEOUT
+        self._read_timeout = Settings.REQUEST_TIMEOUT
+        self._rate_delay_ns = int(Settings.RATE_LIMIT_DELAY * 1e9)
+        self._rate_burst_ns = (Settings.RATE_LIMIT_BURST - 1) * self._rate_delay_ns
+        # Theoretical arrival time of the next request (see _apply_rate_limit)
+        self._next_due_ns = 0
+        self._rate_limit_lock = threading.Lock()
+        self._cache_lock = threading.Lock()
+
+        # Background resolver used to warm DNS while waiting on the rate limit
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self._prefetched_hosts: Set[str] = set()
+        self._prefetch_lock = threading.Lock()
+
+        # Conditional GET cache: key -> (ETag, Last-Modified, raw body). The
+        # body is parsed again on every 304, so each caller gets its own dicts.
+        self._etag_cache: "OrderedDict[Hashable, Tuple[Optional[str], Optional[str], bytes]]" = OrderedDict()
+        self._disk_cache = None
+        if Settings.ENABLE_CACHE and diskcache is not None:
+            self._disk_cache = diskcache.Cache(str(Settings.CACHE_DIR / "http"))
+
+    @property
+    def access_token(self) -> Optional[str]:
+        """Access token sent as a Bearer Authorization header."""
+        return self._access_token
+
+    @access_token.setter
+    def access_token(self, token: Optional[str]) -> None:
+        self._access_token = token
+        self._auth_headers = (
+            MappingProxyType({"Authorization": f"Bearer {token}"}) if token else _EMPTY_HEADERS
+        )
 
     def _create_session(self) -> requests.Session:
         """
@@ -64,32 +229,120 @@ class HTTPClient:
         """
         session = requests.Session()
 
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=Settings.MAX_RETRIES,
-            backoff_factor=Settings.RETRY_DELAY,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "DELETE"],
+        retry_strategy = _RETRY
+
+        # Keep a large keep-alive pool per host so sequential calls reuse
+        # sockets instead of paying a TCP + TLS handshake every time. Blocking
+        # on an exhausted pool makes extra callers wait for a free connection
+        # instead of opening throwaway sockets
+        adapter = KeepAliveAdapter(
+            max_retries=retry_strategy,
+            pool_connections=Settings.POOL_CONNECTIONS,
+            pool_maxsize=Settings.POOL_MAXSIZE,
+            pool_block=True,
         )
-
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
+        # Covers and chapter pages are fetched in parallel from the uploads CDN,
+        # so it gets its own, larger pool
+        cdn_adapter = KeepAliveAdapter(
+            max_retries=retry_strategy,
+            pool_connections=Settings.POOL_CONNECTIONS,
+            pool_maxsize=Settings.POOL_MAXSIZE * 2,
+            pool_block=True,
+        )
+        session.mount(Settings.UPLOADS_URL, cdn_adapter)
+
         # Set default headers
-        session.headers.update({
-            "User-Agent": Settings.USER_AGENT,
-            "Content-Type": "application/json",
-        })
+        session.headers.update(_DEFAULT_HEADERS)
 
         return session
 
-    def _apply_rate_limit(self) -> None:
-        """Apply rate limiting between requests."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < Settings.RATE_LIMIT_DELAY:
-            time.sleep(Settings.RATE_LIMIT_DELAY - elapsed)
-        self.last_request_time = time.time()
+    def _apply_rate_limit(self, url: Optional[str] = None) -> None:
+        """
+        Apply rate limiting between requests.
+
+        Args:
+            url: URL of the upcoming request; its host is resolved in the
+                background while we sleep
+        """
+        delay_ns = self._rate_delay_ns
+        if delay_ns <= 0:
+            return
+
+        # Token bucket of RATE_LIMIT_BURST tokens refilled every
+        # RATE_LIMIT_DELAY, tracked as the time the bucket is next full
+        # enough to send without waiting (GCRA). The next free send slot is
+        # reserved under the lock and the sleep happens outside it, so
+        # concurrent callers (see gather) are spaced out without blocking
+        # each other, and a burst of up to RATE_LIMIT_BURST goes out at once
+        burst_ns = self._rate_burst_ns
+        with self._rate_limit_lock:
+            # Monotonic clock, so NTP adjustments can never cause a burst
+            now_ns = time.monotonic_ns()
+            due_ns = max(now_ns, self._next_due_ns)
+            slot_ns = max(now_ns, due_ns - burst_ns)
+            self._next_due_ns = due_ns + delay_ns
+
+        wait_ns = slot_ns - now_ns
+        if wait_ns > 0:
+            if url:
+                self.prefetch(url)
+            time.sleep(wait_ns / 1e9)
+
+    def _pause_rate_limit(self, seconds: float) -> None:
+        """
+        Hold back every caller of this client for ``seconds``.
+
+        Used when the server answers 429 with a Retry-After header: the
+        bucket is drained so the next slot is handed out only once the
+        server-imposed pause is over.
+
+        Args:
+            seconds: Time to wait before the next request may be sent
+        """
+        burst_ns = self._rate_burst_ns
+        with self._rate_limit_lock:
+            resume_ns = time.monotonic_ns() + int(seconds * 1e9)
+            self._next_due_ns = max(self._next_due_ns, resume_ns + burst_ns)
+
+    def prefetch(self, url: str) -> None:
+        """
+        Resolve the host of a URL in the background.
+
+        The lookup runs on a worker thread, so it can overlap with the
+        rate-limit sleep; the OS resolver cache then serves the real request.
+        Each host is only resolved once per client.
+
+        Args:
+            url: URL whose host should be resolved
+        """
+        parsed = urlparse(url)
+        host = parsed.hostname
+        if not host or host in self._prefetched_hosts:
+            return
+
+        # Called outside the rate-limit lock, possibly from several threads
+        with self._prefetch_lock:
+            if host in self._prefetched_hosts:
+                return
+            self._prefetched_hosts.add(host)
+            if self._prefetch_executor is None:
+                self._prefetch_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="mangadx-prefetch"
+                )
+            executor = self._prefetch_executor
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        executor.submit(self._resolve_host, host, port)
+
+    @staticmethod
+    def _resolve_host(host: str, port: int) -> None:
+        """Resolve a host, ignoring failures (the real request will report them)."""
+        try:
+            socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except OSError as e:
+            logger.debug("DNS prefetch for %s failed: %s", host, e)
 
     def _get_headers(self, additional_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
         """
@@ -99,17 +352,75 @@ class HTTPClient:
             additional_headers: Additional headers to include
 
         Returns:
-            Complete headers dictionary
+            Complete headers mapping. Without additional headers this is the
+            shared read-only auth mapping, so callers must copy before mutating.
+        """
+        if not additional_headers:
+            return self._auth_headers
+
+        headers = dict(self._auth_headers)
+        headers.update(additional_headers)
+        return headers
+
+    def _cache_key(self, url: str, params: Optional[Dict[str, Any]]) -> Hashable:
         """
-        headers = {}
+        Build the conditional-GET cache key for a request.
 
-        if self.access_token:
-            headers["Authorization"] = f"Bearer {self.access_token}"
+        Args:
+            url: Absolute request URL
+            params: Query parameters
 
-        if additional_headers:
-            headers.update(additional_headers)
+        Returns:
+            Hashable key identifying the resource
+        """
+        return (url, _freeze(params or {}))
 
-        return headers
+    def _get_cached(self, key: Hashable) -> Optional[Tuple[Optional[str], Optional[str], bytes]]:
+        """
+        Look up a cached response, falling back to the disk cache.
+
+        Args:
+            key: Cache key from _cache_key
+
+        Returns:
+            Tuple of (etag, last_modified, raw body) or None
+        """
+        with self._cache_lock:
+            entry = self._etag_cache.get(key)
+            if entry is not None:
+                self._etag_cache.move_to_end(key)
+                return entry
+
+        if self._disk_cache is not None:
+            entry = self._disk_cache.get(key)
+            # Entries written by older versions hold a parsed body: ignore them
+            if entry is not None and isinstance(entry[2], bytes):
+                self._store_cached(key, entry, persist=False)
+                return entry
+        return None
+
+    def _store_cached(
+        self,
+        key: Hashable,
+        entry: Tuple[Optional[str], Optional[str], bytes],
+        persist: bool = True,
+    ) -> None:
+        """
+        Store a response in the LRU cache (and the disk cache if enabled).
+
+        Args:
+            key: Cache key from _cache_key
+            entry: Tuple of (etag, last_modified, raw body)
+            persist: Also write the entry to the disk cache
+        """
+        with self._cache_lock:
+            self._etag_cache[key] = entry
+            self._etag_cache.move_to_end(key)
+            if len(self._etag_cache) > ETAG_CACHE_MAXSIZE:
+                self._etag_cache.popitem(last=False)
+
+        if persist and self._disk_cache is not None:
+            self._disk_cache.set(key, entry, expire=Settings.CACHE_EXPIRY)
 
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         """
@@ -128,23 +439,24 @@ class HTTPClient:
         request_id = response.headers.get("X-Request-ID", "unknown")
         
         # Log response details for debugging
-        logger.debug(
-            f"Response: {response.status_code} {response.reason} "
-            f"(Request ID: {request_id}) - Content-Length: {len(response.content)}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Response: %d %s (Request ID: %s) - Content-Length: %d",
+                response.status_code, response.reason, request_id, len(response.content),
+            )
         
         # Parse response content
         try:
-            data = response.json() if response.content else {}
-        except ValueError as e:
-            logger.error(f"Failed to parse JSON response (Request ID: {request_id}): {e}")
+            data = _json_loads(response.content) if response.content else {}
+        except (_JSONDecodeError, UnicodeDecodeError) as e:
+            logger.error("Failed to parse JSON response (Request ID: %s): %s", request_id, e)
             data = {"content": response.text, "parse_error": str(e)}
 
         # Handle successful responses
         if 200 <= response.status_code < 300:
             # Validate response structure for successful responses
             validated_data = self._validate_response_structure(data, response.status_code)
-            logger.debug(f"Successful response validated (Request ID: {request_id})")
+            logger.debug("Successful response validated (Request ID: %s)", request_id)
             return validated_data
 
         # Extract detailed error information
@@ -153,38 +465,15 @@ class HTTPClient:
         
         # Log error details for debugging
         logger.error(
-            f"API Error (Request ID: {request_id}): {response.status_code} {response.reason}\n"
-            f"Message: {error_message}\n"
-            f"Details: {error_details.get('details', 'None')}"
+            "API Error (Request ID: %s): %d %s\nMessage: %s\nDetails: %s",
+            request_id, response.status_code, response.reason,
+            error_message, error_details.get("details", "None"),
         )
 
         # Raise appropriate exception based on status code
-        if response.status_code == 400:
-            raise ValidationException(
-                error_message, 
-                response.status_code, 
-                data,
-                request_id=request_id,
-                error_details=error_details
-            )
-        elif response.status_code == 401:
-            raise AuthenticationException(
-                error_message, 
-                response.status_code, 
-                data,
-                request_id=request_id,
-                error_details=error_details
-            )
-        elif response.status_code == 403:
-            raise AuthorizationException(
-                error_message, 
-                response.status_code, 
-                data,
-                request_id=request_id,
-                error_details=error_details
-            )
-        elif response.status_code == 404:
-            raise NotFoundException(
+        exc_cls = _STATUS_EXCEPTIONS.get(response.status_code)
+        if exc_cls is not None:
+            raise exc_cls(
                 error_message, 
                 response.status_code, 
                 data,
@@ -193,6 +482,8 @@ class HTTPClient:
             )
         elif response.status_code == 429:
             retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                self._pause_rate_limit(int(retry_after))
             raise RateLimitException(
                 error_message,
                 retry_after=int(retry_after) if retry_after else None,
@@ -243,7 +534,7 @@ class HTTPClient:
         if status_code == 200 and data:
             # Most MangaDx API responses have a 'result' field
             if 'result' not in data and 'data' not in data and 'response' not in data:
-                logger.warning(f"Response missing expected structure fields: {list(data.keys())}")
+                logger.warning("Response missing expected structure fields: %s", list(data.keys()))
         
         return data
     
@@ -329,40 +620,77 @@ class HTTPClient:
         # Validate request parameters
         self._validate_request_params(method, endpoint, params, data)
         
+        if endpoint.startswith(("http://", "https://")):
+            url = urljoin(self.base_url, endpoint)
+        else:
+            url = self._base + endpoint.lstrip("/")
+
         if not skip_rate_limit:
-            self._apply_rate_limit()
+            self._apply_rate_limit(url)
 
-        url = urljoin(self.base_url, endpoint)
         request_headers = self._get_headers(headers)
-        timeout = timeout or Settings.REQUEST_TIMEOUT
+        timeout = timeout or self._read_timeout
+
+        # Revalidate idempotent GETs with ETag / Last-Modified
+        cache_key = None
+        cached = None
+        if method.upper() == "GET" and Settings.ENABLE_CACHE:
+            cache_key = self._cache_key(url, params)
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                etag, last_modified, _ = cached
+                request_headers = dict(request_headers)
+                if etag:
+                    request_headers["If-None-Match"] = etag
+                if last_modified:
+                    request_headers["If-Modified-Since"] = last_modified
 
         # Log request details
-        logger.debug(
-            f"Making {method.upper()} request to {url}\n"
-            f"Params: {params}\n"
-            f"Data: {data}\n"
-            f"Headers: {self._sanitize_headers_for_logging(request_headers)}"
-        )
+        # Only pay for the sanitized header copy when debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Making %s request to %s\nParams: %s\nData: %s\nHeaders: %s",
+                method.upper(), url, params, data,
+                self._sanitize_headers_for_logging(request_headers),
+            )
+
+        # Stream the body so it is only read once, by the parser, and make
+        # sure the connection goes back to the pool afterwards
+        kwargs.setdefault("stream", True)
+        response = None
 
         try:
             response = self.session.request(
                 method=method,
                 url=url,
                 params=params,
-                json=data if isinstance(data, dict) else None,
-                data=data if isinstance(data, str) else None,
+                # Sent as-is: the session already declares application/json
+                data=_json_dumps(data) if isinstance(data, dict) else data,
                 headers=request_headers,
-                timeout=timeout,
+                timeout=(self._connect_timeout, timeout),
                 **kwargs,
             )
             
             # Log response summary
-            logger.debug(
-                f"Response received: {response.status_code} {response.reason} "
-                f"({len(response.content)} bytes)"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Response received: %d %s (%d bytes)",
+                    response.status_code, response.reason, len(response.content),
+                )
 
-            return self._handle_response(response)
+            if response.status_code == 304 and cached is not None:
+                logger.debug("Not modified, serving cached response for %s", url)
+                return _json_loads(cached[2])
+
+            result = self._handle_response(response)
+
+            if cache_key is not None and response.status_code == 200:
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if etag or last_modified:
+                    self._store_cached(cache_key, (etag, last_modified, response.content))
+
+            return result
 
         except requests.Timeout as e:
             error_msg = f"Request timed out after {timeout}s for {method.upper()} {url}: {str(e)}"
@@ -376,7 +704,68 @@ class HTTPClient:
             error_msg = f"Request failed for {method.upper()} {url}: {str(e)}"
             logger.error(error_msg)
             raise APIException(error_msg) from e
-    
+        finally:
+            if response is not None:
+                response.close()
+
+    def stream_items(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        key: str = "data",
+        timeout: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the entries of a collection response one at a time.
+
+        With ijson installed the body is parsed incrementally straight from
+        the socket, so multi-megabyte feeds never sit in memory as a whole.
+        Without it this falls back to a regular GET.
+
+        Args:
+            endpoint: API endpoint (relative to base URL)
+            params: Query parameters for the request
+            key: Top-level key holding the array of entries
+            timeout: Request timeout in seconds (uses default if not provided)
+
+        Yields:
+            Raw entry dictionaries, e.g. for ``Chapter.from_dict``
+
+        Raises:
+            TimeoutException: Request timed out
+            NetworkException: Network-related error
+            APIException: API-related error
+        """
+        if ijson is None:
+            yield from self.get(endpoint, params=params, timeout=timeout).get(key, [])
+            return
+
+        self._validate_request_params("GET", endpoint, params, None)
+        url = self._base + endpoint.lstrip("/")
+        self._apply_rate_limit(url)
+
+        try:
+            response = self.session.get(
+                url,
+                params=params,
+                headers=self._get_headers(),
+                timeout=(self._connect_timeout, timeout or self._read_timeout),
+                stream=True,
+            )
+        except requests.Timeout as e:
+            raise TimeoutException(f"Request timed out for GET {url}: {e}") from e
+        except requests.ConnectionError as e:
+            raise NetworkException(f"Network error for GET {url}: {e}") from e
+        except requests.RequestException as e:
+            raise APIException(f"Request failed for GET {url}: {e}") from e
+
+        with response:
+            if not 200 <= response.status_code < 300:
+                # Error bodies are small; reuse the regular error mapping
+                self._handle_response(response)
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, f"{key}.item", use_float=True)
+
     def _validate_request_params(
         self, 
         method: str, 
@@ -427,14 +816,10 @@ class HTTPClient:
         Returns:
             Sanitized headers for logging
         """
-        sanitized = headers.copy()
-        sensitive_keys = {"authorization", "x-api-key", "cookie", "set-cookie"}
-        
-        for key in sanitized:
-            if key.lower() in sensitive_keys:
-                sanitized[key] = "***MASKED***"
-        
-        return sanitized
+        return {
+            key: "***MASKED***" if key.lower() in _SENSITIVE_HEADERS else value
+            for key, value in headers.items()
+        }
 
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
         """Make GET request."""
@@ -452,9 +837,114 @@ class HTTPClient:
         """Make DELETE request."""
         return self.request("DELETE", endpoint, **kwargs)
 
+    def stream_get(
+        self,
+        url: str,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        timeout: Optional[int] = None,
+    ) -> Iterator[bytes]:
+        """
+        Stream a binary resource (e.g. a chapter page) over the pooled session.
+
+        The body is never buffered as a whole, so memory stays flat however
+        large the file is. Not rate limited: image hosts are not subject to
+        the API limits.
+
+        Args:
+            url: Absolute URL of the resource
+            chunk_size: Bytes per yielded chunk
+            timeout: Request timeout in seconds (uses default if not provided)
+
+        Yields:
+            Raw body chunks
+
+        Raises:
+            TimeoutException: Request timed out
+            NetworkException: Network-related error
+            APIException: API-related error (or a more specific subclass for
+                error statuses)
+        """
+        try:
+            response = self.session.get(
+                url, timeout=(self._connect_timeout, timeout or self._read_timeout), stream=True
+            )
+        except requests.Timeout as e:
+            raise TimeoutException(f"Request timed out for GET {url}: {e}") from e
+        except requests.ConnectionError as e:
+            raise NetworkException(f"Network error for GET {url}: {e}") from e
+        except requests.RequestException as e:
+            raise APIException(f"Request failed for GET {url}: {e}") from e
+
+        with response:
+            if not 200 <= response.status_code < 300:
+                self._handle_response(response)
+            yield from response.iter_content(chunk_size=chunk_size)
+
+    def gather(
+        self,
+        requests_: Iterable[Dict[str, Any]],
+        max_workers: int = GATHER_MAX_WORKERS,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Run several requests concurrently.
+
+        Each item is a dict of keyword arguments for ``request()``. At most
+        ``max_workers`` requests are in flight at once, and all of them still
+        go through the shared rate limiter, so both concurrency and request
+        rate stay capped.
+
+        Args:
+            requests_: Request specs, e.g. ``{"method": "GET", "endpoint": "/manga/x"}``
+            max_workers: Maximum number of concurrent requests
+            return_exceptions: Return raised exceptions in place of results
+                instead of propagating the first one
+
+        Returns:
+            Responses in the same order as the request specs
+
+        Example:
+            >>> client.gather([
+            ...     {"method": "GET", "endpoint": f"/chapter/{cid}"} for cid in ids
+            ... ])
+        """
+        specs = list(requests_)
+        if not specs:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(specs)), thread_name_prefix="mangadx-gather"
+        ) as executor:
+            futures = [executor.submit(self.request, **spec) for spec in specs]
+
+            results: List[Any] = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    if not return_exceptions:
+                        for pending in futures:
+                            pending.cancel()
+                        raise
+                    results.append(e)
+            return results
+
+    def clear_cache(self) -> None:
+        """Drop all cached conditional-GET responses."""
+        with self._cache_lock:
+            self._etag_cache.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.clear()
+
     def close(self) -> None:
         """Close the HTTP session."""
         self.session.close()
+        with self._prefetch_lock:
+            executor, self._prefetch_executor = self._prefetch_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        if self._disk_cache is not None:
+            self._disk_cache.close()
 
     def __enter__(self):
         """Context manager entry."""
@@ -462,4 +952,60 @@ class HTTPClient:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        self.close()
\ No newline at end of file
+        self.close()
+
+
+
+# Clients shared per (base URL, access token): key -> [client, holders].
+# Entries are removed (and their sessions closed) when the last holder
+# releases them, so nothing is evicted while still in use.
+_client_registry: Dict[Tuple[str, Optional[str]], List[Any]] = {}
+_client_registry_lock = threading.Lock()
+
+
+def get_client(base_url: Optional[str] = None, access_token: Optional[str] = None) -> HTTPClient:
+    """
+    Acquire the process-wide HTTPClient for a (base URL, token) pair.
+
+    Reusing one client keeps its session and connection pools alive across
+    callers instead of paying new TCP/TLS handshakes for every instance.
+    Every call must be paired with release_client(); the client is closed
+    once its last holder releases it. Returned clients are shared, so do not
+    close them directly or change their ``access_token``.
+
+    Args:
+        base_url: Base URL for API requests (defaults to Settings.BASE_URL)
+        access_token: Optional access token for authenticated requests
+
+    Returns:
+        Shared HTTPClient instance
+    """
+    key = (base_url or Settings.BASE_URL, access_token)
+    with _client_registry_lock:
+        entry = _client_registry.get(key)
+        if entry is None:
+            entry = _client_registry[key] = [HTTPClient(*key), 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def release_client(client: HTTPClient) -> None:
+    """
+    Release a client obtained from get_client().
+
+    The last holder to release a client closes it.
+
+    Args:
+        client: Client returned by get_client()
+    """
+    with _client_registry_lock:
+        for key, entry in _client_registry.items():
+            if entry[0] is client:
+                entry[1] -= 1
+                if entry[1] > 0:
+                    return
+                del _client_registry[key]
+                break
+        else:
+            return
+    client.close()
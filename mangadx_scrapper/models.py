@@ -4,12 +4,23 @@ Data models for MangaDx API responses.
 This module defines data classes for API responses.
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
+try:
+    import ciso8601
+except ImportError:  # pragma: no cover - optional dependency
+    ciso8601 = None
 
-@dataclass
+# Slotted dataclasses drop the per-instance __dict__, which adds up when a
+# listing produces thousands of models. ``slots=`` needs Python 3.10+.
+_DATACLASS_KWARGS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_KWARGS)
 class Relationship:
     """Represents a relationship to another entity."""
     id: str
@@ -17,39 +28,83 @@ class Relationship:
     attributes: Optional[Dict[str, Any]] = None
 
 
-@dataclass
-class LocalizedString:
-    """Represents a localized string dictionary."""
-    values: Dict[str, str] = field(default_factory=dict)
+class LocalizedString(dict):
+    """
+    Represents a localized string dictionary.
+
+    A plain ``dict`` subclass mapping language codes to text, so parsing does
+    not allocate a wrapper object per field. Missing languages read as "".
+    """
+
+    __slots__ = ()
+
+    def __init__(self, values: Optional[Dict[str, str]] = None, **kwargs: str):
+        super().__init__(values or {}, **kwargs)
 
     def get(self, language: str, default: str = "") -> str:
         """Get localized string for language."""
-        return self.values.get(language, default)
+        return dict.get(self, language, default)
+
+    def __missing__(self, language: str) -> str:
+        """Return an empty string for untranslated languages."""
+        return ""
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an ISO 8601 timestamp from the API.
+
+    Args:
+        value: Raw timestamp string
+
+    Returns:
+        Parsed datetime, or None if the value is empty or malformed
+    """
+    if not value:
+        return None
+    try:
+        if ciso8601 is not None:
+            return ciso8601.parse_datetime(value)
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _localized(values: Optional[Dict[str, str]]) -> LocalizedString:
+    """Wrap a localized dict; each model gets its own (mutable) instance."""
+    return LocalizedString(values)
+
 
-    def __getitem__(self, language: str) -> str:
-        """Get localized string using bracket notation."""
-        return self.values.get(language, "")
+def _parse_relationships(items: List[Dict[str, Any]]) -> List[Relationship]:
+    """Build Relationship objects from a raw relationships array."""
+    # Positional arguments avoid building a kwargs dict per relationship
+    _Rel = Relationship
+    return [_Rel(rel["id"], rel["type"], rel.get("attributes")) for rel in items]
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class Tag:
     """Represents a manga tag."""
     id: str
     name: LocalizedString
-    description: LocalizedString = field(default_factory=lambda: LocalizedString())
+    description: LocalizedString = field(default_factory=LocalizedString)
     group: Optional[str] = None
     version: int = 1
 
+    @classmethod
+    def from_dict_list(cls, items: List[Dict[str, Any]]) -> List["Tag"]:
+        """Create a list of Tag objects from an API ``data`` array."""
+        from_dict = cls.from_dict
+        return [from_dict(item) for item in items]
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Tag":
         """Create Tag from API response dictionary."""
         attributes = data.get("attributes", {})
         
-        name_dict = attributes.get("name", {})
-        name = LocalizedString(values=name_dict)
-        
-        description_dict = attributes.get("description", {})
-        description = LocalizedString(values=description_dict)
+        name = _localized(attributes.get("name"))
+        description = _localized(attributes.get("description"))
         
         return cls(
             id=data["id"],
@@ -60,13 +115,13 @@ class Tag:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class Manga:
     """Represents a manga."""
     id: str
     title: LocalizedString
     alt_titles: List[LocalizedString] = field(default_factory=list)
-    description: LocalizedString = field(default_factory=lambda: LocalizedString())
+    description: LocalizedString = field(default_factory=LocalizedString)
     is_locked: bool = False
     original_language: Optional[str] = None
     last_volume: Optional[str] = None
@@ -83,32 +138,28 @@ class Manga:
     available_translated_languages: List[str] = field(default_factory=list)
     relationships: List[Relationship] = field(default_factory=list)
 
+    @classmethod
+    def from_dict_list(cls, items: List[Dict[str, Any]]) -> List["Manga"]:
+        """Create a list of Manga objects from an API ``data`` array."""
+        from_dict = cls.from_dict
+        return [from_dict(item) for item in items]
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Manga":
         """Create Manga from API response dictionary."""
         attributes = data.get("attributes", {})
 
         # Parse title
-        title_dict = attributes.get("title", {})
-        title = LocalizedString(values=title_dict)
+        title = _localized(attributes.get("title"))
 
         # Parse alt titles
-        alt_titles = []
-        for alt_title in attributes.get("altTitles", []):
-            alt_titles.append(LocalizedString(values=alt_title))
+        alt_titles = [_localized(alt_title) for alt_title in attributes.get("altTitles", [])]
 
         # Parse description
-        description_dict = attributes.get("description", {})
-        description = LocalizedString(values=description_dict)
+        description = _localized(attributes.get("description"))
 
         # Parse relationships
-        relationships = []
-        for rel in data.get("relationships", []):
-            relationships.append(Relationship(
-                id=rel["id"],
-                type=rel["type"],
-                attributes=rel.get("attributes"),
-            ))
+        relationships = _parse_relationships(data.get("relationships", ()))
 
         return cls(
             id=data["id"],
@@ -125,15 +176,15 @@ class Manga:
             content_rating=attributes.get("contentRating"),
             tags=attributes.get("tags", []),
             state=attributes.get("state"),
-            created_at=attributes.get("createdAt"),
-            updated_at=attributes.get("updatedAt"),
+            created_at=_parse_datetime(attributes.get("createdAt")),
+            updated_at=_parse_datetime(attributes.get("updatedAt")),
             version=attributes.get("version", 1),
             available_translated_languages=attributes.get("availableTranslatedLanguages", []),
             relationships=relationships,
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class Chapter:
     """Represents a manga chapter."""
     id: str
@@ -151,19 +202,19 @@ class Chapter:
     readable_at: Optional[datetime] = None
     relationships: List[Relationship] = field(default_factory=list)
 
+    @classmethod
+    def from_dict_list(cls, items: List[Dict[str, Any]]) -> List["Chapter"]:
+        """Create a list of Chapter objects from an API ``data`` array."""
+        from_dict = cls.from_dict
+        return [from_dict(item) for item in items]
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Chapter":
         """Create Chapter from API response dictionary."""
         attributes = data.get("attributes", {})
 
         # Parse relationships
-        relationships = []
-        for rel in data.get("relationships", []):
-            relationships.append(Relationship(
-                id=rel["id"],
-                type=rel["type"],
-                attributes=rel.get("attributes"),
-            ))
+        relationships = _parse_relationships(data.get("relationships", ()))
 
         return cls(
             id=data["id"],
@@ -175,21 +226,21 @@ class Chapter:
             uploader=attributes.get("uploader"),
             external_url=attributes.get("externalUrl"),
             version=attributes.get("version", 1),
-            created_at=attributes.get("createdAt"),
-            updated_at=attributes.get("updatedAt"),
-            publish_at=attributes.get("publishAt"),
-            readable_at=attributes.get("readableAt"),
+            created_at=_parse_datetime(attributes.get("createdAt")),
+            updated_at=_parse_datetime(attributes.get("updatedAt")),
+            publish_at=_parse_datetime(attributes.get("publishAt")),
+            readable_at=_parse_datetime(attributes.get("readableAt")),
             relationships=relationships,
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class Author:
     """Represents an author or artist."""
     id: str
     name: str
     image_url: Optional[str] = None
-    biography: LocalizedString = field(default_factory=lambda: LocalizedString())
+    biography: LocalizedString = field(default_factory=LocalizedString)
     twitter: Optional[str] = None
     pixiv: Optional[str] = None
     melon_book: Optional[str] = None
@@ -207,13 +258,18 @@ class Author:
     updated_at: Optional[datetime] = None
     version: int = 1
 
+    @classmethod
+    def from_dict_list(cls, items: List[Dict[str, Any]]) -> List["Author"]:
+        """Create a list of Author objects from an API ``data`` array."""
+        from_dict = cls.from_dict
+        return [from_dict(item) for item in items]
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Author":
         """Create Author from API response dictionary."""
         attributes = data.get("attributes", {})
 
-        biography_dict = attributes.get("biography", {})
-        biography = LocalizedString(values=biography_dict)
+        biography = _localized(attributes.get("biography"))
 
         return cls(
             id=data["id"],
@@ -233,13 +289,13 @@ class Author:
             weibo=attributes.get("weibo"),
             naver=attributes.get("naver"),
             website=attributes.get("website"),
-            created_at=attributes.get("createdAt"),
-            updated_at=attributes.get("updatedAt"),
+            created_at=_parse_datetime(attributes.get("createdAt")),
+            updated_at=_parse_datetime(attributes.get("updatedAt")),
             version=attributes.get("version", 1),
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class Cover:
     """Represents a manga cover art."""
     id: str
@@ -252,19 +308,19 @@ class Cover:
     updated_at: Optional[datetime] = None
     relationships: List[Relationship] = field(default_factory=list)
 
+    @classmethod
+    def from_dict_list(cls, items: List[Dict[str, Any]]) -> List["Cover"]:
+        """Create a list of Cover objects from an API ``data`` array."""
+        from_dict = cls.from_dict
+        return [from_dict(item) for item in items]
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Cover":
         """Create Cover from API response dictionary."""
         attributes = data.get("attributes", {})
 
         # Parse relationships
-        relationships = []
-        for rel in data.get("relationships", []):
-            relationships.append(Relationship(
-                id=rel["id"],
-                type=rel["type"],
-                attributes=rel.get("attributes"),
-            ))
+        relationships = _parse_relationships(data.get("relationships", ()))
 
         return cls(
             id=data["id"],
@@ -273,13 +329,13 @@ class Cover:
             description=attributes.get("description"),
             locale=attributes.get("locale"),
             version=attributes.get("version", 1),
-            created_at=attributes.get("createdAt"),
-            updated_at=attributes.get("updatedAt"),
+            created_at=_parse_datetime(attributes.get("createdAt")),
+            updated_at=_parse_datetime(attributes.get("updatedAt")),
             relationships=relationships,
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class ScanlationGroup:
     """Represents a scanlation group."""
     id: str
@@ -303,15 +359,19 @@ class ScanlationGroup:
     updated_at: Optional[datetime] = None
     version: int = 1
 
+    @classmethod
+    def from_dict_list(cls, items: List[Dict[str, Any]]) -> List["ScanlationGroup"]:
+        """Create a list of ScanlationGroup objects from an API ``data`` array."""
+        from_dict = cls.from_dict
+        return [from_dict(item) for item in items]
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ScanlationGroup":
         """Create ScanlationGroup from API response dictionary."""
         attributes = data.get("attributes", {})
 
         # Parse alt names
-        alt_names = []
-        for alt_name in attributes.get("altNames", []):
-            alt_names.append(LocalizedString(values=alt_name))
+        alt_names = [_localized(alt_name) for alt_name in attributes.get("altNames", [])]
 
         return cls(
             id=data["id"],
@@ -331,7 +391,7 @@ class ScanlationGroup:
             verified=attributes.get("verified", False),
             inactive=attributes.get("inactive", False),
             publish_delay=attributes.get("publishDelay"),
-            created_at=attributes.get("createdAt"),
-            updated_at=attributes.get("updatedAt"),
+            created_at=_parse_datetime(attributes.get("createdAt")),
+            updated_at=_parse_datetime(attributes.get("updatedAt")),
             version=attributes.get("version", 1),
         )
\ No newline at end of file
@@ -4,9 +4,40 @@ Formatting utilities for displaying data.
 This module provides functions to format manga and chapter information.
 """
 
-from typing import List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from ..models import Chapter, Manga
+from ..models import Chapter, LocalizedString, Manga
+
+# Title languages tried in order before falling back to any available one
+_TITLE_LANGUAGES = ("en", "ja", "ja-ro")
+
+
+def _tag_name_en(tag: Dict[str, Any]) -> Optional[str]:
+    """Get the English name of a raw tag dict without allocating defaults."""
+    attributes = tag.get("attributes")
+    if not attributes:
+        return None
+    name = attributes.get("name")
+    return name.get("en") if name else None
+
+
+def _pick_title(title_map: LocalizedString) -> Tuple[str, Optional[str]]:
+    """
+    Pick the display title for a manga in a single pass.
+
+    Args:
+        title_map: Localized title mapping
+
+    Returns:
+        Tuple of (title, language code), with ("Unknown", None) if empty
+    """
+    for lang in _TITLE_LANGUAGES:
+        title = title_map.get(lang)
+        if title:
+            return title, lang
+    for lang, title in title_map.items():
+        return (title, lang) if title else ("Unknown", None)
+    return "Unknown", None
 
 
 def format_manga_info(manga: Manga, verbose: bool = False) -> str:
@@ -20,110 +51,107 @@ def format_manga_info(manga: Manga, verbose: bool = False) -> str:
     Returns:
         Formatted string representation of the manga
     """
+    return "\n".join(_iter_manga_info_lines(manga, verbose))
+
+
+def _iter_manga_info_lines(manga: Manga, verbose: bool) -> Iterator[str]:
+    """
+    Yield the lines of format_manga_info.
+
+    Args:
+        manga: Manga object to format
+        verbose: Include detailed information if True
+
+    Yields:
+        Formatted output lines
+    """
     # Get primary title (English or first available)
-    title_en = manga.title.get("en")
+    yield f"Title (EN): {manga.title.get('en') or 'N/A'}"
 
-    lines = [
-        f"Title (EN): {title_en or 'N/A'}",
+    # Show alternative titles (first 3)
+    alt_titles_str = [
+        f"{title} ({lang})" for alt_title in manga.alt_titles[:3] for lang, title in alt_title.items()
     ]
-
-    # Show alternative titles
-    if manga.alt_titles:
-        alt_titles_str = []
-        for alt_title in manga.alt_titles[:3]:  # Show first 3 alt titles
-            for lang, title in alt_title.values.items():
-                alt_titles_str.append(f"{title} ({lang})")
-        if alt_titles_str:
-            lines.append(f"Alt Titles: {', '.join(alt_titles_str)}")
+    if alt_titles_str:
+        yield f"Alt Titles: {', '.join(alt_titles_str)}"
 
     # Show all title languages
-    if manga.title.values:
-        all_titles = []
-        for lang, title in manga.title.values.items():
-            all_titles.append(f"{lang}: {title}")
-        lines.append(f"All Titles: {' | '.join(all_titles)}")
-
-    lines.extend([
-        f"ID: {manga.id}",
-        f"Status: {manga.status or 'Unknown'}",
-        f"Content Rating: {manga.content_rating or 'Unknown'}",
-    ])
+    if manga.title:
+        yield f"All Titles: {' | '.join(f'{lang}: {title}' for lang, title in manga.title.items())}"
+
+    yield f"ID: {manga.id}"
+    yield f"Status: {manga.status or 'Unknown'}"
+    yield f"Content Rating: {manga.content_rating or 'Unknown'}"
 
     if manga.year:
-        lines.append(f"Year: {manga.year}")
+        yield f"Year: {manga.year}"
 
     if manga.publication_demographic:
-        lines.append(f"Demographic: {manga.publication_demographic}")
+        yield f"Demographic: {manga.publication_demographic}"
 
     if manga.original_language:
-        lines.append(f"Original Language: {manga.original_language}")
+        yield f"Original Language: {manga.original_language}"
 
     if manga.last_volume:
-        lines.append(f"Last Volume: {manga.last_volume}")
+        yield f"Last Volume: {manga.last_volume}"
 
     if manga.last_chapter:
-        lines.append(f"Last Chapter: {manga.last_chapter}")
+        yield f"Last Chapter: {manga.last_chapter}"
 
-    if manga.available_translated_languages:
-        langs = ', '.join(manga.available_translated_languages)
-        lines.append(f"Available Languages ({len(manga.available_translated_languages)}): {langs}")
+    languages = manga.available_translated_languages
+    if languages:
+        yield f"Available Languages ({len(languages)}): {', '.join(languages)}"
 
-    # Get authors and artists from relationships
+    # Get authors, artists and cover art from relationships in one pass
     authors = []
     artists = []
     cover_art = None
 
     for rel in manga.relationships:
-        if rel.type == "author":
-            author_name = rel.attributes.get("name") if rel.attributes else None
-            if author_name:
-                authors.append(author_name)
-        elif rel.type == "artist":
-            artist_name = rel.attributes.get("name") if rel.attributes else None
-            if artist_name:
-                artists.append(artist_name)
-        elif rel.type == "cover_art":
+        rel_type = rel.type
+        attributes = rel.attributes
+        if rel_type == "cover_art":
             cover_art = rel
+        elif attributes and rel_type in ("author", "artist"):
+            name = attributes.get("name")
+            if name:
+                (authors if rel_type == "author" else artists).append(name)
 
     if authors:
-        lines.append(f"Author(s): {', '.join(authors)}")
+        yield f"Author(s): {', '.join(authors)}"
 
     if artists:
-        lines.append(f"Artist(s): {', '.join(artists)}")
-
-    if verbose:
-        # Full description
-        if manga.description.values:
-            desc_en = manga.description.get("en")
-            if desc_en:
-                lines.append(f"\nDescription (EN):\n{desc_en}")
-            else:
-                # Show first available description
-                for lang, desc in manga.description.values.items():
-                    lines.append(f"\nDescription ({lang}):\n{desc}")
-                    break
-
-        # Tags with categories
-        if manga.tags:
-            tag_names = [tag.get("attributes", {}).get("name", {}).get("en", "") for tag in manga.tags]
-            tag_names = [t for t in tag_names if t]
-            if tag_names:
-                lines.append(f"\nTags ({len(tag_names)}): {', '.join(tag_names)}")
-
-        # Cover art info
-        if cover_art and cover_art.attributes:
-            cover_file = cover_art.attributes.get("fileName")
-            if cover_file:
-                lines.append(f"\nCover Art: {cover_file}")
-                lines.append(f"Cover URL: https://uploads.mangadex.org/covers/{manga.id}/{cover_file}")
-
-        # Additional metadata
-        if manga.created_at:
-            lines.append(f"\nCreated At: {manga.created_at}")
-        if manga.updated_at:
-            lines.append(f"Updated At: {manga.updated_at}")
-
-    return "\n".join(lines)
+        yield f"Artist(s): {', '.join(artists)}"
+
+    if not verbose:
+        return
+
+    # Full description (English, else first available)
+    if manga.description:
+        desc_en = manga.description.get("en")
+        if desc_en:
+            yield f"\nDescription (EN):\n{desc_en}"
+        else:
+            lang, desc = next(iter(manga.description.items()))
+            yield f"\nDescription ({lang}):\n{desc}"
+
+    # Tags with categories
+    tag_names = [name for name in map(_tag_name_en, manga.tags) if name]
+    if tag_names:
+        yield f"\nTags ({len(tag_names)}): {', '.join(tag_names)}"
+
+    # Cover art info
+    if cover_art and cover_art.attributes:
+        cover_file = cover_art.attributes.get("fileName")
+        if cover_file:
+            yield f"\nCover Art: {cover_file}"
+            yield f"Cover URL: https://uploads.mangadex.org/covers/{manga.id}/{cover_file}"
+
+    # Additional metadata
+    if manga.created_at:
+        yield f"\nCreated At: {manga.created_at}"
+    if manga.updated_at:
+        yield f"Updated At: {manga.updated_at}"
 
 
 def format_chapter_info(chapter: Chapter) -> str:
@@ -136,26 +164,15 @@ def format_chapter_info(chapter: Chapter) -> str:
     Returns:
         Formatted string representation of the chapter
     """
-    parts = []
-
-    if chapter.volume:
-        parts.append(f"Vol.{chapter.volume}")
-
-    if chapter.chapter:
-        parts.append(f"Ch.{chapter.chapter}")
-
-    if chapter.title:
-        parts.append(f"- {chapter.title}")
+    head = " ".join(part for part in (
+        f"Vol.{chapter.volume}" if chapter.volume else None,
+        f"Ch.{chapter.chapter}" if chapter.chapter else None,
+        f"- {chapter.title}" if chapter.title else None,
+    ) if part) or f"Chapter {chapter.id}"
+    lang = f" [{chapter.translated_language}]" if chapter.translated_language else ""
+    pages = f" ({chapter.pages} pages)" if chapter.pages else ""
 
-    chapter_str = " ".join(parts) if parts else f"Chapter {chapter.id}"
-
-    if chapter.translated_language:
-        chapter_str += f" [{chapter.translated_language}]"
-
-    if chapter.pages:
-        chapter_str += f" ({chapter.pages} pages)"
-
-    return chapter_str
+    return f"{head}{lang}{pages}"
 
 
 def format_manga_list(manga_list: List[Manga]) -> str:
@@ -171,55 +188,35 @@ def format_manga_list(manga_list: List[Manga]) -> str:
     if not manga_list:
         return "No manga found."
 
-    lines = []
-    for idx, manga in enumerate(manga_list, 1):
-        # Get English title first, then try Japanese, then any available title
-        title = manga.title.get("en")
-        if not title:
-            title = manga.title.get("ja")
-        if not title:
-            title = manga.title.get("ja-ro")  # Romanized Japanese
-        if not title and manga.title.values:
-            # Get first available title from any language
-            title = list(manga.title.values.values())[0]
-        if not title:
-            title = "Unknown"
-
+    # One line per manga, filled in place instead of grown with append
+    lines = [""] * len(manga_list)
+    for idx, manga in enumerate(manga_list):
+        title_map = manga.title
+        title, title_lang = _pick_title(title_map)
         status = manga.status or "Unknown"
         year = manga.year or "N/A"
 
         # Check for English alternative title if main title is not English
         alt_en_title = None
-        if not manga.title.get("en") and manga.alt_titles:
-            for alt_title in manga.alt_titles:
-                if "en" in alt_title.values:
-                    alt_en_title = alt_title.values["en"]
-                    break
-
-        # Show title with language indicator if not English
-        title_lang = None
-        if not manga.title.get("en"):
-            # Determine the language of the displayed title
-            for lang, lang_title in manga.title.values.items():
-                if lang_title == title:
-                    title_lang = lang
-                    break
+        if title_lang != "en" and manga.alt_titles:
+            alt_en_title = next((alt["en"] for alt in manga.alt_titles if "en" in alt), None)
 
         # Format the line
-        line = f"{idx:2d}. {title}"
+        parts = [f"{idx + 1:2d}. {title}"]
 
+        # Show title with language indicator if not English
         if title_lang and title_lang != "en":
-            line += f" [{title_lang}]"
+            parts.append(f" [{title_lang}]")
 
         if alt_en_title:
-            line += f" (EN: {alt_en_title})"
+            parts.append(f" (EN: {alt_en_title})")
 
-        line += f" | {status} | {year}"
+        parts.append(f" | {status} | {year}")
 
         # Add content rating if available
         if manga.content_rating:
-            line += f" | {manga.content_rating}"
+            parts.append(f" | {manga.content_rating}")
 
-        lines.append(line)
+        lines[idx] = "".join(parts)
 
-    return "\n".join(lines)
\ No newline at end of file
+    return "\n".join(lines)
@@ -6,9 +6,13 @@ This script helps fix:
 2. "Vol.none" folders -> move chapters to manga root
 """
 
+import functools
+import os
 import shutil
 import sys
+import uuid
 from pathlib import Path
+from typing import Dict, List, Tuple
 
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -16,132 +20,190 @@ from config import Settings
 from src.mangadx import MangaDxClient
 
 
-def get_manga_title(client: MangaDxClient, manga_id: str) -> str:
-    """Get proper manga title from API."""
+def _write(*lines: str) -> None:
+    """Write one or more lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _prompt(message: str) -> str:
+    """Flush pending output and read a line of input."""
+    sys.stdout.flush()
+    return input(message)
+
+
+# Title languages in order of preference
+_TITLE_LANGUAGES = ("en", "ja", "ja-ro")
+
+
+def _best_title(manga) -> str:
+    """Get best available title for a manga."""
+    titles = manga.title.values
+    for lang in _TITLE_LANGUAGES:
+        title = titles.get(lang)
+        if title:
+            return title
+    return next(iter(titles.values()), None)
+
+
+def get_manga_titles(client: MangaDxClient, manga_ids: List[str]) -> Dict[str, str]:
+    """Get proper manga titles from API, batching up to 100 IDs per request."""
     try:
-        manga = client.manga.get(manga_id)
-
-        # Get best available title
-        title = manga.title.get("en")
-        if not title:
-            title = manga.title.get("ja")
-        if not title:
-            title = manga.title.get("ja-ro")
-        if not title and manga.title.values:
-            title = list(manga.title.values.values())[0]
-
-        return title
+        return {manga.id: _best_title(manga) for manga in client.manga.get_many(manga_ids)}
     except Exception as e:
-        print(f"Error getting title for {manga_id}: {e}")
-        return None
+        _write(f"Error getting titles for {len(manga_ids)} manga: {e}, retrying one by one")
 
+    # A single rejected ID fails the whole batch, so fall back to per-ID lookups
+    titles = {}
+    for manga_id in manga_ids:
+        try:
+            titles[manga_id] = _best_title(client.manga.get(manga_id))
+        except Exception as e:
+            _write(f"Error getting title for {manga_id}: {e}")
+    return titles
 
+
+def _is_valid_manga_id(manga_id: str) -> bool:
+    """Check that a manga ID is a well-formed UUID."""
+    try:
+        uuid.UUID(manga_id)
+    except ValueError:
+        return False
+    return True
+
+
+# Common language codes that might be folder names
+_LANG_CODES = frozenset({"ja", "en", "es", "fr", "de", "it", "pt", "pt-br", "zh", "ko", "ru"})
+
+# Characters not allowed in folder names, mapped to "_" in one translate pass
+_INVALID_CHARS_TABLE = str.maketrans({char: "_" for char in '<>:"/\\|?*'})
+
+
+@functools.lru_cache(maxsize=1024)
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename for filesystem."""
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, "_")
-    return filename.strip()
+    return filename.translate(_INVALID_CHARS_TABLE).strip()
+
+
+def _subdirs(directory: Path) -> List[Path]:
+    """
+    List the subdirectories of a directory.
+
+    os.scandir answers is_dir() from the directory listing itself, so this
+    avoids the extra stat() per entry that Path.iterdir() + is_dir() costs.
+    The result is a list because callers move and rename entries.
+    """
+    with os.scandir(directory) as entries:
+        return [Path(entry.path) for entry in entries if entry.is_dir()]
 
 
 def reorganize_vol_none(download_dir: Path):
     """Move chapters from Vol.none folders to manga root."""
-    print("\n=== Reorganizing Vol.none folders ===\n")
-
-    for manga_dir in download_dir.iterdir():
-        if not manga_dir.is_dir():
-            continue
+    _write("\n=== Reorganizing Vol.none folders ===\n")
 
+    for manga_dir in _subdirs(download_dir):
         vol_none_dir = manga_dir / "Vol.none"
         if vol_none_dir.exists():
-            print(f"Found Vol.none in: {manga_dir.name}")
+            _write(f"Found Vol.none in: {manga_dir.name}")
 
-            # Move all chapters from Vol.none to manga root
-            for chapter_dir in vol_none_dir.iterdir():
-                if chapter_dir.is_dir():
-                    target = manga_dir / chapter_dir.name
+            # Names already in the manga root, listed once instead of a
+            # stat() per chapter
+            with os.scandir(manga_dir) as entries:
+                existing = {entry.name for entry in entries if entry.name != "Vol.none"}
 
-                    if target.exists():
-                        print(f"  ⚠ {chapter_dir.name} already exists, skipping")
-                    else:
-                        shutil.move(str(chapter_dir), str(target))
-                        print(f"  ✓ Moved {chapter_dir.name}")
+            # Move all chapters from Vol.none to manga root
+            for chapter_dir in _subdirs(vol_none_dir):
+                if chapter_dir.name in existing:
+                    _write(f"  ⚠ {chapter_dir.name} already exists, skipping")
+                else:
+                    shutil.move(str(chapter_dir), str(manga_dir / chapter_dir.name))
+                    existing.add(chapter_dir.name)
+                    _write(f"  ✓ Moved {chapter_dir.name}")
 
             # Remove empty Vol.none folder
             try:
                 vol_none_dir.rmdir()
-                print(f"  ✓ Removed Vol.none folder\n")
+                _write(f"  ✓ Removed Vol.none folder\n")
             except OSError:
-                print(f"  ⚠ Vol.none folder not empty, skipping removal\n")
+                _write(f"  ⚠ Vol.none folder not empty, skipping removal\n")
 
 
 def rename_language_code_folders(download_dir: Path, client: MangaDxClient):
     """Rename folders that are just language codes to proper titles."""
-    print("\n=== Checking for language code folders ===\n")
-
-    # Common language codes that might be folder names
-    lang_codes = ["ja", "en", "es", "fr", "de", "it", "pt", "pt-br", "zh", "ko", "ru"]
-
-    for folder in download_dir.iterdir():
-        if not folder.is_dir():
-            continue
+    _write("\n=== Checking for language code folders ===\n")
 
+    # Ask for every manga ID up front so titles can be fetched in one batch
+    pending: List[Tuple[Path, str]] = []
+    for folder in _subdirs(download_dir):
         folder_name = folder.name.lower()
 
         # Check if folder name is a language code or very short
-        if folder_name in lang_codes or len(folder_name) <= 3:
-            print(f"Found suspicious folder: {folder.name}")
+        if folder_name in _LANG_CODES or len(folder_name) <= 3:
+            _write(f"Found suspicious folder: {folder.name}")
 
             # Try to find manga ID in a chapter folder
             manga_id = None
-            for chapter_dir in folder.iterdir():
-                if chapter_dir.is_dir():
-                    # Check if there's a way to identify the manga
-                    # For now, ask user for manga ID
-                    print(
-                        f"  Chapters found: {[d.name for d in folder.iterdir() if d.is_dir()][:5]}"
-                    )
-                    manga_id = input(
-                        f"  Enter manga ID for '{folder.name}' (or press Enter to skip): "
-                    ).strip()
-                    break
-
-            if manga_id:
-                proper_title = get_manga_title(client, manga_id)
-                if proper_title:
-                    safe_title = sanitize_filename(proper_title)
-                    new_path = download_dir / safe_title
-
-                    if new_path.exists():
-                        print(f"  ⚠ Folder '{safe_title}' already exists")
-                        merge = input(f"  Merge contents? (y/N): ").strip().lower()
-                        if merge == "y":
-                            # Merge folders
-                            for item in folder.iterdir():
-                                target = new_path / item.name
-                                if not target.exists():
-                                    shutil.move(str(item), str(target))
-                            folder.rmdir()
-                            print(f"  ✓ Merged into '{safe_title}'\n")
-                    else:
-                        folder.rename(new_path)
-                        print(f"  ✓ Renamed to: {safe_title}\n")
+            chapter_dirs = _subdirs(folder)
+            if chapter_dirs:
+                # Check if there's a way to identify the manga
+                # For now, ask user for manga ID
+                _write(f"  Chapters found: {[d.name for d in chapter_dirs][:5]}")
+                manga_id = _prompt(
+                    f"  Enter manga ID for '{folder.name}' (or press Enter to skip): "
+                ).strip()
+
+            if manga_id and not _is_valid_manga_id(manga_id):
+                _write(f"  '{manga_id}' is not a valid manga ID, skipping '{folder.name}'")
+            elif manga_id:
+                pending.append((folder, manga_id))
+
+    if not pending:
+        return
+
+    titles = get_manga_titles(client, list(dict.fromkeys(manga_id for _, manga_id in pending)))
+
+    for folder, manga_id in pending:
+        proper_title = titles.get(manga_id)
+        if not proper_title:
+            _write(f"Could not find a title for {manga_id}, skipping '{folder.name}'")
+            continue
+
+        safe_title = sanitize_filename(proper_title)
+        new_path = download_dir / safe_title
+
+        if new_path.exists():
+            _write(f"  ⚠ Folder '{safe_title}' already exists")
+            merge = _prompt(f"  Merge contents of '{folder.name}'? (y/N): ").strip().lower()
+            if merge == "y":
+                # Merge folders
+                for item in folder.iterdir():
+                    target = new_path / item.name
+                    if not target.exists():
+                        shutil.move(str(item), str(target))
+                folder.rmdir()
+                _write(f"  ✓ Merged into '{safe_title}'\n")
+        else:
+            folder.rename(new_path)
+            _write(f"  ✓ Renamed '{folder.name}' to: {safe_title}\n")
 
 
 def main():
     """Main reorganization function."""
-    print("=" * 60)
-    print("  MangaDx Download Reorganizer")
-    print("=" * 60)
+    _write(
+        "=" * 60,
+        "  MangaDx Download Reorganizer",
+        "=" * 60,
+    )
 
     download_dir = Settings.DOWNLOAD_DIR
 
     if not download_dir.exists():
-        print(f"\nDownload directory not found: {download_dir}")
+        _write(f"\nDownload directory not found: {download_dir}")
         return
 
-    print(f"\nDownload directory: {download_dir}")
-    print(f"Found {len(list(download_dir.iterdir()))} items\n")
+    _write(
+        f"\nDownload directory: {download_dir}",
+        f"Found {len(os.listdir(download_dir))} items\n",
+    )
 
     # Initialize client
     client = MangaDxClient()
@@ -153,18 +215,25 @@ def main():
         # Step 2: Rename language code folders
         rename_language_code_folders(download_dir, client)
 
-        print("\n" + "=" * 60)
-        print("  Reorganization complete!")
-        print("=" * 60)
+        _write(
+            "\n" + "=" * 60,
+            "  Reorganization complete!",
+            "=" * 60,
+        )
 
     finally:
+        sys.stdout.flush()
         client.close()
 
 
 if __name__ == "__main__":
+    # Block-buffer the (potentially very long) move/rename log; prompts flush it
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
+
     try:
         main()
     except KeyboardInterrupt:
-        print("\n\nOperation cancelled by user")
+        _write("\n\nOperation cancelled by user")
     except Exception as e:
-        print(f"\nError: {e}")
+        _write(f"\nError: {e}")
@@ -8,14 +8,17 @@ from setuptools import find_packages, setup
 
 # Read the README file
 this_directory = Path(__file__).parent
-long_description = (this_directory / "README.md").read_text(encoding="utf-8")
+long_description = (this_directory / "README.md").read_bytes().decode("utf-8")
 
-# Read requirements
+# Read requirements (splitlines() also drops the "\r" of CRLF files)
 requirements = []
 requirements_file = this_directory / "requirements.txt"
 if requirements_file.exists():
-    requirements = requirements_file.read_text(encoding="utf-8").strip().split("\n")
-    requirements = [req.strip() for req in requirements if req.strip() and not req.startswith("#")]
+    requirements = [
+        req.strip()
+        for req in requirements_file.read_text(encoding="utf-8").splitlines()
+        if req.strip() and not req.lstrip().startswith("#")
+    ]
 
 setup(
     name="mangadx-scrapper",
@@ -52,6 +55,12 @@ setup(
             "mypy>=1.0.0",
             "pre-commit>=2.20.0",
         ],
+        "speedups": [
+            "orjson>=3.9.0",
+            "ciso8601>=2.3.0",
+            "ijson>=3.1.0",
+            "Brotli>=1.0.9",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -4,6 +4,9 @@ Command-line interface for MangaDx downloader.
 This module provides an interactive CLI for searching and downloading manga.
 """
 
+import argparse
+import functools
+import sys
 from typing import Optional
 
 from colorama import Fore, Style, init
@@ -19,6 +22,52 @@ init(autoreset=True)
 
 logger = setup_logger()
 
+# Colour codes and fixed banners, resolved once at import
+_C, _Y, _G, _R, _W, _RESET = Fore.CYAN, Fore.YELLOW, Fore.GREEN, Fore.RED, Fore.WHITE, Style.RESET_ALL
+_BAR_Y = _Y + "─" * 60
+_HEADER = f"\n{_C}{'=' * 60}\n{_C}  MangaDx Manga Downloader v1.0\n{_C}{'=' * 60}\n"
+_MENU = (
+    f"\n{_BAR_Y}\n{_Y}MAIN MENU\n{_BAR_Y}\n\n"
+    f"{_W}1. Search and download manga\n"
+    f"{_W}2. Download by manga ID\n"
+    f"{_W}3. Exit\n"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _section(title: str) -> str:
+    """Build (once per title) a yellow section banner."""
+    return f"\n{_BAR_Y}\n{_Y}{title}\n{_BAR_Y}\n"
+
+
+def _write(*lines: str) -> None:
+    """Write one or more lines to stdout in a single call."""
+    # Reset between lines, matching colorama's autoreset for separate prints
+    sys.stdout.write(f"{_RESET}\n".join(lines) + "\n")
+
+
+def _flush() -> None:
+    """Flush buffered output, e.g. before waiting on the user."""
+    sys.stdout.flush()
+
+
+def _prompt(message: str) -> str:
+    """Flush pending output and read a line of input."""
+    _flush()
+    return input(message)
+
+
+def _enable_buffered_stdout() -> None:
+    """
+    Switch stdout from line to block buffering.
+
+    Menus and download summaries are many short lines; buffering them avoids
+    a write syscall per line. Output is flushed at every prompt and on exit.
+    """
+    reconfigure = getattr(sys.stdout, "reconfigure", None)
+    if reconfigure is not None:
+        reconfigure(line_buffering=False)
+
 
 class CLI:
     """Interactive command-line interface."""
@@ -30,25 +79,23 @@ class CLI:
 
     def print_header(self):
         """Print application header."""
-        print(f"\n{Fore.CYAN}{'=' * 60}")
-        print(f"{Fore.CYAN}  MangaDx Manga Downloader v1.0")
-        print(f"{Fore.CYAN}{'=' * 60}\n")
+        _write(_HEADER)
 
     def print_success(self, message: str):
         """Print success message."""
-        print(f"{Fore.GREEN}✓ {message}")
+        _write(f"{_G}✓ {message}")
 
     def print_error(self, message: str):
         """Print error message."""
-        print(f"{Fore.RED}✗ {message}")
+        _write(f"{_R}✗ {message}")
 
     def print_info(self, message: str):
         """Print info message."""
-        print(f"{Fore.CYAN}ℹ {message}")
+        _write(f"{_C}ℹ {message}")
 
     def print_warning(self, message: str):
         """Print warning message."""
-        print(f"{Fore.YELLOW}⚠ {message}")
+        _write(f"{_Y}⚠ {message}")
 
     def search_manga(self) -> Optional[str]:
         """
@@ -58,17 +105,16 @@ class CLI:
             Selected manga ID or None
         """
         try:
-            print(f"\n{Fore.YELLOW}{'─' * 60}")
-            print(f"{Fore.YELLOW}MANGA SEARCH")
-            print(f"{Fore.YELLOW}{'─' * 60}\n")
+            _write(_section("MANGA SEARCH"))
 
-            title = input(f"{Fore.CYAN}Enter manga title to search: {Style.RESET_ALL}").strip()
+            title = _prompt(f"{_C}Enter manga title to search: {_RESET}").strip()
 
             if not title:
                 self.print_error("Title cannot be empty")
                 return None
 
             self.print_info(f"Searching for '{title}'...")
+            _flush()
 
             manga_list = self.client.manga.search(
                 title=title,
@@ -81,11 +127,13 @@ class CLI:
                 self.print_warning("No manga found matching your search")
                 return None
 
-            print(f"\n{Fore.GREEN}Found {len(manga_list)} manga:\n")
-            print(format_manga_list(manga_list))
+            _write(
+                f"\n{_G}Found {len(manga_list)} manga:\n",
+                format_manga_list(manga_list),
+            )
 
-            print(f"\n{Fore.YELLOW}{'─' * 60}\n")
-            selection = input(f"{Fore.CYAN}Enter manga number (or 0 to cancel): {Style.RESET_ALL}").strip()
+            _write(f"\n{_BAR_Y}\n")
+            selection = _prompt(f"{_C}Enter manga number (or 0 to cancel): {_RESET}").strip()
 
             try:
                 idx = int(selection)
@@ -95,8 +143,10 @@ class CLI:
 
                 if 1 <= idx <= len(manga_list):
                     selected_manga = manga_list[idx - 1]
-                    print(f"\n{Fore.GREEN}Selected manga:")
-                    print(f"{Fore.WHITE}{format_manga_info(selected_manga, verbose=True)}\n")
+                    _write(
+                        f"\n{_G}Selected manga:",
+                        f"{_W}{format_manga_info(selected_manga, verbose=True)}\n",
+                    )
                     return selected_manga.id
                 else:
                     self.print_error("Invalid selection")
@@ -128,13 +178,11 @@ class CLI:
             "data_saver": False,
         }
 
-        print(f"\n{Fore.YELLOW}{'─' * 60}")
-        print(f"{Fore.YELLOW}DOWNLOAD OPTIONS")
-        print(f"{Fore.YELLOW}{'─' * 60}\n")
+        _write(_section("DOWNLOAD OPTIONS"))
 
         # Language selection
-        lang_input = input(
-            f"{Fore.CYAN}Enter language codes (comma-separated, default: {Settings.DEFAULT_LANGUAGE}): {Style.RESET_ALL}"
+        lang_input = _prompt(
+            f"{_C}Enter language codes (comma-separated, default: {Settings.DEFAULT_LANGUAGE}): {_RESET}"
         ).strip()
 
         if lang_input:
@@ -143,16 +191,16 @@ class CLI:
             options["languages"] = [Settings.DEFAULT_LANGUAGE]
 
         # Volume filter
-        volume_input = input(
-            f"{Fore.CYAN}Enter volume numbers to download (comma-separated, or press Enter for all): {Style.RESET_ALL}"
+        volume_input = _prompt(
+            f"{_C}Enter volume numbers to download (comma-separated, or press Enter for all): {_RESET}"
         ).strip()
 
         if volume_input:
             options["volume_filter"] = [vol.strip() for vol in volume_input.split(",")]
 
         # Chapter filter
-        chapter_input = input(
-            f"{Fore.CYAN}Enter chapter numbers to download (comma-separated, or press Enter for all): {Style.RESET_ALL}"
+        chapter_input = _prompt(
+            f"{_C}Enter chapter numbers to download (comma-separated, or press Enter for all): {_RESET}"
         ).strip()
 
         if chapter_input:
@@ -160,8 +208,8 @@ class CLI:
 
         # Chapter range option
         if not options["chapter_filter"]:
-            range_input = input(
-                f"{Fore.CYAN}Download chapter range? (e.g., '1-10', or press Enter to skip): {Style.RESET_ALL}"
+            range_input = _prompt(
+                f"{_C}Download chapter range? (e.g., '1-10', or press Enter to skip): {_RESET}"
             ).strip()
 
             if range_input and "-" in range_input:
@@ -176,8 +224,8 @@ class CLI:
                     self.print_warning("Invalid range format, downloading all chapters")
 
         # Data saver option
-        data_saver_input = input(
-            f"{Fore.CYAN}Use data saver mode (lower quality, smaller size)? (y/N): {Style.RESET_ALL}"
+        data_saver_input = _prompt(
+            f"{_C}Use data saver mode (lower quality, smaller size)? (y/N): {_RESET}"
         ).strip().lower()
 
         options["data_saver"] = data_saver_input == "y"
@@ -194,9 +242,7 @@ class CLI:
         try:
             options = self.get_download_options()
 
-            print(f"\n{Fore.YELLOW}{'─' * 60}")
-            print(f"{Fore.YELLOW}STARTING DOWNLOAD")
-            print(f"{Fore.YELLOW}{'─' * 60}\n")
+            _write(_section("STARTING DOWNLOAD"))
 
             self.print_info("Fetching manga information...")
 
@@ -204,6 +250,7 @@ class CLI:
             if "chapter_range" in options:
                 start_ch, end_ch = options["chapter_range"]
                 self.print_info(f"Downloading chapters {start_ch} to {end_ch}")
+                _flush()
 
                 stats = self.downloader.download_chapter_range(
                     manga_id=manga_id,
@@ -213,6 +260,7 @@ class CLI:
                     data_saver=options["data_saver"],
                 )
             else:
+                _flush()
                 stats = self.downloader.download_manga(
                     manga_id=manga_id,
                     languages=options["languages"],
@@ -222,17 +270,17 @@ class CLI:
                 )
 
             # Print statistics
-            print(f"\n{Fore.YELLOW}{'─' * 60}")
-            print(f"{Fore.YELLOW}DOWNLOAD COMPLETE")
-            print(f"{Fore.YELLOW}{'─' * 60}\n")
+            _write(_section("DOWNLOAD COMPLETE"))
 
-            print(f"{Fore.WHITE}Manga: {stats['manga_title']}")
-            print(f"{Fore.GREEN}Downloaded: {stats['downloaded']}/{stats['total_chapters']} chapters")
+            _write(
+                f"{_W}Manga: {stats['manga_title']}",
+                f"{_G}Downloaded: {stats['downloaded']}/{stats['total_chapters']} chapters",
+            )
 
             if stats.get("failed", 0) > 0:
-                print(f"{Fore.RED}Failed: {stats['failed']} chapters")
+                _write(f"{_R}Failed: {stats['failed']} chapters")
 
-            print(f"\n{Fore.CYAN}Files saved to: {self.downloader.download_dir}\n")
+            _write(f"\n{_C}Files saved to: {self.downloader.download_dir}\n")
 
         except MangaDxException as e:
             self.print_error(f"Download failed: {e}")
@@ -241,42 +289,44 @@ class CLI:
             self.print_error(f"Unexpected error: {e}")
             logger.exception("Download error")
 
-    def run(self):
-        """Run the interactive CLI."""
+    def run(self, check_connection: bool = True):
+        """
+        Run the interactive CLI.
+
+        Args:
+            check_connection: Ping the API before showing the menu
+        """
         try:
             self.print_header()
 
-            # Check API connectivity
-            self.print_info("Checking API connectivity...")
-            if not self.client.ping():
-                self.print_error("Cannot connect to MangaDx API")
-                return
+            # Check API connectivity (recent successful pings are reused)
+            if check_connection:
+                self.print_info("Checking API connectivity...")
+                _flush()
+                if not self.client.ping():
+                    self.print_error("Cannot connect to MangaDx API")
+                    return
 
-            self.print_success("Connected to MangaDx API")
+                self.print_success("Connected to MangaDx API")
 
             while True:
-                print(f"\n{Fore.YELLOW}{'─' * 60}")
-                print(f"{Fore.YELLOW}MAIN MENU")
-                print(f"{Fore.YELLOW}{'─' * 60}\n")
-                print(f"{Fore.WHITE}1. Search and download manga")
-                print(f"{Fore.WHITE}2. Download by manga ID")
-                print(f"{Fore.WHITE}3. Exit\n")
+                _write(_MENU)
 
-                choice = input(f"{Fore.CYAN}Enter your choice: {Style.RESET_ALL}").strip()
+                choice = _prompt(f"{_C}Enter your choice: {_RESET}").strip()
 
                 if choice == "1":
                     manga_id = self.search_manga()
                     if manga_id:
-                        confirm = input(
-                            f"\n{Fore.CYAN}Proceed with download? (Y/n): {Style.RESET_ALL}"
+                        confirm = _prompt(
+                            f"\n{_C}Proceed with download? (Y/n): {_RESET}"
                         ).strip().lower()
 
                         if confirm != "n":
                             self.download_manga(manga_id)
 
                 elif choice == "2":
-                    manga_id = input(
-                        f"\n{Fore.CYAN}Enter manga ID: {Style.RESET_ALL}"
+                    manga_id = _prompt(
+                        f"\n{_C}Enter manga ID: {_RESET}"
                     ).strip()
 
                     if manga_id:
@@ -290,18 +340,29 @@ class CLI:
                     self.print_error("Invalid choice. Please try again.")
 
         except KeyboardInterrupt:
-            print(f"\n\n{Fore.YELLOW}Operation cancelled by user")
+            _write(f"\n\n{_Y}Operation cancelled by user")
         except Exception as e:
             self.print_error(f"Fatal error: {e}")
             logger.exception("Fatal error")
         finally:
+            _flush()
+            self.downloader.close()
             self.client.close()
 
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Interactive MangaDx manga downloader")
+    parser.add_argument(
+        "--no-ping",
+        action="store_true",
+        help="Skip the API connectivity check on startup",
+    )
+    args = parser.parse_args()
+
+    _enable_buffered_stdout()
     cli = CLI()
-    cli.run()
+    cli.run(check_connection=not args.no_ping)
 
 
 if __name__ == "__main__":
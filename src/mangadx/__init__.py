@@ -2,20 +2,38 @@
 
 A comprehensive Python client for the MangaDx API v5.
 Provides easy access to manga, chapters, authors, and more.
+
+Public names are loaded lazily (PEP 562), so importing the package does not
+pull in the HTTP stack until a client or exception is actually used.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "1.0.0"
 __author__ = "MangaDx Scrapper Team"
 
-from .client import MangaDxClient
-from .exceptions import (
-    APIException,
-    AuthenticationException,
-    AuthorizationException,
-    MangaDxException,
-    NotFoundException,
-    RateLimitException,
-)
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "MangaDxClient": ".client",
+    "APIException": ".exceptions",
+    "AuthenticationException": ".exceptions",
+    "AuthorizationException": ".exceptions",
+    "MangaDxException": ".exceptions",
+    "NotFoundException": ".exceptions",
+    "RateLimitException": ".exceptions",
+}
+
+if TYPE_CHECKING:
+    from .client import MangaDxClient
+    from .exceptions import (
+        APIException,
+        AuthenticationException,
+        AuthorizationException,
+        MangaDxException,
+        NotFoundException,
+        RateLimitException,
+    )
 
 __all__ = [
     "APIException",
@@ -26,3 +44,19 @@ __all__ = [
     "NotFoundException",
     "RateLimitException",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily imported names in dir()."""
+    return sorted(set(globals()) | set(__all__))
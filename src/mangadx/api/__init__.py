@@ -1,11 +1,28 @@
-"""API modules for different MangaDx resources."""
+"""API modules for different MangaDx resources.
 
-from .at_home import AtHomeAPI
-from .author import AuthorAPI
-from .chapter import ChapterAPI
-from .cover import CoverAPI
-from .manga import MangaAPI
-from .scanlation_group import ScanlationGroupAPI
+API classes are imported lazily (PEP 562) on first access.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "AtHomeAPI": ".at_home",
+    "AuthorAPI": ".author",
+    "ChapterAPI": ".chapter",
+    "CoverAPI": ".cover",
+    "MangaAPI": ".manga",
+    "ScanlationGroupAPI": ".scanlation_group",
+}
+
+if TYPE_CHECKING:
+    from .at_home import AtHomeAPI
+    from .author import AuthorAPI
+    from .chapter import ChapterAPI
+    from .cover import CoverAPI
+    from .manga import MangaAPI
+    from .scanlation_group import ScanlationGroupAPI
 
 __all__ = [
     "MangaAPI",
@@ -15,3 +32,19 @@ __all__ = [
     "ScanlationGroupAPI",
     "AtHomeAPI",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import API classes on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily imported names in dir()."""
+    return sorted(set(globals()) | set(__all__))
@@ -4,14 +4,23 @@ AtHome API module.
 This module provides methods for getting chapter image URLs from MangaDx@Home.
 """
 
-from typing import Any, Dict, List
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, List, Tuple
 
 from ..http_client import HTTPClient
 
+# Seconds an /at-home/server response is reused. MangaDx@Home URLs stay
+# valid for ~15 minutes; keeping this short leaves callers that cache the
+# resulting image URLs themselves (DownloadManager) well inside that window
+AT_HOME_SERVER_TTL = 60
+
 
 class AtHomeAPI:
     """API client for MangaDx@Home operations."""
 
+    __slots__ = ("client", "_inflight", "_inflight_lock")
+
     def __init__(self, http_client: HTTPClient):
         """
         Initialize AtHome API.
@@ -20,11 +29,20 @@ class AtHomeAPI:
             http_client: HTTP client instance
         """
         self.client = http_client
+        # Lookups currently on the wire, so concurrent callers asking for the
+        # same chapter wait for that response instead of sending their own
+        self._inflight: Dict[Tuple[str, bool], Future] = {}
+        self._inflight_lock = threading.Lock()
 
     def get_server(self, chapter_id: str, force_port_443: bool = False) -> Dict[str, Any]:
         """
         Get MangaDx@Home server URL for chapter.
-        
+
+        Responses are reused for AT_HOME_SERVER_TTL seconds, and concurrent
+        calls for the same chapter share a single request. The endpoint takes
+        a single chapter, so there is no batched variant (unlike
+        ``ChapterAPI.get_many``).
+
         Args:
             chapter_id: Chapter UUID
             force_port_443: Force HTTPS port 443
@@ -32,12 +50,33 @@ class AtHomeAPI:
         Returns:
             Dictionary with baseUrl and chapter data
         """
+        key = (chapter_id, force_port_443)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[key] = Future()
+
+        if not is_owner:
+            return future.result()
+
         params = {}
         if force_port_443:
             params["forcePort443"] = "true"
 
-        response = self.client.get(f"/at-home/server/{chapter_id}", params=params)
-        return response
+        try:
+            response = self.client.get(
+                f"/at-home/server/{chapter_id}", params=params, cache_ttl=AT_HOME_SERVER_TTL
+            )
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
 
     def get_image_urls(self, chapter_id: str, data_saver: bool = False) -> List[str]:
         """
@@ -62,4 +101,6 @@ class AtHomeAPI:
             images = chapter_data.get("data", [])
             quality = "data"
 
-        return [f"{base_url}/{quality}/{chapter_hash}/{image}" for image in images]
+        # Every page shares the same prefix: format it once
+        prefix = f"{base_url}/{quality}/{chapter_hash}/"
+        return [prefix + image for image in images]
@@ -6,13 +6,18 @@ This module provides methods for interacting with author endpoints.
 
 from typing import Any, Dict, List, Optional
 
+from config import Settings
+
 from ..http_client import HTTPClient
 from ..models import Author
+from .query import order_params
 
 
 class AuthorAPI:
     """API client for author operations."""
 
+    __slots__ = ("client",)
+
     def __init__(self, http_client: HTTPClient):
         """
         Initialize Author API.
@@ -54,13 +59,12 @@ class AuthorAPI:
             params["ids[]"] = ids
         if name:
             params["name"] = name
-        if order:
-            params["order"] = order
+        params.update(order_params(order))
         if includes:
             params["includes[]"] = includes
 
         response = self.client.get("/author", params=params)
-        return [Author.from_dict(item) for item in response.get("data", [])]
+        return Author.from_dict_list(response.get("data", []))
 
     def get(self, author_id: str, includes: Optional[List[str]] = None) -> Author:
         """
@@ -77,5 +81,5 @@ class AuthorAPI:
         if includes:
             params["includes[]"] = includes
 
-        response = self.client.get(f"/author/{author_id}", params=params)
+        response = self.client.get(f"/author/{author_id}", params=params, cache_ttl=Settings.CACHE_EXPIRY)
         return Author.from_dict(response["data"])
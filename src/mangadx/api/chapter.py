@@ -6,13 +6,57 @@ This module provides methods for interacting with chapter endpoints.
 
 from typing import Any, Dict, List, Optional
 
+from config import Settings
+
 from ..http_client import HTTPClient
 from ..models import Chapter
+from .query import ALL_CONTENT_RATINGS, ContentRating, build_params, fetch_by_ids, order_params
+
+# list() argument -> query key
+_CHAPTER_LIST_PARAMS = (
+    ("ids", "ids[]"),
+    ("title", "title"),
+    ("groups", "groups[]"),
+    ("uploader", "uploader"),
+    ("manga", "manga"),
+    ("volume", "volume"),
+    ("chapter", "chapter"),
+    ("translated_language", "translatedLanguage[]"),
+    ("original_language", "originalLanguage[]"),
+    ("excluded_original_language", "excludedOriginalLanguage[]"),
+    ("content_rating", "contentRating[]"),
+    ("excluded_groups", "excludedGroups[]"),
+    ("excluded_uploaders", "excludedUploaders[]"),
+    ("created_at_since", "createdAtSince"),
+    ("updated_at_since", "updatedAtSince"),
+    ("publish_at_since", "publishAtSince"),
+    ("includes", "includes[]"),
+)
+
+_CHAPTER_LIST_BOOL_PARAMS = (
+    ("include_future_updates", "includeFutureUpdates"),
+    ("include_empty_pages", "includeEmptyPages"),
+    ("include_future_publish_at", "includeFuturePublishAt"),
+    ("include_external_url", "includeExternalUrl"),
+)
+
+
+def _list_params(filters: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the query parameters for ChapterAPI.list()."""
+    params: Dict[str, Any] = {
+        "limit": filters.get("limit", 100),
+        "offset": filters.get("offset", 0),
+    }
+    params.update(build_params(filters, _CHAPTER_LIST_PARAMS, _CHAPTER_LIST_BOOL_PARAMS))
+    params.update(order_params(filters.get("order")))
+    return params
 
 
 class ChapterAPI:
     """API client for chapter operations."""
 
+    __slots__ = ("client",)
+
     def __init__(self, http_client: HTTPClient):
         """
         Initialize Chapter API.
@@ -36,7 +80,7 @@ class ChapterAPI:
         translated_language: Optional[List[str]] = None,
         original_language: Optional[List[str]] = None,
         excluded_original_language: Optional[List[str]] = None,
-        content_rating: Optional[List[str]] = None,
+        content_rating: Optional[List[ContentRating]] = None,
         excluded_groups: Optional[List[str]] = None,
         excluded_uploaders: Optional[List[str]] = None,
         include_future_updates: Optional[bool] = None,
@@ -81,58 +125,27 @@ class ChapterAPI:
         Returns:
             List of Chapter objects
         """
-        params: Dict[str, Any] = {
-            "limit": limit,
-            "offset": offset,
-        }
-
-        if ids:
-            params["ids[]"] = ids
-        if title:
-            params["title"] = title
-        if groups:
-            params["groups[]"] = groups
-        if uploader:
-            params["uploader"] = uploader
-        if manga:
-            params["manga"] = manga
-        if volume:
-            params["volume"] = volume
-        if chapter:
-            params["chapter"] = chapter
-        if translated_language:
-            params["translatedLanguage[]"] = translated_language
-        if original_language:
-            params["originalLanguage[]"] = original_language
-        if excluded_original_language:
-            params["excludedOriginalLanguage[]"] = excluded_original_language
-        if content_rating:
-            params["contentRating[]"] = content_rating
-        if excluded_groups:
-            params["excludedGroups[]"] = excluded_groups
-        if excluded_uploaders:
-            params["excludedUploaders[]"] = excluded_uploaders
-        if include_future_updates is not None:
-            params["includeFutureUpdates"] = "1" if include_future_updates else "0"
-        if include_empty_pages is not None:
-            params["includeEmptyPages"] = "1" if include_empty_pages else "0"
-        if include_future_publish_at is not None:
-            params["includeFuturePublishAt"] = "1" if include_future_publish_at else "0"
-        if include_external_url is not None:
-            params["includeExternalUrl"] = "1" if include_external_url else "0"
-        if created_at_since:
-            params["createdAtSince"] = created_at_since
-        if updated_at_since:
-            params["updatedAtSince"] = updated_at_since
-        if publish_at_since:
-            params["publishAtSince"] = publish_at_since
-        if order:
-            params["order"] = order
-        if includes:
-            params["includes[]"] = includes
-
+        params = _list_params(locals())
         response = self.client.get("/chapter", params=params)
-        return [Chapter.from_dict(item) for item in response.get("data", [])]
+        return Chapter.from_dict_list(response.get("data", []))
+
+    def list_all(self, **filters: Any) -> List[Chapter]:
+        """
+        Get every chapter matching the filters.
+
+        The first page reports the total; the remaining pages are fetched
+        concurrently (see HTTPClient.get_all_pages).
+
+        Args:
+            **filters: Any list() filter except limit/offset
+
+        Returns:
+            List of all matching Chapter objects
+        """
+        filters.pop("limit", None)
+        filters.pop("offset", None)
+        params = _list_params(filters)
+        return Chapter.from_dict_list(self.client.get_all_pages("/chapter", params))
 
     def get(self, chapter_id: str, includes: Optional[List[str]] = None) -> Chapter:
         """
@@ -149,5 +162,28 @@ class ChapterAPI:
         if includes:
             params["includes[]"] = includes
 
-        response = self.client.get(f"/chapter/{chapter_id}", params=params)
+        response = self.client.get(f"/chapter/{chapter_id}", params=params, cache_ttl=Settings.CACHE_EXPIRY)
         return Chapter.from_dict(response["data"])
+
+    def get_many(self, chapter_ids: List[str], includes: Optional[List[str]] = None) -> List[Chapter]:
+        """
+        Get several chapters by ID with as few requests as possible.
+
+        IDs are fetched in batches of 100 through the ``ids[]`` filter of
+        ``/chapter``, so N lookups cost ceil(N / 100) round-trips.
+
+        Args:
+            chapter_ids: Chapter UUIDs
+            includes: Related entities to include
+
+        Returns:
+            List of Chapter objects in the order of ``chapter_ids``
+            (IDs that do not exist are omitted)
+        """
+        return fetch_by_ids(chapter_ids, lambda batch: self.list(
+            ids=batch,
+            # ids[] still honours the default content rating filter
+            content_rating=ALL_CONTENT_RATINGS,
+            includes=includes,
+            limit=len(batch),
+        ))
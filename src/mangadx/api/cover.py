@@ -4,15 +4,41 @@ Cover API module.
 This module provides methods for interacting with cover art endpoints.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
+
+from config import Settings
 
 from ..http_client import HTTPClient
 from ..models import Cover
+from .query import build_params, fetch_by_ids, order_params
+
+# Resolved once at import; Settings is read from the environment on load
+_COVERS_URL = f"{Settings.UPLOADS_URL}/covers"
+
+CoverSize = Literal["original", "512", "256"]
+
+# File name suffix of each thumbnail size served by the uploads host
+_COVER_SUFFIXES: Dict[str, str] = {
+    "original": "",
+    "512": ".512.jpg",
+    "256": ".256.jpg",
+}
+
+# list() argument -> query key
+_COVER_LIST_PARAMS = (
+    ("manga", "manga[]"),
+    ("ids", "ids[]"),
+    ("uploaders", "uploaders[]"),
+    ("locales", "locales[]"),
+    ("includes", "includes[]"),
+)
 
 
 class CoverAPI:
     """API client for cover art operations."""
 
+    __slots__ = ("client",)
+
     def __init__(self, http_client: HTTPClient):
         """
         Initialize Cover API.
@@ -53,22 +79,11 @@ class CoverAPI:
             "limit": limit,
             "offset": offset,
         }
-
-        if manga:
-            params["manga[]"] = manga
-        if ids:
-            params["ids[]"] = ids
-        if uploaders:
-            params["uploaders[]"] = uploaders
-        if locales:
-            params["locales[]"] = locales
-        if order:
-            params["order"] = order
-        if includes:
-            params["includes[]"] = includes
+        params.update(build_params(locals(), _COVER_LIST_PARAMS))
+        params.update(order_params(order))
 
         response = self.client.get("/cover", params=params)
-        return [Cover.from_dict(item) for item in response.get("data", [])]
+        return Cover.from_dict_list(response.get("data", []))
 
     def get(self, cover_id: str, includes: Optional[List[str]] = None) -> Cover:
         """
@@ -85,10 +100,31 @@ class CoverAPI:
         if includes:
             params["includes[]"] = includes
 
-        response = self.client.get(f"/cover/{cover_id}", params=params)
+        response = self.client.get(f"/cover/{cover_id}", params=params, cache_ttl=Settings.CACHE_EXPIRY)
         return Cover.from_dict(response["data"])
 
-    def get_cover_url(self, manga_id: str, file_name: str, size: str = "original") -> str:
+    def get_many(self, cover_ids: List[str], includes: Optional[List[str]] = None) -> List[Cover]:
+        """
+        Get several covers by ID with as few requests as possible.
+
+        IDs are fetched in batches of 100 through the ``ids[]`` filter of
+        ``/cover``, so N lookups cost ceil(N / 100) round-trips.
+
+        Args:
+            cover_ids: Cover UUIDs
+            includes: Related entities to include
+
+        Returns:
+            List of Cover objects in the order of ``cover_ids``
+            (IDs that do not exist are omitted)
+        """
+        return fetch_by_ids(cover_ids, lambda batch: self.list(
+            ids=batch,
+            includes=includes,
+            limit=len(batch),
+        ))
+
+    def get_cover_url(self, manga_id: str, file_name: str, size: CoverSize = "original") -> str:
         """
         Get cover image URL.
 
@@ -100,9 +136,12 @@ class CoverAPI:
         Returns:
             Cover image URL
         """
-        from config import Settings
+        return _cover_url(manga_id, file_name, size)
+
 
-        if size == "original":
-            return f"{Settings.UPLOADS_URL}/covers/{manga_id}/{file_name}"
-        else:
-            return f"{Settings.UPLOADS_URL}/covers/{manga_id}/{file_name}.{size}.jpg"
+def _cover_url(manga_id: str, file_name: str, size: str) -> str:
+    """Build a cover image URL."""
+    suffix = _COVER_SUFFIXES.get(size)
+    if suffix is None:
+        suffix = f".{size}.jpg"
+    return f"{_COVERS_URL}/{manga_id}/{file_name}{suffix}"
@@ -4,15 +4,103 @@ Manga API module.
 This module provides methods for interacting with manga endpoints.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from config import Settings
 
 from ..http_client import HTTPClient
 from ..models import Manga
+from .query import (
+    ALL_CONTENT_RATINGS,
+    ContentRating,
+    MangaStatus,
+    PublicationDemographic,
+    TagsMode,
+    build_params,
+    fetch_by_ids,
+    order_params,
+)
+
+# The tag catalogue changes very rarely
+TAG_LIST_CACHE_TTL = 24 * 60 * 60
+
+# search() argument -> query key
+_SEARCH_PARAMS = (
+    ("title", "title"),
+    ("authors", "authors[]"),
+    ("artists", "artists[]"),
+    ("year", "year"),
+    ("included_tags", "includedTags[]"),
+    ("excluded_tags", "excludedTags[]"),
+    ("status", "status[]"),
+    ("original_language", "originalLanguage[]"),
+    ("excluded_original_language", "excludedOriginalLanguage[]"),
+    ("available_translated_language", "availableTranslatedLanguage[]"),
+    ("publication_demographic", "publicationDemographic[]"),
+    ("ids", "ids[]"),
+    ("content_rating", "contentRating[]"),
+    ("created_at_since", "createdAtSince"),
+    ("updated_at_since", "updatedAtSince"),
+    ("includes", "includes[]"),
+    ("group", "group"),
+)
+
+_SEARCH_BOOL_PARAMS = (
+    ("has_available_chapters", "hasAvailableChapters"),
+)
+
+# get_feed() argument -> query key
+_FEED_PARAMS = (
+    ("translated_language", "translatedLanguage[]"),
+    ("original_language", "originalLanguage[]"),
+    ("excluded_original_language", "excludedOriginalLanguage[]"),
+    ("content_rating", "contentRating[]"),
+    ("excluded_groups", "excludedGroups[]"),
+    ("excluded_uploaders", "excludedUploaders[]"),
+    ("created_at_since", "createdAtSince"),
+    ("updated_at_since", "updatedAtSince"),
+    ("publish_at_since", "publishAtSince"),
+    ("includes", "includes[]"),
+)
+
+_FEED_BOOL_PARAMS = (
+    ("include_future_updates", "includeFutureUpdates"),
+)
+
+
+def _search_params(filters: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the query parameters for MangaAPI.search()."""
+    params: Dict[str, Any] = {
+        "limit": filters.get("limit", 10),
+        "offset": filters.get("offset", 0),
+    }
+    params.update(build_params(filters, _SEARCH_PARAMS, _SEARCH_BOOL_PARAMS))
+    params.update(order_params(filters.get("order")))
+
+    # Tag modes only mean something alongside their tag lists
+    if "includedTags[]" in params:
+        params["includedTagsMode"] = filters.get("included_tags_mode") or "AND"
+    if "excludedTags[]" in params:
+        params["excludedTagsMode"] = filters.get("excluded_tags_mode") or "OR"
+    return params
+
+
+def _feed_params(filters: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the query parameters for MangaAPI.get_feed()."""
+    params: Dict[str, Any] = {
+        "limit": filters.get("limit", 100),
+        "offset": filters.get("offset", 0),
+    }
+    params.update(build_params(filters, _FEED_PARAMS, _FEED_BOOL_PARAMS))
+    params.update(order_params(filters.get("order")))
+    return params
 
 
 class MangaAPI:
     """API client for manga operations."""
 
+    __slots__ = ("client",)
+
     def __init__(self, http_client: HTTPClient):
         """
         Initialize Manga API.
@@ -29,16 +117,16 @@ class MangaAPI:
         artists: Optional[List[str]] = None,
         year: Optional[int] = None,
         included_tags: Optional[List[str]] = None,
-        included_tags_mode: str = "AND",
+        included_tags_mode: TagsMode = "AND",
         excluded_tags: Optional[List[str]] = None,
-        excluded_tags_mode: str = "OR",
-        status: Optional[List[str]] = None,
+        excluded_tags_mode: TagsMode = "OR",
+        status: Optional[List[MangaStatus]] = None,
         original_language: Optional[List[str]] = None,
         excluded_original_language: Optional[List[str]] = None,
         available_translated_language: Optional[List[str]] = None,
-        publication_demographic: Optional[List[str]] = None,
+        publication_demographic: Optional[List[PublicationDemographic]] = None,
         ids: Optional[List[str]] = None,
-        content_rating: Optional[List[str]] = None,
+        content_rating: Optional[List[ContentRating]] = None,
         created_at_since: Optional[str] = None,
         updated_at_since: Optional[str] = None,
         order: Optional[Dict[str, str]] = None,
@@ -79,54 +167,59 @@ class MangaAPI:
         Returns:
             List of Manga objects
         """
-        params: Dict[str, Any] = {
-            "limit": limit,
-            "offset": offset,
-        }
-
-        if title:
-            params["title"] = title
-        if authors:
-            params["authors[]"] = authors
-        if artists:
-            params["artists[]"] = artists
-        if year:
-            params["year"] = year
-        if included_tags:
-            params["includedTags[]"] = included_tags
-            params["includedTagsMode"] = included_tags_mode
-        if excluded_tags:
-            params["excludedTags[]"] = excluded_tags
-            params["excludedTagsMode"] = excluded_tags_mode
-        if status:
-            params["status[]"] = status
-        if original_language:
-            params["originalLanguage[]"] = original_language
-        if excluded_original_language:
-            params["excludedOriginalLanguage[]"] = excluded_original_language
-        if available_translated_language:
-            params["availableTranslatedLanguage[]"] = available_translated_language
-        if publication_demographic:
-            params["publicationDemographic[]"] = publication_demographic
-        if ids:
-            params["ids[]"] = ids
-        if content_rating:
-            params["contentRating[]"] = content_rating
-        if created_at_since:
-            params["createdAtSince"] = created_at_since
-        if updated_at_since:
-            params["updatedAtSince"] = updated_at_since
-        if order:
-            params["order"] = order
-        if includes:
-            params["includes[]"] = includes
-        if has_available_chapters is not None:
-            params["hasAvailableChapters"] = "1" if has_available_chapters else "0"
-        if group:
-            params["group"] = group
-
+        params = _search_params(locals())
         response = self.client.get("/manga", params=params)
-        return [Manga.from_dict(item) for item in response.get("data", [])]
+        return Manga.from_dict_list(response.get("data", []))
+
+    def search_all(self, **filters: Any) -> List[Manga]:
+        """
+        Search for manga and return every page of results.
+
+        The first page reports the total; the remaining pages are fetched
+        concurrently (see HTTPClient.get_all_pages).
+
+        Args:
+            **filters: Any search() filter except limit/offset
+
+        Returns:
+            List of all matching Manga objects
+        """
+        filters.pop("limit", None)
+        filters.pop("offset", None)
+        params = _search_params(filters)
+        return Manga.from_dict_list(self.client.get_all_pages("/manga", params))
+
+    def search_full(
+        self,
+        with_relationships: Sequence[str] = ("author", "artist", "cover_art"),
+        **filters: Any,
+    ) -> Tuple[List[Manga], Dict[str, Any]]:
+        """
+        Search for manga with related entities expanded in the same request.
+
+        The relationship types are added to ``includes[]``, so authors and
+        covers arrive inside the search response instead of needing one
+        author.get()/cover.get() call per manga.
+
+        Args:
+            with_relationships: Relationship types to expand
+            **filters: Any search() filter
+
+        Returns:
+            Tuple of (manga list, related entity ID -> Author/Cover/... object)
+        """
+        wanted = frozenset(with_relationships)
+        filters["includes"] = list(dict.fromkeys([*(filters.get("includes") or ()), *with_relationships]))
+        mangas = self.search(**filters)
+
+        related: Dict[str, Any] = {}
+        for manga in mangas:
+            for rel in manga.relationships:
+                if rel.type in wanted and rel.id not in related:
+                    entity = rel.resolve()
+                    if entity is not None:
+                        related[rel.id] = entity
+        return mangas, related
 
     def get(self, manga_id: str, includes: Optional[List[str]] = None) -> Manga:
         """
@@ -143,9 +236,32 @@ class MangaAPI:
         if includes:
             params["includes[]"] = includes
 
-        response = self.client.get(f"/manga/{manga_id}", params=params)
+        response = self.client.get(f"/manga/{manga_id}", params=params, cache_ttl=Settings.CACHE_EXPIRY)
         return Manga.from_dict(response["data"])
 
+    def get_many(self, manga_ids: List[str], includes: Optional[List[str]] = None) -> List[Manga]:
+        """
+        Get several manga by ID with as few requests as possible.
+
+        IDs are fetched in batches of 100 through the ``ids[]`` filter of
+        ``/manga``, so N lookups cost ceil(N / 100) round-trips.
+
+        Args:
+            manga_ids: Manga UUIDs
+            includes: Related entities to include
+
+        Returns:
+            List of Manga objects in the order of ``manga_ids``
+            (IDs that do not exist are omitted)
+        """
+        return fetch_by_ids(manga_ids, lambda batch: self.search(
+            ids=batch,
+            # ids[] still honours the default content rating filter
+            content_rating=ALL_CONTENT_RATINGS,
+            includes=includes,
+            limit=len(batch),
+        ))
+
     def get_aggregate(
         self,
         manga_id: str,
@@ -189,20 +305,69 @@ class MangaAPI:
         Returns:
             List of chapter dictionaries with chapter number and ID
         """
-        volumes = self.get_aggregate(manga_id, translated_language, groups)
-        chapters = []
+        return list(self.iter_chapters_list(manga_id, translated_language, groups))
+
+    def get_chapters_list_many(
+        self,
+        manga_ids: List[str],
+        translated_language: Optional[List[str]] = None,
+        groups: Optional[List[str]] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get the flat chapter lists of several manga concurrently.
+
+        Aggregates are fetched in parallel through HTTPClient.map().
+
+        Args:
+            manga_ids: Manga UUIDs
+            translated_language: Filter by translated languages
+            groups: Filter by scanlation group UUIDs
 
-        for volume_data in volumes.values():
-            for chapter_data in volume_data.get("chapters", {}).values():
-                chapters.append({
-                    "volume": volume_data.get("volume"),
-                    "chapter": chapter_data.get("chapter"),
-                    "id": chapter_data.get("id"),
-                    "others": chapter_data.get("others", []),
-                    "count": chapter_data.get("count", 0),
-                })
+        Returns:
+            Dictionary mapping each manga ID to its chapter list
+        """
+        unique_ids = list(dict.fromkeys(manga_ids))
+        chapter_lists = self.client.map(
+            lambda manga_id: self.get_chapters_list(manga_id, translated_language, groups),
+            unique_ids,
+        )
+        return dict(zip(unique_ids, chapter_lists))
+
+    def iter_chapters_list(
+        self,
+        manga_id: str,
+        translated_language: Optional[List[str]] = None,
+        groups: Optional[List[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the chapters of a manga's aggregate data.
+
+        Same entries as get_chapters_list(), yielded one by one so callers
+        can stop early without building the full list.
+
+        Args:
+            manga_id: Manga UUID
+            translated_language: Filter by translated languages
+            groups: Filter by scanlation group UUIDs
 
-        return chapters
+        Returns:
+            Iterator of chapter dictionaries with chapter number and ID
+        """
+        volumes = self.get_aggregate(manga_id, translated_language, groups)
+        return (
+            {
+                "volume": volume,
+                "chapter": chapter_data.get("chapter"),
+                "id": chapter_data.get("id"),
+                "others": chapter_data.get("others", []),
+                "count": chapter_data.get("count", 0),
+            }
+            for volume, chapters in (
+                (volume_data.get("volume"), volume_data.get("chapters", {}))
+                for volume_data in volumes.values()
+            )
+            for chapter_data in chapters.values()
+        )
 
     def get_feed(
         self,
@@ -212,7 +377,7 @@ class MangaAPI:
         translated_language: Optional[List[str]] = None,
         original_language: Optional[List[str]] = None,
         excluded_original_language: Optional[List[str]] = None,
-        content_rating: Optional[List[str]] = None,
+        content_rating: Optional[List[ContentRating]] = None,
         excluded_groups: Optional[List[str]] = None,
         excluded_uploaders: Optional[List[str]] = None,
         include_future_updates: Optional[bool] = None,
@@ -245,40 +410,48 @@ class MangaAPI:
         Returns:
             List of chapter data
         """
-        params: Dict[str, Any] = {
-            "limit": limit,
-            "offset": offset,
-        }
-
-        if translated_language:
-            params["translatedLanguage[]"] = translated_language
-        if original_language:
-            params["originalLanguage[]"] = original_language
-        if excluded_original_language:
-            params["excludedOriginalLanguage[]"] = excluded_original_language
-        if content_rating:
-            params["contentRating[]"] = content_rating
-        if excluded_groups:
-            params["excludedGroups[]"] = excluded_groups
-        if excluded_uploaders:
-            params["excludedUploaders[]"] = excluded_uploaders
-        if include_future_updates is not None:
-            params["includeFutureUpdates"] = "1" if include_future_updates else "0"
-        if created_at_since:
-            params["createdAtSince"] = created_at_since
-        if updated_at_since:
-            params["updatedAtSince"] = updated_at_since
-        if publish_at_since:
-            params["publishAtSince"] = publish_at_since
-        if order:
-            params["order"] = order
-        if includes:
-            params["includes[]"] = includes
-
+        params = _feed_params(locals())
         response = self.client.get(f"/manga/{manga_id}/feed", params=params)
         return response.get("data", [])
 
-    def get_random(self, includes: Optional[List[str]] = None, content_rating: Optional[List[str]] = None) -> Manga:
+    def iter_feed(self, manga_id: str, **filters: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over one page of a manga's chapter feed.
+
+        Takes the same filters as get_feed(), but chapters are yielded as
+        the response streams in instead of after the whole page has been
+        downloaded.
+
+        Args:
+            manga_id: Manga UUID
+            **filters: Any get_feed() filter, including limit and offset
+
+        Returns:
+            Iterator of chapter data
+        """
+        params = _feed_params(filters)
+        return self.client.stream_items(f"/manga/{manga_id}/feed", params=params)
+
+    def get_feed_all(self, manga_id: str, **filters: Any) -> List[Dict[str, Any]]:
+        """
+        Get the complete chapter feed of a manga.
+
+        The first page reports the total; the remaining pages are fetched
+        concurrently (see HTTPClient.get_all_pages).
+
+        Args:
+            manga_id: Manga UUID
+            **filters: Any get_feed() filter except limit/offset
+
+        Returns:
+            List of all chapter data
+        """
+        filters.pop("limit", None)
+        filters.pop("offset", None)
+        params = _feed_params(filters)
+        return self.client.get_all_pages(f"/manga/{manga_id}/feed", params, page_size=500)
+
+    def get_random(self, includes: Optional[List[str]] = None, content_rating: Optional[List[ContentRating]] = None) -> Manga:
         """
         Get random manga.
 
@@ -305,5 +478,5 @@ class MangaAPI:
         Returns:
             List of tag dictionaries
         """
-        response = self.client.get("/manga/tag")
+        response = self.client.get("/manga/tag", cache_ttl=TAG_LIST_CACHE_TTL)
         return response.get("data", [])
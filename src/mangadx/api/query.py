@@ -0,0 +1,104 @@
+"""
+Query parameter helpers.
+
+This module builds MangaDx query strings from declarative tables that map
+method arguments to query keys.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Literal, Mapping, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# (argument name, query key) pairs
+ParamTable = Sequence[Tuple[str, str]]
+
+# Values accepted by MangaDx for the enum-like filters
+MangaStatus = Literal["ongoing", "completed", "hiatus", "cancelled"]
+ContentRating = Literal["safe", "suggestive", "erotica", "pornographic"]
+PublicationDemographic = Literal["shounen", "shoujo", "josei", "seinen", "none"]
+TagsMode = Literal["AND", "OR"]
+
+# Maximum number of values accepted by an ``ids[]`` filter
+ID_BATCH_SIZE = 100
+
+# Concurrent batch requests made by fetch_by_ids
+ID_FETCH_WORKERS = 5
+
+# Every content rating, so ``ids[]`` lookups are not silently filtered
+ALL_CONTENT_RATINGS: List[ContentRating] = ["safe", "suggestive", "erotica", "pornographic"]
+
+
+def build_params(
+    values: Mapping[str, Any],
+    table: ParamTable,
+    bool_table: ParamTable = (),
+) -> Dict[str, Any]:
+    """
+    Build query parameters from argument values.
+
+    Args:
+        values: Argument values, e.g. a method's ``locals()``
+        table: Filters sent as-is when set (empty values are skipped)
+        bool_table: Boolean filters sent as "1"/"0" when not None
+
+    Returns:
+        Query parameters dictionary
+    """
+    params = {key: values[name] for name, key in table if values.get(name)}
+    params.update({
+        key: "1" if values[name] else "0"
+        for name, key in bool_table
+        if values.get(name) is not None
+    })
+    return params
+
+
+def order_params(order: Optional[Mapping[str, str]]) -> Dict[str, str]:
+    """
+    Expand a sort order into MangaDx bracket-notation query keys.
+
+    Args:
+        order: Sort order, e.g. {"chapter": "asc"}
+
+    Returns:
+        Query parameters, e.g. {"order[chapter]": "asc"}
+    """
+    if not order:
+        return {}
+    return {f"order[{field}]": direction for field, direction in order.items()}
+
+
+def fetch_by_ids(
+    ids: Iterable[str],
+    fetch_batch: Callable[[List[str]], List[T]],
+    max_workers: int = ID_FETCH_WORKERS,
+) -> List[T]:
+    """
+    Fetch entities by ID in batches through a list endpoint.
+
+    N lookups cost ceil(N / ID_BATCH_SIZE) requests instead of N. When more
+    than one batch is needed, batches are requested concurrently on a small
+    thread pool; every request still goes through the client's rate limiter.
+
+    Args:
+        ids: Entity UUIDs (duplicates are fetched once)
+        fetch_batch: Callable fetching up to ID_BATCH_SIZE IDs at once
+        max_workers: Maximum number of concurrent batch requests
+
+    Returns:
+        Entities in the order of ``ids`` (IDs that do not exist are omitted)
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    batches = [
+        unique_ids[start:start + ID_BATCH_SIZE]
+        for start in range(0, len(unique_ids), ID_BATCH_SIZE)
+    ]
+    if len(batches) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+            results = list(executor.map(fetch_batch, batches))
+    else:
+        results = [fetch_batch(batch) for batch in batches]
+
+    found: Dict[str, T] = {item.id: item for result in results for item in result}
+    return [found[entity_id] for entity_id in unique_ids if entity_id in found]
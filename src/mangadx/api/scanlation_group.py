@@ -6,13 +6,18 @@ This module provides methods for interacting with scanlation group endpoints.
 
 from typing import Any, Dict, List, Optional
 
+from config import Settings
+
 from ..http_client import HTTPClient
 from ..models import ScanlationGroup
+from .query import fetch_by_ids, order_params
 
 
 class ScanlationGroupAPI:
     """API client for scanlation group operations."""
 
+    __slots__ = ("client",)
+
     def __init__(self, http_client: HTTPClient):
         """
         Initialize Scanlation Group API.
@@ -58,13 +63,12 @@ class ScanlationGroupAPI:
             params["name"] = name
         if focused_language:
             params["focusedLanguage"] = focused_language
-        if order:
-            params["order"] = order
+        params.update(order_params(order))
         if includes:
             params["includes[]"] = includes
 
         response = self.client.get("/group", params=params)
-        return [ScanlationGroup.from_dict(item) for item in response.get("data", [])]
+        return ScanlationGroup.from_dict_list(response.get("data", []))
 
     def get(self, group_id: str, includes: Optional[List[str]] = None) -> ScanlationGroup:
         """
@@ -81,5 +85,26 @@ class ScanlationGroupAPI:
         if includes:
             params["includes[]"] = includes
 
-        response = self.client.get(f"/group/{group_id}", params=params)
+        response = self.client.get(f"/group/{group_id}", params=params, cache_ttl=Settings.CACHE_EXPIRY)
         return ScanlationGroup.from_dict(response["data"])
+
+    def get_many(self, group_ids: List[str], includes: Optional[List[str]] = None) -> List[ScanlationGroup]:
+        """
+        Get several scanlation groups by ID with as few requests as possible.
+
+        IDs are fetched in batches of 100 through the ``ids[]`` filter of
+        ``/group``, so N lookups cost ceil(N / 100) round-trips.
+
+        Args:
+            group_ids: Group UUIDs
+            includes: Related entities to include
+
+        Returns:
+            List of ScanlationGroup objects in the order of ``group_ids``
+            (IDs that do not exist are omitted)
+        """
+        return fetch_by_ids(group_ids, lambda batch: self.list(
+            ids=batch,
+            includes=includes,
+            limit=len(batch),
+        ))
@@ -0,0 +1,80 @@
+"""
+File-backed JSON cache.
+
+This module provides a small key/value cache that stores JSON documents on
+disk, so API data can be reused across runs.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class JSONCache:
+    """Key/value cache storing one JSON file per key."""
+
+    def __init__(self, directory: Path):
+        """
+        Initialize JSON cache.
+
+        Args:
+            directory: Directory holding the cache files
+        """
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        """Get the file path for a key."""
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def get(self, key: str, ttl: float) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            ttl: Maximum age in seconds
+
+        Returns:
+            Cached value, or None if missing, expired or unreadable
+        """
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > ttl:
+                return None
+            with open(path, "rb") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value.
+
+        The file is written to a temporary name and moved into place, so
+        readers never see a partially written entry.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+        """
+        path = self._path(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(value, f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {key}: {e}")
@@ -17,14 +17,30 @@ from .api import (
     MangaAPI,
     ScanlationGroupAPI,
 )
+from .cache import JSONCache
 from .http_client import HTTPClient
 
 logger = logging.getLogger(__name__)
 
+# Seconds a successful ping is trusted before the API is checked again
+PING_CACHE_TTL = 60
+
 
 class MangaDxClient:
     """Main client for MangaDx API operations."""
 
+    __slots__ = (
+        "base_url",
+        "http_client",
+        "manga",
+        "chapter",
+        "author",
+        "cover",
+        "scanlation_group",
+        "at_home",
+        "_ping_cache",
+    )
+
     def __init__(
         self,
         base_url: Optional[str] = None,
@@ -48,22 +64,41 @@ class MangaDxClient:
         self.scanlation_group = ScanlationGroupAPI(self.http_client)
         self.at_home = AtHomeAPI(self.http_client)
 
+        # Successful pings are persisted so they survive across CLI runs
+        self._ping_cache = JSONCache(Settings.CACHE_DIR / "ping") if Settings.ENABLE_CACHE else None
+
         logger.info(f"MangaDx client initialized with base URL: {self.base_url}")
 
-    def ping(self) -> bool:
+    def ping(self, use_cache: bool = True) -> bool:
         """
         Ping the API to check if it's available.
 
+        A successful ping is recorded under Settings.CACHE_DIR and trusted for
+        PING_CACHE_TTL seconds per base URL, so re-running the CLI does not
+        pay another round-trip. Failures are never cached.
+
+        Args:
+            use_cache: Reuse a recent successful ping if there is one
+
         Returns:
             True if API is available, False otherwise
         """
+        if use_cache and self._ping_cache and self._ping_cache.get(self.base_url, PING_CACHE_TTL):
+            return True
+
         try:
             response = self.http_client.get("/ping", skip_rate_limit=True)
-            return response.get("result") == "ok" or "pong" in str(response).lower()
+            # /ping answers with a plain-text "pong", which the HTTP client
+            # hands back as {"content": "pong"}
+            available = response.get("result") == "ok" or response.get("content", "").strip() == "pong"
         except Exception as e:
             logger.error(f"Ping failed: {e}")
             return False
 
+        if available and self._ping_cache:
+            self._ping_cache.set(self.base_url, True)
+        return available
+
     def close(self) -> None:
         """Close the HTTP client session."""
         self.http_client.close()
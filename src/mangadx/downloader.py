@@ -5,32 +5,183 @@ This module handles downloading manga chapters with progress tracking,
 filtering, and multi-language support.
 """
 
+import json
 import logging
+import math
+import os
+import random
+import shutil
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
 from tqdm import tqdm
 
 from config import Settings
 
+from .cache import JSONCache
 from .client import MangaDxClient
 from .exceptions import DownloadException
+from .http_client import KeepAliveAdapter
+from .models import Manga
 
 logger = logging.getLogger(__name__)
 
+def _scan_dirs(path: Path) -> List[Tuple[str, Path]]:
+    """
+    List the subdirectories of a directory.
+
+    Uses os.scandir, whose entries already know their type, instead of
+    Path.iterdir() followed by a stat() per entry.
+
+    Args:
+        path: Directory to scan
+
+    Returns:
+        List of (name, path) tuples for each subdirectory
+    """
+    with os.scandir(path) as entries:
+        return [
+            (entry.name, Path(entry.path))
+            for entry in entries
+            if entry.is_dir(follow_symlinks=False)
+        ]
+
+
+# Per-manga file remembering the last volume-structure check
+STRUCTURE_STATE_FILE = ".mangadex_state.json"
+
+# Volume values MangaDx uses for chapters without a volume
+_NO_VOLUME = frozenset({"none", "null", ""})
+
+# Default for chapter metadata the caller did not supply (None is a valid
+# value: oneshots have no chapter number)
+_UNSET: Any = object()
+
+# Bytes read from the socket per write when streaming images to disk
+IMAGE_CHUNK_SIZE = 64 * 1024
+
+# MangaDx@Home image URLs are issued for 15 minutes; stay well inside that
+AT_HOME_CACHE_TTL = 10 * 60
+
+# Bounds of the image worker pool when it is sized automatically/adaptively
+MIN_WORKERS = 2
+MAX_WORKERS = 32
+
+
+def _default_workers() -> int:
+    """Default image worker count: 4 per CPU core, capped at MAX_WORKERS."""
+    return min(MAX_WORKERS, (os.cpu_count() or 4) * 4)
+
+
+def _chapter_number(chapter: Dict[str, Any]) -> float:
+    """Numeric chapter number of chapter data, or NaN if it has none."""
+    try:
+        return float(chapter.get("chapter") or "0")
+    except ValueError:
+        return math.nan
+
+
+# Fallback page extension and the longest suffix accepted as an extension
+DEFAULT_IMAGE_EXT = "jpg"
+MAX_EXT_LENGTH = 5
+
+
+def _ext(url: str) -> str:
+    """
+    File extension of an image URL, ignoring any query string or fragment.
+
+    Args:
+        url: Image URL (MangaDx@Home URLs may carry ``?token=...``)
+
+    Returns:
+        Extension without the dot, or DEFAULT_IMAGE_EXT if the URL has no
+        plausible one
+    """
+    ext = url.partition("#")[0].partition("?")[0].rpartition(".")[2]
+    if ext and len(ext) <= MAX_EXT_LENGTH and ext.isalnum():
+        return ext
+    return DEFAULT_IMAGE_EXT
+
+
+# Upper bound for the backoff between image download retries (seconds)
+RETRY_BACKOFF_CAP = 30.0
+
+
+def _is_retryable_status(response: Optional[requests.Response]) -> bool:
+    """Whether an HTTP error response is worth retrying (429 or 5xx)."""
+    return response is not None and (response.status_code == 429 or response.status_code >= 500)
+
+
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """
+    Compute the delay before the next download attempt.
+
+    Args:
+        attempt: Zero-based attempt that just failed
+        retry_after: Retry-After header value, if the server sent one
+
+    Returns:
+        Delay in seconds, with up to 25% random jitter so worker threads
+        do not retry in lockstep
+    """
+    delay = min(RETRY_BACKOFF_CAP, Settings.RETRY_DELAY * 2 ** attempt)
+    if retry_after:
+        try:
+            delay = max(delay, float(retry_after))
+        except ValueError:
+            pass  # HTTP-date form: fall back to exponential backoff
+    return delay + random.uniform(0, 0.25 * delay)
+
+
+class _WorkerLimit:
+    """
+    Counting semaphore whose limit can change while permits are held.
+
+    Shrinking takes effect as running downloads finish: no new download
+    starts until fewer than ``limit`` are active.
+    """
+
+    def __init__(self, limit: int):
+        self._cond = threading.Condition()
+        self._limit = limit
+        self._active = 0
+
+    def resize(self, limit: int) -> None:
+        """Set a new limit, waking waiters if it grew."""
+        with self._cond:
+            self._limit = limit
+            self._cond.notify_all()
+
+    def __enter__(self) -> "_WorkerLimit":
+        with self._cond:
+            while self._active >= self._limit:
+                self._cond.wait()
+            self._active += 1
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
 
 class DownloadManager:
     """Manager for downloading manga chapters."""
 
+    # Characters that are invalid in file names on common filesystems
+    _INVALID_TRANS = str.maketrans({char: "_" for char in '<>:"/\\|?*'})
+
     def __init__(
         self,
         client: MangaDxClient,
         download_dir: Optional[Path] = None,
         max_workers: Optional[int] = None,
         auto_update_structure: bool = True,
+        adaptive_workers: Optional[bool] = None,
     ):
         """
         Initialize download manager.
@@ -38,15 +189,168 @@ class DownloadManager:
         Args:
             client: MangaDx client instance
             download_dir: Directory for downloads (defaults to Settings.DOWNLOAD_DIR)
-            max_workers: Max concurrent downloads (defaults to Settings.MAX_CONCURRENT_DOWNLOADS)
+            max_workers: Max concurrent downloads (defaults to Settings.MAX_CONCURRENT_DOWNLOADS,
+                or 4 per CPU core when that is 0)
             auto_update_structure: Automatically update folder structure if changed (default: True)
+            adaptive_workers: Resize the image pool between chapters based on
+                throttling (defaults to Settings.ADAPTIVE_DOWNLOADS)
         """
         self.client = client
         self.download_dir = download_dir or Settings.DOWNLOAD_DIR
-        self.max_workers = max_workers or Settings.MAX_CONCURRENT_DOWNLOADS
+        self.max_workers = max_workers or Settings.MAX_CONCURRENT_DOWNLOADS or _default_workers()
+        self.adaptive_workers = Settings.ADAPTIVE_DOWNLOADS if adaptive_workers is None else adaptive_workers
         self.auto_update_structure = auto_update_structure
         self.download_dir.mkdir(parents=True, exist_ok=True)
 
+        # Chapter lists and image URLs survive interrupted/resumed runs
+        self._cache = JSONCache(Settings.CACHE_DIR / "downloader") if Settings.ENABLE_CACHE else None
+
+        # One pooled session for all image requests: pages of a chapter come
+        # from the same MangaDx@Home node, so connections are reused
+        self._session = requests.Session()
+        # Sized for the largest pool adaptive mode may grow to
+        pool_size = max(self.max_workers, MAX_WORKERS) if self.adaptive_workers else self.max_workers
+        adapter = KeepAliveAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size * 2,
+            max_retries=0,
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update({"User-Agent": Settings.USER_AGENT})
+        # (connect, read): a dead @Home node fails fast instead of using up
+        # the whole read timeout
+        self._timeout = (Settings.CONNECT_TIMEOUT, Settings.REQUEST_TIMEOUT)
+
+        # Image workers are kept alive across chapters instead of starting a
+        # fresh pool (and fresh threads) for every chapter. The pool is never
+        # swapped while chapters share it; adaptive mode resizes the limit on
+        # concurrently running downloads instead.
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._pool_size = pool_size
+        self._worker_limit = _WorkerLimit(self.max_workers)
+
+        # Image outcomes since the pool was last resized (adaptive mode)
+        self._window_attempts = 0
+        self._window_ok = 0
+        self._window_throttled = 0
+
+    def _get_chapters_list(self, manga_id: str, languages: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get a manga's chapter list, reusing a recent copy from the disk cache.
+
+        Args:
+            manga_id: Manga UUID
+            languages: Translated languages
+
+        Returns:
+            List of chapter dictionaries from get_chapters_list()
+        """
+        key = f"chapters:{manga_id}:{','.join(languages)}"
+        if self._cache is not None:
+            cached = self._cache.get(key, ttl=Settings.CACHE_EXPIRY)
+            if cached is not None:
+                return cached
+
+        chapters_data = self.client.manga.get_chapters_list(manga_id, translated_language=languages)
+        if self._cache is not None:
+            self._cache.set(key, chapters_data)
+        return chapters_data
+
+    def _get_image_urls(self, chapter_id: str, data_saver: bool) -> List[str]:
+        """
+        Get a chapter's image URLs, reusing a recent copy from the disk cache.
+
+        Args:
+            chapter_id: Chapter UUID
+            data_saver: Use data saver images (lower quality)
+
+        Returns:
+            List of full image URLs
+        """
+        key = f"images:{chapter_id}:{int(data_saver)}"
+        if self._cache is not None:
+            cached = self._cache.get(key, ttl=AT_HOME_CACHE_TTL)
+            if cached is not None:
+                return cached
+
+        image_urls = self.client.at_home.get_image_urls(chapter_id, data_saver)
+        if self._cache is not None and image_urls:
+            self._cache.set(key, image_urls)
+        return image_urls
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Get the shared image download pool, creating it on first use.
+
+        Returns:
+            Thread pool sized for the largest worker count in use (downloads
+            are further bounded by max_workers, see _download_image_limited)
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._pool_size,
+                    thread_name_prefix="mangadx-download",
+                )
+            return self._executor
+
+    def _record_attempt(self, ok: bool, throttled: bool = False) -> None:
+        """Record the outcome of one image request for adaptive sizing."""
+        if not self.adaptive_workers:
+            return
+        with self._executor_lock:
+            self._window_attempts += 1
+            self._window_ok += ok
+            self._window_throttled += throttled
+
+    def _tune_workers(self) -> None:
+        """
+        Resize the image pool from the outcomes seen since the last resize.
+
+        Shrinks by 2 after any 429 and grows by 2 while more than 95% of
+        requests succeed, within MIN_WORKERS..MAX_WORKERS. Only the limit on
+        concurrently running downloads changes, so chapters still submitting
+        to the shared pool are unaffected.
+        """
+        with self._executor_lock:
+            attempts, ok, throttled = self._window_attempts, self._window_ok, self._window_throttled
+            if not attempts:
+                return
+            self._window_attempts = self._window_ok = self._window_throttled = 0
+
+            if throttled:
+                delta = -2
+            elif ok / attempts > 0.95:
+                delta = 2
+            else:
+                return
+
+            workers = max(MIN_WORKERS, min(MAX_WORKERS, self.max_workers + delta))
+            if workers == self.max_workers:
+                return
+
+            logger.debug(f"Resizing image pool: {self.max_workers} -> {workers} workers")
+            self.max_workers = workers
+            self._worker_limit.resize(workers)
+
+    def close(self) -> None:
+        """Shut down the image download pool and its HTTP session."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        self._session.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
     def _sanitize_filename(self, filename: str) -> str:
         """
         Sanitize filename for filesystem.
@@ -57,13 +361,39 @@ class DownloadManager:
         Returns:
             Sanitized filename
         """
-        # Remove or replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, "_")
-        return filename.strip()
+        return filename.translate(self._INVALID_TRANS).strip()
 
-    def _auto_update_structure(self, manga_id: str, manga_title: str, languages: List[str]):
+    @staticmethod
+    def _resolve_title(manga: Manga, manga_id: str) -> str:
+        """
+        Get the best available title for a manga.
+
+        Prefers English, then Japanese, then romanized Japanese, then any
+        title, and falls back to a name derived from the manga ID.
+
+        Args:
+            manga: Manga object
+            manga_id: Manga UUID
+
+        Returns:
+            Manga title
+        """
+        title = manga.title
+        return (
+            title.get("en")
+            or title.get("ja")
+            or title.get("ja-ro")
+            or next(iter(title.values.values()), None)
+            or f"Manga_{manga_id[:8]}"
+        )
+
+    def _auto_update_structure(
+        self,
+        manga_id: str,
+        manga_title: str,
+        languages: List[str],
+        updated_at: Optional[str] = None,
+    ):
         """
         Automatically update folder structure if it exists.
 
@@ -71,35 +401,35 @@ class DownloadManager:
         1. Old folder names (language codes) and renames them
         2. Volume assignment changes and reorganizes chapters
 
+        The volume check is skipped when neither the manga's ``updatedAt``
+        nor the folder has changed since the last check (and that check is
+        younger than Settings.CACHE_EXPIRY).
+
         Args:
             manga_id: Manga UUID
             manga_title: Current manga title from API
             languages: Languages being downloaded
+            updated_at: Manga ``updatedAt`` timestamp from the API
         """
-        safe_title = self._sanitize_filename(manga_title)
-        manga_dir = self.download_dir / safe_title
+        manga_dir = self._get_manga_dir(manga_title)
 
         # Check if manga folder exists
         if not manga_dir.exists():
             # Check for old folder names (language codes or short names)
-            for existing_dir in self.download_dir.iterdir():
-                if not existing_dir.is_dir():
-                    continue
-
+            for old_name, existing_dir in _scan_dirs(self.download_dir):
                 # Check if this might be the same manga with old name
-                old_name = existing_dir.name.lower()
+                old_name = old_name.lower()
 
                 # Common language codes or very short names
                 if len(old_name) <= 3 or old_name in ["ja", "en", "es", "fr", "de", "ko", "zh", "pt", "pt-br"]:
                     # Check if it has chapters (likely a manga folder)
                     has_chapters = any(
-                        d.name.startswith("Ch.") or d.name.startswith("Vol.")
-                        for d in existing_dir.iterdir()
-                        if d.is_dir()
+                        name.startswith("Ch.") or name.startswith("Vol.")
+                        for name, _ in _scan_dirs(existing_dir)
                     )
 
                     if has_chapters:
-                        logger.info(f"Found old folder '{existing_dir.name}', renaming to '{safe_title}'")
+                        logger.info(f"Found old folder '{existing_dir.name}', renaming to '{manga_dir.name}'")
                         try:
                             existing_dir.rename(manga_dir)
                             logger.info("✓ Renamed folder to proper title")
@@ -109,9 +439,61 @@ class DownloadManager:
 
         # If manga folder exists, check for volume updates
         if manga_dir.exists():
-            self._update_volume_structure(manga_dir, manga_id, languages[0] if languages else "en")
+            language = languages[0] if languages else "en"
+            if updated_at and self._structure_is_current(manga_dir, updated_at, language):
+                logger.debug(f"Folder structure of '{manga_dir.name}' is up to date")
+                return
+            if self._update_volume_structure(manga_dir, manga_id, language) and updated_at:
+                self._save_structure_state(manga_dir, updated_at, language)
+
+    @staticmethod
+    def _structure_is_current(manga_dir: Path, updated_at: str, language: str) -> bool:
+        """
+        Check whether the last volume-structure check still applies.
 
-    def _update_volume_structure(self, manga_dir: Path, manga_id: str, language: str):
+        Args:
+            manga_dir: Manga directory path
+            updated_at: Manga ``updatedAt`` timestamp from the API
+            language: Language code the check was made for
+
+        Returns:
+            True if the manga, the language and the folder are unchanged
+        """
+        try:
+            with open(manga_dir / STRUCTURE_STATE_FILE, "rb") as f:
+                state = json.load(f)
+            return (
+                state.get("updated_at") == updated_at
+                and state.get("language") == language
+                and state.get("scanned_mtime") == manga_dir.stat().st_mtime
+                and time.time() - state.get("checked_at", 0) < Settings.CACHE_EXPIRY
+            )
+        except (OSError, ValueError, AttributeError):
+            return False
+
+    @staticmethod
+    def _save_structure_state(manga_dir: Path, updated_at: str, language: str) -> None:
+        """
+        Remember a completed volume-structure check.
+
+        Args:
+            manga_dir: Manga directory path
+            updated_at: Manga ``updatedAt`` timestamp from the API
+            language: Language code the check was made for
+        """
+        state_path = manga_dir / STRUCTURE_STATE_FILE
+        try:
+            state = {"updated_at": updated_at, "language": language, "checked_at": time.time()}
+            with open(state_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            # Writing the file touches the folder: record the mtime afterwards
+            state["scanned_mtime"] = manga_dir.stat().st_mtime
+            with open(state_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+        except OSError as e:
+            logger.debug(f"Could not save structure state: {e}")
+
+    def _update_volume_structure(self, manga_dir: Path, manga_id: str, language: str) -> bool:
         """
         Update volume structure based on current API data.
 
@@ -119,70 +501,54 @@ class DownloadManager:
             manga_dir: Manga directory path
             manga_id: Manga UUID
             language: Language code
+
+        Returns:
+            True if the structure was checked (and updated where needed)
         """
         try:
-            # Get current local structure
-            local_structure = {}
-
-            # Scan chapters in root
-            for item in manga_dir.iterdir():
-                if item.is_dir() and item.name.startswith("Ch."):
-                    chapter_num = item.name.replace("Ch.", "")
-                    local_structure[chapter_num] = {"volume": None, "path": item}
-
-            # Scan chapters in volume folders
-            for vol_dir in manga_dir.iterdir():
-                if vol_dir.is_dir() and vol_dir.name.startswith("Vol."):
-                    vol_num = vol_dir.name.replace("Vol.", "")
-                    for chapter_dir in vol_dir.iterdir():
-                        if chapter_dir.is_dir() and chapter_dir.name.startswith("Ch."):
-                            chapter_num = chapter_dir.name.replace("Ch.", "")
-                            local_structure[chapter_num] = {"volume": vol_num, "path": chapter_dir}
+            # Get current local structure: chapter number -> (volume, path)
+            local_structure: Dict[str, Tuple[Optional[str], Path]] = {}
+
+            # Scan chapters in root and in volume folders in one pass; a
+            # chapter found inside a volume takes precedence over the root
+            for name, item in _scan_dirs(manga_dir):
+                if name.startswith("Ch."):
+                    local_structure.setdefault(name[3:], (None, item))
+                elif name.startswith("Vol."):
+                    vol_num = name[4:]
+                    for chapter_name, chapter_dir in _scan_dirs(item):
+                        if chapter_name.startswith("Ch."):
+                            local_structure[chapter_name[3:]] = (vol_num, chapter_dir)
 
             if not local_structure:
-                return  # No chapters to update
+                return True  # No chapters to update
 
             # Get current API structure
-            chapters_data = self.client.manga.get_chapters_list(
-                manga_id,
-                translated_language=[language]
-            )
+            chapters_data = self._get_chapters_list(manga_id, [language])
 
-            api_structure = {}
-            for chapter in chapters_data:
-                chapter_num = chapter.get("chapter")
-                volume = chapter.get("volume")
+            api_structure = {chapter.get("chapter"): chapter.get("volume") for chapter in chapters_data}
 
-                # Normalize volume
-                if volume and volume.lower() not in ["none", "null", ""]:
-                    api_structure[chapter_num] = volume
-                else:
-                    api_structure[chapter_num] = None
-
-            # Find changes
+            # Find changes: (chapter, from_vol, to_vol, path)
             changes = []
             for chapter_num, api_vol in api_structure.items():
-                if chapter_num in local_structure:
-                    local_vol = local_structure[chapter_num]["volume"]
-                    if local_vol != api_vol:
-                        changes.append({
-                            "chapter": chapter_num,
-                            "from_vol": local_vol,
-                            "to_vol": api_vol,
-                            "path": local_structure[chapter_num]["path"]
-                        })
+                local = local_structure.get(chapter_num)
+                if local is None:
+                    continue
+
+                # Normalize volume
+                if not api_vol or api_vol.lower() in _NO_VOLUME:
+                    api_vol = None
+
+                if local[0] != api_vol:
+                    changes.append((chapter_num, local[0], api_vol, local[1]))
 
             if not changes:
-                return  # No updates needed
+                return True  # No updates needed
 
             # Apply changes
             logger.info(f"Detected {len(changes)} volume assignment changes, updating structure...")
 
-            for change in changes:
-                chapter_num = change["chapter"]
-                from_vol = change["from_vol"]
-                to_vol = change["to_vol"]
-                old_path = change["path"]
+            for chapter_num, from_vol, to_vol, old_path in changes:
 
                 # Determine new path
                 if to_vol:
@@ -196,7 +562,6 @@ class DownloadManager:
 
                     # Move chapter folder
                     if not new_path.exists():
-                        import shutil
                         shutil.move(str(old_path), str(new_path))
 
                         from_str = f"Vol.{from_vol}" if from_vol else "root"
@@ -213,11 +578,31 @@ class DownloadManager:
                     logger.warning(f"Could not move Ch.{chapter_num}: {e}")
 
             logger.info("✓ Structure updated successfully")
+            return True
 
         except Exception as e:
             logger.warning(f"Could not update volume structure: {e}")
+            return False
 
-    def _get_chapter_dir(self, manga_title: str, volume: Optional[str], chapter: str) -> Path:
+    def _get_manga_dir(self, manga_title: str) -> Path:
+        """
+        Get directory path for a manga.
+
+        Args:
+            manga_title: Manga title
+
+        Returns:
+            Path to manga directory
+        """
+        return self.download_dir / self._sanitize_filename(manga_title)
+
+    def _get_chapter_dir(
+        self,
+        manga_title: str,
+        volume: Optional[str],
+        chapter: str,
+        manga_dir: Optional[Path] = None,
+    ) -> Path:
         """
         Get directory path for chapter.
 
@@ -225,69 +610,101 @@ class DownloadManager:
             manga_title: Manga title
             volume: Volume number (optional)
             chapter: Chapter number
+            manga_dir: Precomputed manga directory (derived from manga_title if omitted)
 
         Returns:
             Path to chapter directory
         """
-        safe_title = self._sanitize_filename(manga_title)
+        if manga_dir is None:
+            manga_dir = self._get_manga_dir(manga_title)
 
         # Only create volume folder if volume is specified and not "none"
-        if volume and volume.lower() not in ["none", "null", ""]:
-            chapter_dir = self.download_dir / safe_title / f"Vol.{volume}" / f"Ch.{chapter}"
-        else:
-            # No volume or volume is "none" - put chapters directly under manga folder
-            chapter_dir = self.download_dir / safe_title / f"Ch.{chapter}"
+        if volume and volume.lower() not in _NO_VOLUME:
+            return manga_dir / f"Vol.{volume}" / f"Ch.{chapter}"
 
-        return chapter_dir
+        # No volume or volume is "none" - put chapters directly under manga folder
+        return manga_dir / f"Ch.{chapter}"
 
-    def _download_image(
-        self,
-        url: str,
-        file_path: Path,
-        retry_count: int = 0,
-    ) -> bool:
+    def _download_image_limited(self, url: str, file_path: Path) -> bool:
+        """Run _download_image once fewer than max_workers downloads are active."""
+        with self._worker_limit:
+            return self._download_image(url, file_path)
+
+    def _download_image(self, url: str, file_path: Path) -> bool:
         """
         Download single image.
 
+        Timeouts, connection errors, 429 and 5xx responses are retried with
+        jittered exponential backoff (honouring Retry-After); other errors
+        fail immediately.
+
         Args:
             url: Image URL
             file_path: Destination file path
-            retry_count: Current retry attempt
 
         Returns:
             True if successful, False otherwise
         """
-        try:
-            response = requests.get(
-                url,
-                timeout=Settings.REQUEST_TIMEOUT,
-                headers={"User-Agent": Settings.USER_AGENT},
-            )
-            response.raise_for_status()
+        for attempt in range(Settings.MAX_RETRIES + 1):
+            retry_after = None
+            try:
+                with self._session.get(url, timeout=self._timeout, stream=True) as response:
+                    if response.status_code == 429 or response.status_code >= 500:
+                        retry_after = response.headers.get("Retry-After")
+                    response.raise_for_status()
+
+                    file_path.parent.mkdir(parents=True, exist_ok=True)
+                    # Stream into a temporary file so an interrupted download is
+                    # never mistaken for a finished image
+                    part_path = file_path.with_name(file_path.name + ".part")
+                    # Let urllib3 undo any transfer encoding while copying
+                    response.raw.decode_content = True
+                    try:
+                        with open(part_path, "wb") as f:
+                            shutil.copyfileobj(response.raw, f, IMAGE_CHUNK_SIZE)
+                        part_path.replace(file_path)
+                    except BaseException:
+                        part_path.unlink(missing_ok=True)
+                        raise
+
+                self._record_attempt(ok=True)
+                return True
+
+            except requests.HTTPError as e:
+                self._record_attempt(ok=False, throttled=e.response is not None and e.response.status_code == 429)
+                if retry_after is None and not _is_retryable_status(e.response):
+                    logger.error(f"Failed to download {file_path.name}: {e}")
+                    return False
+                error = e
+            except requests.exceptions.SSLError as e:
+                logger.error(f"Failed to download {file_path.name}: {e}")
+                return False
+            except (requests.Timeout, requests.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+                self._record_attempt(ok=False)
+                error = e
+            except Exception as e:
+                logger.error(f"Failed to download {file_path.name}: {e}")
+                return False
 
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(file_path, "wb") as f:
-                f.write(response.content)
+            if attempt == Settings.MAX_RETRIES:
+                logger.error(f"Failed to download {file_path.name}: {error}")
+                return False
 
-            return True
+            delay = _retry_delay(attempt, retry_after)
+            logger.warning(f"Retry {attempt + 1}/{Settings.MAX_RETRIES} for {file_path.name} in {delay:.1f}s: {error}")
+            time.sleep(delay)
 
-        except Exception as e:
-            if retry_count < Settings.MAX_RETRIES:
-                logger.warning(f"Retry {retry_count + 1}/{Settings.MAX_RETRIES} for {file_path.name}: {e}")
-                time.sleep(Settings.RETRY_DELAY)
-                return self._download_image(url, file_path, retry_count + 1)
-            else:
-                logger.error(f"Failed to download {file_path.name}: {e}")
-                return False
+        return False
 
     def download_chapter(
         self,
         chapter_id: str,
         manga_title: str,
-        volume: Optional[str] = None,
-        chapter_number: Optional[str] = None,
+        volume: Optional[str] = _UNSET,
+        chapter_number: Optional[str] = _UNSET,
         data_saver: bool = False,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        manga_dir: Optional[Path] = None,
     ) -> Path:
         """
         Download a single chapter.
@@ -296,9 +713,11 @@ class DownloadManager:
             chapter_id: Chapter UUID
             manga_title: Manga title for directory structure
             volume: Volume number (optional)
-            chapter_number: Chapter number (optional)
+            chapter_number: Chapter number; when omitted, volume and chapter
+                number are fetched from the API (None is kept as "Unknown")
             data_saver: Use data saver images (lower quality)
             progress_callback: Callback function for progress updates
+            manga_dir: Precomputed manga directory (derived from manga_title if omitted)
 
         Returns:
             Path to downloaded chapter directory
@@ -308,59 +727,61 @@ class DownloadManager:
         """
         try:
             # Get chapter info if not provided
-            if not chapter_number:
+            if chapter_number is _UNSET:
                 chapter = self.client.chapter.get(chapter_id)
-                chapter_number = chapter.chapter or "Unknown"
-                volume = volume or chapter.volume
+                chapter_number = chapter.chapter
+                if volume is _UNSET or not volume:
+                    volume = chapter.volume
+            elif volume is _UNSET:
+                volume = None
+            chapter_number = chapter_number or "Unknown"
 
             # Get image URLs
-            image_urls = self.client.at_home.get_image_urls(chapter_id, data_saver)
+            image_urls = self._get_image_urls(chapter_id, data_saver)
 
             if not image_urls:
                 raise DownloadException(f"No images found for chapter {chapter_id}")
 
             # Create chapter directory
-            chapter_dir = self._get_chapter_dir(manga_title, volume, chapter_number)
+            chapter_dir = self._get_chapter_dir(manga_title, volume, chapter_number, manga_dir)
             chapter_dir.mkdir(parents=True, exist_ok=True)
 
-            # Check for existing images
-            existing_images = set(chapter_dir.glob("*.*"))
-            if len(existing_images) == len(image_urls):
-                logger.info(f"Chapter {chapter_number} already downloaded")
-                return chapter_dir
-
-            # Download images
-            logger.info(f"Downloading chapter {chapter_number} ({len(image_urls)} images)")
+            # Check for existing images (one directory read instead of a
+            # stat() per page)
+            with os.scandir(chapter_dir) as entries:
+                existing_names = {entry.name for entry in entries if entry.is_file()}
 
             download_tasks = []
             for idx, url in enumerate(image_urls, 1):
-                ext = url.split(".")[-1]
-                file_path = chapter_dir / f"{idx:03d}.{ext}"
+                file_name = f"{idx:03d}.{_ext(url)}"
 
-                if not file_path.exists():
-                    download_tasks.append((url, file_path))
+                if file_name not in existing_names:
+                    download_tasks.append((url, chapter_dir / file_name))
 
             if not download_tasks:
-                logger.info(f"All images already exist for chapter {chapter_number}")
+                logger.info(f"Chapter {chapter_number} already downloaded")
                 return chapter_dir
 
+            # Download images
+            logger.info(f"Downloading chapter {chapter_number} ({len(download_tasks)}/{len(image_urls)} images)")
+
             # Download with progress bar
             success_count = 0
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = {
-                    executor.submit(self._download_image, url, path): (url, path)
-                    for url, path in download_tasks
-                }
-
-                with tqdm(total=len(download_tasks), desc=f"Ch.{chapter_number}", unit="img") as pbar:
-                    for future in as_completed(futures):
-                        success = future.result()
-                        if success:
-                            success_count += 1
-                        pbar.update(1)
-
-                        if progress_callback:
-                            progress_callback(success_count, len(download_tasks))
+            executor = self._get_executor()
+            futures = {
+                executor.submit(self._download_image_limited, url, path): (url, path)
+                for url, path in download_tasks
+            }
+
+            with tqdm(total=len(download_tasks), desc=f"Ch.{chapter_number}", unit="img") as pbar:
+                for future in as_completed(futures):
+                    success = future.result()
+                    if success:
+                        success_count += 1
+                    pbar.update(1)
+
+                    if progress_callback:
+                        progress_callback(success_count, len(download_tasks))
 
             if success_count < len(download_tasks):
                 logger.warning(
@@ -369,11 +790,64 @@ class DownloadManager:
             else:
                 logger.info(f"Successfully downloaded chapter {chapter_number}")
 
+            if self.adaptive_workers:
+                self._tune_workers()
+
             return chapter_dir
 
         except Exception as e:
             raise DownloadException(f"Failed to download chapter {chapter_id}: {e}")
 
+    def _download_chapters(
+        self,
+        chapters_data: List[Dict[str, Any]],
+        manga_title: str,
+        data_saver: bool,
+        stats: Dict[str, Any],
+    ) -> None:
+        """
+        Download several chapters concurrently and update stats in place.
+
+        Up to Settings.CHAPTER_CONCURRENCY chapters are in flight at once.
+        Their images share the manager's image pool, so total concurrent
+        image requests stay bounded by max_workers, and the API calls made
+        per chapter go through the client's rate limiter.
+
+        Args:
+            chapters_data: Chapter entries from get_chapters_list()
+            manga_title: Manga title for directory structure
+            data_saver: Use data saver images (lower quality)
+            stats: Statistics dictionary with "downloaded" and "failed" counters
+        """
+        if not chapters_data:
+            return
+
+        # Sanitize the title once for the whole batch
+        manga_dir = self._get_manga_dir(manga_title)
+
+        workers = min(Settings.CHAPTER_CONCURRENCY, len(chapters_data))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mangadx-chapter") as executor:
+            futures = {
+                executor.submit(
+                    self.download_chapter,
+                    chapter_id=chapter_data["id"],
+                    manga_title=manga_title,
+                    volume=chapter_data.get("volume"),
+                    chapter_number=chapter_data.get("chapter"),
+                    data_saver=data_saver,
+                    manga_dir=manga_dir,
+                ): chapter_data
+                for chapter_data in chapters_data
+            }
+
+            for future in tqdm(as_completed(futures), total=len(futures), desc="Chapters", unit="ch"):
+                try:
+                    future.result()
+                    stats["downloaded"] += 1
+                except Exception as e:
+                    logger.error(f"Failed to download chapter {futures[future].get('chapter')}: {e}")
+                    stats["failed"] += 1
+
     def download_manga(
         self,
         manga_id: str,
@@ -402,44 +876,34 @@ class DownloadManager:
             # Get manga info
             manga = self.client.manga.get(manga_id, includes=["cover_art"])
 
-            # Get best available title (prefer English, then Japanese, then romanized, then any)
-            manga_title = manga.title.get("en")
-            if not manga_title:
-                manga_title = manga.title.get("ja")
-            if not manga_title:
-                manga_title = manga.title.get("ja-ro")
-            if not manga_title and manga.title.values:
-                manga_title = list(manga.title.values.values())[0]
-            if not manga_title:
-                manga_title = f"Manga_{manga_id[:8]}"
+            manga_title = self._resolve_title(manga, manga_id)
 
             logger.info(f"Downloading manga: {manga_title}")
 
             # Auto-update existing folder structure if enabled
             if self.auto_update_structure:
-                self._auto_update_structure(manga_id, manga_title, languages or [Settings.DEFAULT_LANGUAGE])
+                self._auto_update_structure(
+                    manga_id,
+                    manga_title,
+                    languages or [Settings.DEFAULT_LANGUAGE],
+                    updated_at=manga.updated_at,
+                )
 
             # Get chapters
             languages = languages or [Settings.DEFAULT_LANGUAGE]
-            chapters_data = self.client.manga.get_chapters_list(
-                manga_id,
-                translated_language=languages,
-            )
+            chapters_data = self._get_chapters_list(manga_id, languages)
 
             if not chapters_data:
                 raise DownloadException(f"No chapters found for manga {manga_id}")
 
-            # Apply filters
-            if volume_filter:
-                chapters_data = [
-                    ch for ch in chapters_data
-                    if ch.get("volume") in volume_filter
-                ]
-
-            if chapter_filter:
+            # Apply filters (set lookups, single pass over the chapter list)
+            if volume_filter or chapter_filter:
+                volume_set = set(volume_filter) if volume_filter else None
+                chapter_set = set(chapter_filter) if chapter_filter else None
                 chapters_data = [
                     ch for ch in chapters_data
-                    if ch.get("chapter") in chapter_filter
+                    if (volume_set is None or ch.get("volume") in volume_set)
+                    and (chapter_set is None or ch.get("chapter") in chapter_set)
                 ]
 
             if not chapters_data:
@@ -456,24 +920,7 @@ class DownloadManager:
                 "skipped": 0,
             }
 
-            for chapter_data in tqdm(chapters_data, desc="Chapters", unit="ch"):
-                try:
-                    self.download_chapter(
-                        chapter_id=chapter_data["id"],
-                        manga_title=manga_title,
-                        volume=chapter_data.get("volume"),
-                        chapter_number=chapter_data.get("chapter"),
-                        data_saver=data_saver,
-                    )
-                    stats["downloaded"] += 1
-
-                    # Rate limiting between chapters (extra delay to avoid hitting limits)
-                    # MangaDx allows ~5 req/s, but we add extra delay between chapters
-                    time.sleep(Settings.RATE_LIMIT_DELAY * 2)
-
-                except Exception as e:
-                    logger.error(f"Failed to download chapter {chapter_data.get('chapter')}: {e}")
-                    stats["failed"] += 1
+            self._download_chapters(chapters_data, manga_title, data_saver, stats)
 
             logger.info(
                 f"Download complete: {stats['downloaded']}/{stats['total_chapters']} chapters"
@@ -508,34 +955,20 @@ class DownloadManager:
         language = language or Settings.DEFAULT_LANGUAGE
 
         # Get all chapters
-        chapters_data = self.client.manga.get_chapters_list(
-            manga_id,
-            translated_language=[language],
-        )
+        chapters_data = self._get_chapters_list(manga_id, [language])
 
         # Filter by range
-        filtered_chapters = []
-        for ch in chapters_data:
-            try:
-                ch_num = float(ch.get("chapter", "0"))
-                if start_chapter <= ch_num <= end_chapter:
-                    filtered_chapters.append(ch)
-            except ValueError:
-                continue
+        start_chapter = float(start_chapter)
+        end_chapter = float(end_chapter)
+        filtered_chapters = [
+            ch for ch in chapters_data
+            if start_chapter <= _chapter_number(ch) <= end_chapter
+        ]
 
         # Get manga info
         manga = self.client.manga.get(manga_id)
 
-        # Get best available title (prefer English, then Japanese, then romanized, then any)
-        manga_title = manga.title.get("en")
-        if not manga_title:
-            manga_title = manga.title.get("ja")
-        if not manga_title:
-            manga_title = manga.title.get("ja-ro")
-        if not manga_title and manga.title.values:
-            manga_title = list(manga.title.values.values())[0]
-        if not manga_title:
-            manga_title = f"Manga_{manga_id[:8]}"
+        manga_title = self._resolve_title(manga, manga_id)
 
         # Download filtered chapters
         stats = {
@@ -545,20 +978,6 @@ class DownloadManager:
             "failed": 0,
         }
 
-        for chapter_data in tqdm(filtered_chapters, desc="Chapters", unit="ch"):
-            try:
-                self.download_chapter(
-                    chapter_id=chapter_data["id"],
-                    manga_title=manga_title,
-                    volume=chapter_data.get("volume"),
-                    chapter_number=chapter_data.get("chapter"),
-                    data_saver=data_saver,
-                )
-                stats["downloaded"] += 1
-                time.sleep(Settings.RATE_LIMIT_DELAY)
-
-            except Exception as e:
-                logger.error(f"Failed to download chapter {chapter_data.get('chapter')}: {e}")
-                stats["failed"] += 1
+        self._download_chapters(filtered_chapters, manga_title, data_saver, stats)
 
         return stats
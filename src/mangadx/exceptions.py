@@ -10,6 +10,9 @@ from typing import Any, Dict, Optional
 class MangaDxException(Exception):
     """Base exception for all MangaDx API errors."""
 
+    # Slotted attributes keep the lazily created instance __dict__ unallocated
+    __slots__ = ("message", "status_code", "response_data")
+
     def __init__(self, message: str, status_code: Optional[int] = None, response_data: Optional[Dict[str, Any]] = None):
         """
         Initialize MangaDx exception.
@@ -30,30 +33,45 @@ class MangaDxException(Exception):
             return f"[{self.status_code}] {self.message}"
         return self.message
 
+    def __reduce__(self):
+        """Pickle slot values too (BaseException only pickles __dict__)."""
+        state = {
+            name: getattr(self, name, None)
+            for klass in type(self).__mro__
+            for name in klass.__dict__.get("__slots__", ())
+        }
+        return type(self), (self.message,), state
+
 
 class APIException(MangaDxException):
     """Exception raised for general API errors."""
-    pass
+
+    __slots__ = ()
 
 
 class AuthenticationException(MangaDxException):
     """Exception raised for authentication failures."""
-    pass
+
+    __slots__ = ()
 
 
 class AuthorizationException(MangaDxException):
     """Exception raised for authorization failures (403 Forbidden)."""
-    pass
+
+    __slots__ = ()
 
 
 class NotFoundException(MangaDxException):
     """Exception raised when a resource is not found (404)."""
-    pass
+
+    __slots__ = ()
 
 
 class RateLimitException(MangaDxException):
     """Exception raised when rate limit is exceeded."""
 
+    __slots__ = ("retry_after",)
+
     def __init__(self, message: str, retry_after: Optional[int] = None, **kwargs):
         """
         Initialize rate limit exception.
@@ -69,24 +87,29 @@ class RateLimitException(MangaDxException):
 
 class ValidationException(MangaDxException):
     """Exception raised for validation errors (400 Bad Request)."""
-    pass
+
+    __slots__ = ()
 
 
 class ServerException(MangaDxException):
     """Exception raised for server errors (5xx)."""
-    pass
+
+    __slots__ = ()
 
 
 class NetworkException(MangaDxException):
     """Exception raised for network-related errors."""
-    pass
+
+    __slots__ = ()
 
 
 class TimeoutException(MangaDxException):
     """Exception raised when a request times out."""
-    pass
+
+    __slots__ = ()
 
 
 class DownloadException(MangaDxException):
     """Exception raised during download operations."""
-    pass
+
+    __slots__ = ()
@@ -5,13 +5,18 @@ This module provides a robust HTTP client with retry logic, rate limiting,
 and error handling.
 """
 
+import json
 import logging
+import socket
+import threading
 import time
-from typing import Any, Dict, Optional, Union
-from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
+from urllib.parse import urlencode
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 from urllib3.util.retry import Retry
 
 from config import Settings
@@ -20,6 +25,7 @@ from .exceptions import (
     APIException,
     AuthenticationException,
     AuthorizationException,
+    MangaDxException,
     NetworkException,
     NotFoundException,
     RateLimitException,
@@ -28,11 +34,218 @@ from .exceptions import (
     ValidationException,
 )
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import brotli  # noqa: F401  - enables "br" decoding in urllib3
+    _ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:  # pragma: no cover - optional dependency
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = "br, gzip, deflate"
+    except ImportError:
+        _ACCEPT_ENCODING = "gzip, deflate"
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+try:
+    import diskcache
+except ImportError:  # pragma: no cover - optional dependency
+    diskcache = None
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+# orjson parses large feed/list payloads several times faster than the
+# stdlib; both raise a ValueError subclass on malformed input
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize a JSON request body (compact UTF-8, via orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _decode_body(content: bytes) -> Any:
+    """Parse a response body as JSON, wrapping non-JSON text as {"content": ...}."""
+    if not content:
+        return {}
+    try:
+        return _json_loads(content)
+    except ValueError:
+        return {"content": content.decode("utf-8", errors="replace")}
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert query parameter values into a hashable form for cache keys."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _encode_params(params: Dict[str, Any]) -> str:
+    """
+    Encode query parameters into a query string.
+
+    List values are expanded into repeated keys (``includes[]=a&includes[]=b``)
+    and None values are dropped, matching what requests would send.
+    """
+    items: List[Tuple[str, Any]] = []
+    for key, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            items.extend((key, item) for item in value)
+        else:
+            items.append((key, value))
+    return urlencode(items)
+
+
+# MangaDx rejects collection requests where offset + limit exceeds this
+MAX_COLLECTION_RESULTS = 10000
+
+# Maximum number of responses kept by the in-process GET cache
+RESPONSE_CACHE_MAXSIZE = 8192
+
+# Pages fetched concurrently by get_all_pages (MangaDx allows ~5 req/s)
+PAGE_FETCH_WORKERS = 5
+
+# Worker threads of the executor shared by HTTPClient.map
+MAP_WORKERS = 8
+
+# Shared across clients: Retry objects are immutable (urllib3 creates a new
+# one per attempt). urllib3 sleeps and retries 429/5xx itself, honouring
+# Retry-After; once retries run out the last response is returned (instead
+# of a MaxRetryError) so _handle_response raises the matching exception.
+# POST is not idempotent and is never retried.
+_RETRY_KWARGS: Dict[str, Any] = {
+    "total": Settings.MAX_RETRIES,
+    "backoff_factor": Settings.RETRY_DELAY,
+    "status_forcelist": frozenset({429, 500, 502, 503, 504}),
+    "allowed_methods": frozenset({"HEAD", "GET", "OPTIONS", "PUT", "DELETE"}),
+    "respect_retry_after_header": True,
+    "raise_on_status": False,
+}
+try:
+    # Jitter spreads out retries from clients sharing an IP (urllib3 >= 2.0)
+    _RETRY = Retry(backoff_jitter=0.5, **_RETRY_KWARGS)
+except TypeError:  # pragma: no cover - urllib3 1.26
+    _RETRY = Retry(**_RETRY_KWARGS)
+
+# Client errors that map directly to an exception type. 429 and 5xx are
+# handled separately in _handle_response.
+_STATUS_EXCEPTIONS = {
+    400: ValidationException,
+    401: AuthenticationException,
+    403: AuthorizationException,
+    404: NotFoundException,
+}
+
+
+# TCP keep-alive probes stop idle pooled connections from being dropped by
+# NAT/firewalls between bursts of requests, so the next request does not pay
+# a fresh TCP + TLS handshake. urllib3's defaults already disable Nagle
+# (TCP_NODELAY). The idle/interval knobs are Linux-specific.
+_KEEPALIVE_SOCKET_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)] + [
+    (socket.IPPROTO_TCP, getattr(socket, name), value)
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 30))
+    if hasattr(socket, name)
+]
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections use TCP keep-alive."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        """Create the pool manager with keep-alive socket options."""
+        kwargs.setdefault(
+            "socket_options", HTTPConnection.default_socket_options + _KEEPALIVE_SOCKET_OPTIONS
+        )
+        super().init_poolmanager(*args, **kwargs)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Callers reserve a token under a short lock and sleep outside it, so one
+    thread waiting for its slot never blocks others from reserving theirs,
+    and a request can be in flight while the next one is being scheduled.
+    """
+
+    def __init__(self, interval: float, capacity: int = 1):
+        """
+        Initialize the bucket.
+
+        Args:
+            interval: Seconds needed to refill one token
+            capacity: Maximum number of tokens (burst size)
+        """
+        self.interval = interval
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it becomes available."""
+        if self.interval <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated_at) / self.interval,
+            )
+            self._updated_at = now
+            # Going negative reserves a future token for this caller
+            self._tokens -= 1
+            wait = -self._tokens * self.interval if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Drain the bucket so no token is handed out for the next ``seconds``.
+
+        Args:
+            seconds: Time to hold back all callers (e.g. a Retry-After value)
+        """
+        if self.interval <= 0 or seconds <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated_at) / self.interval,
+                1 - seconds / self.interval,
+            )
+            self._updated_at = now
+
 
 class HTTPClient:
-    """HTTP client with retry logic and error handling."""
+    """
+    HTTP client with retry logic and error handling.
+
+    A single instance is safe to share across threads: rate limiting, the
+    response caches and lazily created helpers are guarded by locks, and
+    the pooled session hands each request its own connection.
+    """
 
     def __init__(self, base_url: str = None, access_token: Optional[str] = None):
         """
@@ -43,9 +256,30 @@ class HTTPClient:
             access_token: Optional access token for authenticated requests
         """
         self.base_url = base_url or Settings.BASE_URL
-        self.access_token = access_token
+        # Normalized prefix so request URLs are built by plain concatenation
+        self._base = self.base_url.rstrip("/") + "/"
         self.session = self._create_session()
-        self.last_request_time = 0
+        self.access_token = access_token  # sets the session's Authorization header
+        # Settings read once instead of on every request
+        self._connect_timeout = Settings.CONNECT_TIMEOUT
+        self._read_timeout = Settings.REQUEST_TIMEOUT
+        self._rate_limiter = TokenBucket(Settings.RATE_LIMIT_DELAY, Settings.RATE_LIMIT_BURST)
+
+        # GET responses of cacheable endpoints: key -> (expires_at, body).
+        # Raw bodies are kept and parsed per hit, so every caller gets its
+        # own dicts and nobody can alter what later callers receive.
+        self._response_cache: Dict[Hashable, Tuple[float, bytes]] = {}
+        self._cache_lock = threading.Lock()
+
+        # Optional on-disk layer under the in-memory cache, so catalogue data
+        # (tags, manga metadata) survives between runs
+        self._disk_cache = None
+        if Settings.ENABLE_CACHE and diskcache is not None:
+            self._disk_cache = diskcache.Cache(str(Settings.CACHE_DIR / "responses"))
+
+        # Created on first use by map(); shared by every API module
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
 
     def _create_session(self) -> requests.Session:
         """
@@ -56,52 +290,74 @@ class HTTPClient:
         """
         session = requests.Session()
 
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=Settings.MAX_RETRIES,
-            backoff_factor=Settings.RETRY_DELAY,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "DELETE"],
+        retry_strategy = _RETRY
+
+        # One pooled adapter shared by every API module: sequential calls
+        # reuse the same keep-alive connection instead of a new TLS handshake.
+        # Blocking on an exhausted pool makes extra callers wait for a free
+        # connection instead of opening throwaway sockets
+        adapter = KeepAliveAdapter(
+            pool_connections=Settings.POOL_CONNECTIONS,
+            pool_maxsize=Settings.POOL_MAXSIZE,
+            pool_block=True,
+            max_retries=retry_strategy,
         )
-
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
+        # Cover images come from the uploads CDN; a separate adapter keeps
+        # those downloads from crowding out API connections
+        cdn_adapter = KeepAliveAdapter(
+            pool_connections=Settings.POOL_CONNECTIONS,
+            pool_maxsize=Settings.POOL_MAXSIZE,
+            pool_block=True,
+            max_retries=retry_strategy,
+        )
+        session.mount(Settings.UPLOADS_URL, cdn_adapter)
+
         # Set default headers
         session.headers.update({
             "User-Agent": Settings.USER_AGENT,
             "Content-Type": "application/json",
+            "Connection": "keep-alive",
+            # Only advertise brotli when urllib3 can actually decode it
+            "Accept-Encoding": _ACCEPT_ENCODING,
         })
 
         return session
 
-    def _apply_rate_limit(self) -> None:
-        """Apply rate limiting between requests."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < Settings.RATE_LIMIT_DELAY:
-            time.sleep(Settings.RATE_LIMIT_DELAY - elapsed)
-        self.last_request_time = time.time()
-
-    def _get_headers(self, additional_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    def _url(self, endpoint: str) -> str:
         """
-        Get headers for request.
+        Build the absolute URL for an endpoint.
 
         Args:
-            additional_headers: Additional headers to include
+            endpoint: Path relative to the base URL, or an absolute URL
 
         Returns:
-            Complete headers dictionary
+            Absolute request URL
         """
-        headers = {}
+        if endpoint.startswith(("http://", "https://")):
+            return endpoint
+        return self._base + endpoint.lstrip("/")
 
-        if self.access_token:
-            headers["Authorization"] = f"Bearer {self.access_token}"
-
-        if additional_headers:
-            headers.update(additional_headers)
-
-        return headers
+    def _apply_rate_limit(self) -> None:
+        """Apply rate limiting between requests."""
+        self._rate_limiter.acquire()
+
+    @property
+    def access_token(self) -> Optional[str]:
+        """Access token sent as a Bearer Authorization header."""
+        return self._access_token
+
+    @access_token.setter
+    def access_token(self, token: Optional[str]) -> None:
+        # Stored on the session once, so requests merges it into every call
+        # instead of a header dict being rebuilt per request
+        self._access_token = token
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+        else:
+            self.session.headers.pop("Authorization", None)
 
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         """
@@ -116,12 +372,14 @@ class HTTPClient:
         Raises:
             Various MangaDx exceptions based on status code
         """
-        try:
-            data = response.json() if response.content else {}
-        except ValueError:
-            data = {"content": response.text}
+        status_code = response.status_code
+        if status_code == 204:
+            # No Content: nothing to parse
+            return {}
+
+        data = _decode_body(response.content)
 
-        if response.status_code == 200:
+        if status_code == 200:
             return data
 
         # Extract error message
@@ -133,26 +391,25 @@ class HTTPClient:
                 error_message = data["message"]
 
         # Raise appropriate exception based on status code
-        if response.status_code == 400:
-            raise ValidationException(error_message, response.status_code, data)
-        elif response.status_code == 401:
-            raise AuthenticationException(error_message, response.status_code, data)
-        elif response.status_code == 403:
-            raise AuthorizationException(error_message, response.status_code, data)
-        elif response.status_code == 404:
-            raise NotFoundException(error_message, response.status_code, data)
-        elif response.status_code == 429:
+        exc_cls = _STATUS_EXCEPTIONS.get(status_code)
+        if exc_cls is not None:
+            raise exc_cls(error_message, status_code, data)
+        if status_code == 429:
             retry_after = response.headers.get("Retry-After")
+            # Only the delta-seconds form is used; HTTP-dates are ignored
+            retry_seconds = int(retry_after) if retry_after and retry_after.isdigit() else None
+            if retry_seconds:
+                # Hold back every caller sharing this client, not just this one
+                self._rate_limiter.pause(retry_seconds)
             raise RateLimitException(
                 error_message,
-                retry_after=int(retry_after) if retry_after else None,
-                status_code=response.status_code,
+                retry_after=retry_seconds,
+                status_code=status_code,
                 response_data=data,
             )
-        elif 500 <= response.status_code < 600:
-            raise ServerException(error_message, response.status_code, data)
-        else:
-            raise APIException(error_message, response.status_code, data)
+        if 500 <= status_code < 600:
+            raise ServerException(error_message, status_code, data)
+        raise APIException(error_message, status_code, data)
 
     def request(
         self,
@@ -163,6 +420,8 @@ class HTTPClient:
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[int] = None,
         skip_rate_limit: bool = False,
+        cache_ttl: Optional[float] = None,
+        skip_cache: bool = False,
     ) -> Dict[str, Any]:
         """
         Make HTTP request to API.
@@ -173,8 +432,12 @@ class HTTPClient:
             params: Query parameters
             data: Request body data
             headers: Additional headers
-            timeout: Request timeout in seconds
+            timeout: Read timeout in seconds (connecting is bounded by
+                Settings.CONNECT_TIMEOUT)
             skip_rate_limit: Skip rate limiting for this request
+            cache_ttl: Cache a successful GET response for this many seconds
+                (only used for endpoints that opt in)
+            skip_cache: Bypass the response cache for this request
 
         Returns:
             Parsed JSON response
@@ -182,12 +445,29 @@ class HTTPClient:
         Raises:
             Various MangaDx exceptions on error
         """
+        cache_key = None
+        # Authenticated responses may differ per user, so they are never
+        # cached (keeping the token out of the on-disk cache keys as well)
+        if (
+            cache_ttl is not None
+            and method.upper() == "GET"
+            and Settings.ENABLE_CACHE
+            and not self._access_token
+        ):
+            cache_key = (endpoint, _freeze(params or {}))
+            if not skip_cache:
+                cached = self._get_cached(cache_key)
+                if cached is not None:
+                    return _decode_body(cached)
+
         if not skip_rate_limit:
             self._apply_rate_limit()
 
-        url = urljoin(self.base_url, endpoint)
-        request_headers = self._get_headers(headers)
-        timeout = timeout or Settings.REQUEST_TIMEOUT
+        url = self._url(endpoint)
+        if params:
+            # Encode once here instead of letting requests re-walk the lists
+            url = f"{url}?{_encode_params(params)}"
+        timeout = timeout or self._read_timeout
 
         try:
             logger.debug(f"{method} {url} - Params: {params}")
@@ -195,15 +475,74 @@ class HTTPClient:
             response = self.session.request(
                 method=method,
                 url=url,
-                params=params,
-                json=data if isinstance(data, dict) else None,
-                data=data if isinstance(data, str) else None,
-                headers=request_headers,
-                timeout=timeout,
+                # Sent as-is: the session already declares application/json
+                data=_json_dumps(data) if isinstance(data, dict) else data,
+                headers=headers,
+                timeout=(self._connect_timeout, timeout),
             )
 
-            return self._handle_response(response)
+            try:
+                result = self._handle_response(response)
+            except MangaDxException:
+                # Never keep serving a resource the API now rejects
+                if cache_key is not None:
+                    self._invalidate(cache_key)
+                raise
+
+            if cache_key is not None:
+                self._store_cached(cache_key, response.content, cache_ttl)
+            return result
+
+        except requests.Timeout as e:
+            raise TimeoutException(f"Request timed out after {timeout}s: {str(e)}")
+        except requests.ConnectionError as e:
+            raise NetworkException(f"Network error: {str(e)}")
+        except requests.RequestException as e:
+            raise APIException(f"Request failed: {str(e)}")
+
+    def stream_items(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        key: str = "data",
+        timeout: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the entries of a collection response one at a time.
+
+        With ijson installed the body is parsed incrementally as it arrives,
+        so large feed pages never sit in memory as a whole. Without it this
+        falls back to a regular GET.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            key: Top-level key holding the array of entries
+            timeout: Request timeout in seconds
+
+        Yields:
+            Raw entry dictionaries, e.g. for ``Chapter.from_dict``
+
+        Raises:
+            Various MangaDx exceptions on error
+        """
+        if ijson is None:
+            yield from self.get(endpoint, params=params, timeout=timeout).get(key, [])
+            return
+
+        self._apply_rate_limit()
 
+        url = self._url(endpoint)
+        if params:
+            url = f"{url}?{_encode_params(params)}"
+        timeout = timeout or self._read_timeout
+
+        try:
+            response = self.session.get(
+                url,
+                timeout=(self._connect_timeout, timeout),
+                stream=True,
+            )
         except requests.Timeout as e:
             raise TimeoutException(f"Request timed out after {timeout}s: {str(e)}")
         except requests.ConnectionError as e:
@@ -211,6 +550,13 @@ class HTTPClient:
         except requests.RequestException as e:
             raise APIException(f"Request failed: {str(e)}")
 
+        with response:
+            if response.status_code != 200:
+                # Error bodies are small; reuse the regular error mapping
+                self._handle_response(response)
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, f"{key}.item", use_float=True)
+
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Dict[str, Any]:
         """Make GET request."""
         return self.request("GET", endpoint, params=params, **kwargs)
@@ -227,8 +573,164 @@ class HTTPClient:
         """Make DELETE request."""
         return self.request("DELETE", endpoint, **kwargs)
 
+    def _get_cached(self, key: Hashable) -> Optional[bytes]:
+        """
+        Look up a cached GET response.
+
+        The in-memory cache is checked first, then the disk cache; disk hits
+        are promoted to memory for the rest of their lifetime.
+
+        Args:
+            key: Cache key (endpoint, frozen params)
+
+        Returns:
+            Cached response body, or None if missing or expired
+        """
+        with self._cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is not None:
+                expires_at, data = entry
+                if time.monotonic() < expires_at:
+                    return data
+                del self._response_cache[key]
+
+        if self._disk_cache is None:
+            return None
+
+        data, expire_time = self._disk_cache.get((self.base_url, key), expire_time=True)
+        if not isinstance(data, bytes):
+            # Missing, or a parsed response stored by an older version
+            return None
+        if expire_time is not None:
+            remaining = expire_time - time.time()
+            if remaining <= 0:
+                return None
+            self._remember(key, data, remaining)
+        return data
+
+    def _store_cached(self, key: Hashable, data: bytes, ttl: float) -> None:
+        """
+        Cache a GET response in memory and, if available, on disk.
+
+        Args:
+            key: Cache key (endpoint, frozen params)
+            data: Raw response body
+            ttl: Time to live in seconds
+        """
+        self._remember(key, data, ttl)
+        if self._disk_cache is not None:
+            self._disk_cache.set((self.base_url, key), data, expire=ttl)
+
+    def _remember(self, key: Hashable, data: bytes, ttl: float) -> None:
+        """Store a response in the in-memory cache."""
+        with self._cache_lock:
+            if len(self._response_cache) >= RESPONSE_CACHE_MAXSIZE and key not in self._response_cache:
+                # Dicts keep insertion order: drop the oldest entry
+                del self._response_cache[next(iter(self._response_cache))]
+            self._response_cache[key] = (time.monotonic() + ttl, data)
+
+    def _invalidate(self, key: Hashable) -> None:
+        """Drop a cached GET response."""
+        with self._cache_lock:
+            self._response_cache.pop(key, None)
+        if self._disk_cache is not None:
+            self._disk_cache.delete((self.base_url, key))
+
+    def clear_cache(self) -> None:
+        """Drop all cached GET responses, including those on disk."""
+        with self._cache_lock:
+            self._response_cache.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.clear()
+
+    def get_all_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = 100,
+        max_workers: int = PAGE_FETCH_WORKERS,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch every page of a collection endpoint.
+
+        The first page is requested on its own to learn ``total``; the
+        remaining offsets are then fetched concurrently on a small thread
+        pool. Every request still goes through the rate limiter.
+
+        Args:
+            endpoint: Collection endpoint, e.g. "/manga"
+            params: Query parameters (limit/offset are overridden)
+            page_size: Items per page (endpoint maximum)
+            max_workers: Maximum number of concurrent page requests
+
+        Returns:
+            Concatenated ``data`` entries of all pages, in order
+
+        Raises:
+            Various MangaDx exceptions on error
+        """
+        base_params = dict(params or {})
+        base_params.pop("limit", None)
+        base_params.pop("offset", None)
+
+        # Only limit/offset change between pages: encode the filters once
+        # and append the cursor to the pre-built URL
+        base_query = _encode_params(base_params)
+        page_endpoint = f"{endpoint}?{base_query}&" if base_query else f"{endpoint}?"
+
+        def fetch(offset: int) -> Dict[str, Any]:
+            limit = min(page_size, MAX_COLLECTION_RESULTS - offset)
+            return self.get(f"{page_endpoint}limit={limit}&offset={offset}")
+
+        first = fetch(0)
+        items = list(first.get("data", []))
+        total = min(first.get("total", len(items)), MAX_COLLECTION_RESULTS)
+
+        offsets = range(page_size, total, page_size)
+        if not offsets:
+            return items
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(offsets))) as executor:
+            for page in executor.map(fetch, offsets):
+                items.extend(page.get("data", []))
+
+        return items
+
+    def map(self, fn: Callable[[T], R], items: Iterable[T]) -> List[R]:
+        """
+        Run independent API calls concurrently.
+
+        Calls are I/O-bound, so the threads overlap network waits while the
+        rate limiter keeps the overall request rate within MangaDx limits.
+        Do not call map() from inside ``fn``: the pool is shared.
+
+        Args:
+            fn: Function making one or more requests through this client
+            items: Arguments, one call per item
+
+        Returns:
+            Results in the order of ``items``
+
+        Raises:
+            The first exception raised by ``fn``
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=MAP_WORKERS,
+                    thread_name_prefix="mangadx",
+                )
+            executor = self._executor
+        return list(executor.map(fn, items))
+
     def close(self) -> None:
-        """Close the HTTP session."""
+        """Close the HTTP session, the shared executor and the disk cache."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        if self._disk_cache is not None:
+            self._disk_cache.close()
         self.session.close()
 
     def __enter__(self):
@@ -4,20 +4,51 @@ Data models for MangaDx API responses.
 This module defines data classes for API responses.
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+# Slotted dataclasses drop the per-instance __dict__, which adds up when a
+# listing produces thousands of models. ``slots=`` needs Python 3.10+.
+_DATACLASS_KWARGS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_KWARGS)
 class Relationship:
     """Represents a relationship to another entity."""
     id: str
     type: str
     attributes: Optional[Dict[str, Any]] = None
 
+    def resolve(self) -> Optional[Any]:
+        """
+        Build the related model from an expanded relationship.
+
+        Only relationships requested through ``includes[]`` carry
+        attributes; others resolve to None.
+
+        Returns:
+            Author, Cover, ScanlationGroup or Manga object, or None
+        """
+        if self.attributes is None:
+            return None
+        model = RELATIONSHIP_MODELS.get(self.type)
+        if model is None:
+            return None
+        return model.from_dict({"id": self.id, "attributes": self.attributes})
+
+
+def _parse_relationships(data: Dict[str, Any]) -> List[Relationship]:
+    """Parse the ``relationships`` array of an API entity."""
+    rel_cls = Relationship
+    return [
+        rel_cls(rel["id"], rel["type"], rel.get("attributes"))
+        for rel in data.get("relationships", ())
+    ]
 
-@dataclass
+
+@dataclass(**_DATACLASS_KWARGS)
 class LocalizedString:
     """Represents a localized string dictionary."""
     values: Dict[str, str] = field(default_factory=dict)
@@ -31,7 +62,7 @@ class LocalizedString:
         return self.values.get(language, "")
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class Manga:
     """Represents a manga."""
     id: str
@@ -54,6 +85,12 @@ class Manga:
     available_translated_languages: List[str] = field(default_factory=list)
     relationships: List[Relationship] = field(default_factory=list)
 
+    @classmethod
+    def from_dict_list(cls, items: List[Dict[str, Any]]) -> List["Manga"]:
+        """Create a list of Manga objects from an API ``data`` array."""
+        from_dict = cls.from_dict
+        return [from_dict(item) for item in items]
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Manga":
         """Create Manga from API response dictionary."""
@@ -72,14 +109,7 @@ class Manga:
         description_dict = attributes.get("description", {})
         description = LocalizedString(values=description_dict)
 
-        # Parse relationships
-        relationships = []
-        for rel in data.get("relationships", []):
-            relationships.append(Relationship(
-                id=rel["id"],
-                type=rel["type"],
-                attributes=rel.get("attributes"),
-            ))
+        relationships = _parse_relationships(data)
 
         return cls(
             id=data["id"],
@@ -104,7 +134,7 @@ class Manga:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class Chapter:
     """Represents a manga chapter."""
     id: str
@@ -122,19 +152,18 @@ class Chapter:
     readable_at: Optional[datetime] = None
     relationships: List[Relationship] = field(default_factory=list)
 
+    @classmethod
+    def from_dict_list(cls, items: List[Dict[str, Any]]) -> List["Chapter"]:
+        """Create a list of Chapter objects from an API ``data`` array."""
+        from_dict = cls.from_dict
+        return [from_dict(item) for item in items]
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Chapter":
         """Create Chapter from API response dictionary."""
         attributes = data.get("attributes", {})
 
-        # Parse relationships
-        relationships = []
-        for rel in data.get("relationships", []):
-            relationships.append(Relationship(
-                id=rel["id"],
-                type=rel["type"],
-                attributes=rel.get("attributes"),
-            ))
+        relationships = _parse_relationships(data)
 
         return cls(
             id=data["id"],
@@ -154,7 +183,7 @@ class Chapter:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class Author:
     """Represents an author or artist."""
     id: str
@@ -178,6 +207,12 @@ class Author:
     updated_at: Optional[datetime] = None
     version: int = 1
 
+    @classmethod
+    def from_dict_list(cls, items: List[Dict[str, Any]]) -> List["Author"]:
+        """Create a list of Author objects from an API ``data`` array."""
+        from_dict = cls.from_dict
+        return [from_dict(item) for item in items]
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Author":
         """Create Author from API response dictionary."""
@@ -210,7 +245,7 @@ class Author:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class Cover:
     """Represents a manga cover art."""
     id: str
@@ -223,19 +258,18 @@ class Cover:
     updated_at: Optional[datetime] = None
     relationships: List[Relationship] = field(default_factory=list)
 
+    @classmethod
+    def from_dict_list(cls, items: List[Dict[str, Any]]) -> List["Cover"]:
+        """Create a list of Cover objects from an API ``data`` array."""
+        from_dict = cls.from_dict
+        return [from_dict(item) for item in items]
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Cover":
         """Create Cover from API response dictionary."""
         attributes = data.get("attributes", {})
 
-        # Parse relationships
-        relationships = []
-        for rel in data.get("relationships", []):
-            relationships.append(Relationship(
-                id=rel["id"],
-                type=rel["type"],
-                attributes=rel.get("attributes"),
-            ))
+        relationships = _parse_relationships(data)
 
         return cls(
             id=data["id"],
@@ -250,7 +284,7 @@ class Cover:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class ScanlationGroup:
     """Represents a scanlation group."""
     id: str
@@ -274,6 +308,12 @@ class ScanlationGroup:
     updated_at: Optional[datetime] = None
     version: int = 1
 
+    @classmethod
+    def from_dict_list(cls, items: List[Dict[str, Any]]) -> List["ScanlationGroup"]:
+        """Create a list of ScanlationGroup objects from an API ``data`` array."""
+        from_dict = cls.from_dict
+        return [from_dict(item) for item in items]
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ScanlationGroup":
         """Create ScanlationGroup from API response dictionary."""
@@ -306,3 +346,13 @@ class ScanlationGroup:
             updated_at=attributes.get("updatedAt"),
             version=attributes.get("version", 1),
         )
+
+
+# Relationship type -> model built by Relationship.resolve()
+RELATIONSHIP_MODELS: Dict[str, Any] = {
+    "manga": Manga,
+    "author": Author,
+    "artist": Author,
+    "cover_art": Cover,
+    "scanlation_group": ScanlationGroup,
+}
@@ -4,10 +4,32 @@ Formatting utilities for displaying data.
 This module provides functions to format manga and chapter information.
 """
 
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 from src.mangadx.models import Chapter, Manga
 
+# Preferred display languages for manga titles, in order (ja-ro is romanized Japanese)
+_TITLE_LANGUAGES = ("en", "ja", "ja-ro")
+
+
+def _pick_title(titles: Dict[str, str]) -> Tuple[str, Optional[str]]:
+    """
+    Pick the display title for a manga in a single pass.
+
+    Args:
+        titles: Title per language code (``LocalizedString.values``)
+
+    Returns:
+        Tuple of (title, language code), with ("Unknown", None) if empty
+    """
+    for lang in _TITLE_LANGUAGES:
+        title = titles.get(lang)
+        if title:
+            return title, lang
+    for lang, title in titles.items():
+        return (title, lang) if title else ("Unknown", None)
+    return "Unknown", None
+
 
 def format_manga_info(manga: Manga, verbose: bool = False) -> str:
     """
@@ -20,28 +42,23 @@ def format_manga_info(manga: Manga, verbose: bool = False) -> str:
     Returns:
         Formatted string
     """
-    # Get primary title (English or first available)
-    title_en = manga.title.get("en")
+    titles = manga.title.values
 
+    # Get primary title (English or first available)
     lines = [
-        f"Title (EN): {title_en or 'N/A'}",
+        f"Title (EN): {titles.get('en') or 'N/A'}",
     ]
 
-    # Show alternative titles
-    if manga.alt_titles:
-        alt_titles_str = []
-        for alt_title in manga.alt_titles[:3]:  # Show first 3 alt titles
-            for lang, title in alt_title.values.items():
-                alt_titles_str.append(f"{title} ({lang})")
-        if alt_titles_str:
-            lines.append(f"Alt Titles: {', '.join(alt_titles_str)}")
+    # Show alternative titles (first 3)
+    alt_titles_str = [
+        f"{title} ({lang})" for alt_title in manga.alt_titles[:3] for lang, title in alt_title.values.items()
+    ]
+    if alt_titles_str:
+        lines.append(f"Alt Titles: {', '.join(alt_titles_str)}")
 
     # Show all title languages
-    if manga.title.values:
-        all_titles = []
-        for lang, title in manga.title.values.items():
-            all_titles.append(f"{lang}: {title}")
-        lines.append(f"All Titles: {' | '.join(all_titles)}")
+    if titles:
+        lines.append(f"All Titles: {' | '.join(f'{lang}: {title}' for lang, title in titles.items())}")
 
     lines.extend([
         f"ID: {manga.id}",
@@ -64,26 +81,24 @@ def format_manga_info(manga: Manga, verbose: bool = False) -> str:
     if manga.last_chapter:
         lines.append(f"Last Chapter: {manga.last_chapter}")
 
-    if manga.available_translated_languages:
-        langs = ', '.join(manga.available_translated_languages)
-        lines.append(f"Available Languages ({len(manga.available_translated_languages)}): {langs}")
+    languages = manga.available_translated_languages
+    if languages:
+        lines.append(f"Available Languages ({len(languages)}): {', '.join(languages)}")
 
-    # Get authors and artists from relationships
+    # Get authors, artists and cover art from relationships in one pass
     authors = []
     artists = []
     cover_art = None
 
     for rel in manga.relationships:
-        if rel.type == "author":
-            author_name = rel.attributes.get("name") if rel.attributes else None
-            if author_name:
-                authors.append(author_name)
-        elif rel.type == "artist":
-            artist_name = rel.attributes.get("name") if rel.attributes else None
-            if artist_name:
-                artists.append(artist_name)
-        elif rel.type == "cover_art":
+        rel_type = rel.type
+        attributes = rel.attributes
+        if rel_type == "cover_art":
             cover_art = rel
+        elif attributes and rel_type in ("author", "artist"):
+            name = attributes.get("name")
+            if name:
+                (authors if rel_type == "author" else artists).append(name)
 
     if authors:
         lines.append(f"Author(s): {', '.join(authors)}")
@@ -93,15 +108,15 @@ def format_manga_info(manga: Manga, verbose: bool = False) -> str:
 
     if verbose:
         # Full description
-        if manga.description.values:
-            desc_en = manga.description.get("en")
+        descriptions = manga.description.values
+        if descriptions:
+            desc_en = descriptions.get("en")
             if desc_en:
                 lines.append(f"\nDescription (EN):\n{desc_en}")
             else:
                 # Show first available description
-                for lang, desc in manga.description.values.items():
-                    lines.append(f"\nDescription ({lang}):\n{desc}")
-                    break
+                lang, desc = next(iter(descriptions.items()))
+                lines.append(f"\nDescription ({lang}):\n{desc}")
 
         # Tags with categories
         if manga.tags:
@@ -171,49 +186,32 @@ def format_manga_list(manga_list: List[Manga]) -> str:
     if not manga_list:
         return "No manga found."
 
-    lines = []
-    for idx, manga in enumerate(manga_list, 1):
-        # Get English title first, then try Japanese, then any available title
-        title = manga.title.get("en")
-        if not title:
-            title = manga.title.get("ja")
-        if not title:
-            title = manga.title.get("ja-ro")  # Romanized Japanese
-        if not title and manga.title.values:
-            # Get first available title from any language
-            title = list(manga.title.values.values())[0]
-        if not title:
-            title = "Unknown"
+    # Two lines per manga, filled in place instead of grown with append
+    lines = [""] * (2 * len(manga_list))
+    for idx, manga in enumerate(manga_list):
+        # English title first, then Japanese, romanized Japanese, then any
+        title, title_lang = _pick_title(manga.title.values)
 
         status = manga.status or "Unknown"
         year = manga.year or "N/A"
 
         # Check for English alternative title if main title is not English
         alt_en_title = None
-        if not manga.title.get("en") and manga.alt_titles:
-            for alt_title in manga.alt_titles:
-                if "en" in alt_title.values:
-                    alt_en_title = alt_title.values["en"]
-                    break
-
-        # Show title with language indicator if not English
-        title_lang = None
-        if not manga.title.get("en"):
-            # Find which language we're displaying
-            for lang, t in manga.title.values.items():
-                if t == title:
-                    title_lang = lang
-                    break
+        if title_lang != "en":
+            alt_en_title = next(
+                (alt.values["en"] for alt in manga.alt_titles if "en" in alt.values), None
+            )
 
         # Format title display
         if alt_en_title:
             title_display = f"{title} / {alt_en_title}"
-        elif title_lang:
+        elif title_lang and title_lang != "en":
+            # Show title with language indicator if not English
             title_display = f"{title} [{title_lang}]"
         else:
             title_display = title
 
-        lines.append(f"{idx}. {title_display} ({year}) - {status}")
-        lines.append(f"   ID: {manga.id}")
+        lines[2 * idx] = f"{idx + 1}. {title_display} ({year}) - {status}"
+        lines[2 * idx + 1] = f"   ID: {manga.id}"
 
     return "\n".join(lines)
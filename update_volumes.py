@@ -5,46 +5,97 @@ This script checks if MangaDx has updated volume assignments for downloaded mang
 and reorganizes folders accordingly.
 """
 
-import json
+import errno
+import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from colorama import Fore, init
+from colorama import Fore, Style, just_fix_windows_console
 
 from config import Settings
 from src.mangadx import MangaDxClient
 
-init(autoreset=True)
+# Only Windows consoles need colorama to translate ANSI codes; elsewhere
+# stdout is left unwrapped and _write resets the colour itself
+just_fix_windows_console()
+
+# Characters not allowed in folder names, mapped to "_" in one translate pass
+_INVALID_CHARS_TABLE = str.maketrans({char: "_" for char in '<>:"/\\|?*'})
+
+# Number of manga whose chapter lists are fetched concurrently in scan mode
+API_FETCH_WORKERS = 8
+
+# Title languages in order of preference
+_TITLE_LANGUAGES = ("en", "ja", "ja-ro")
+
+# Manga titles already fetched in this process, keyed by manga ID
+_manga_title_cache: Dict[str, str] = {}
+
+# Number of chapter folders moved concurrently by apply_changes
+MOVE_WORKERS = 16
+
+# Volume values the API uses for "no volume" (compared lowercased; an empty
+# string is caught by the truthiness check)
+_NO_VOLUME = frozenset({"none", "null"})
+
+# Chapter -> volume maps already fetched in this process, keyed by
+# (manga_id, language)
+_api_structure_cache: Dict[Tuple[str, str], Dict[str, Optional[str]]] = {}
+
+
+class Change(NamedTuple):
+    """A chapter whose volume assignment differs from the API."""
+
+    chapter: str
+    from_vol: Optional[str]
+    to_vol: Optional[str]
+    path: Path
+
+
+def _write(*lines: str) -> None:
+    """Write one or more lines to stdout in a single call, resetting colour after each."""
+    sys.stdout.write("".join(f"{line}{Style.RESET_ALL}\n" for line in lines))
+
+
+def _prompt(message: str) -> str:
+    """Show a prompt (colour reset afterwards) and read a line of input."""
+    sys.stdout.write(f"{message}{Style.RESET_ALL}")
+    sys.stdout.flush()
+    return input()
 
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename for filesystem."""
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, "_")
-    return filename.strip()
+    return filename.translate(_INVALID_CHARS_TABLE).strip()
 
 
-def get_manga_title(client: MangaDxClient, manga_id: str) -> str:
-    """Get proper manga title from API."""
-    try:
-        manga = client.manga.get(manga_id)
+def _best_title(titles: Dict[str, str]) -> Optional[str]:
+    """Pick the preferred title, falling back to the first one listed."""
+    for lang in _TITLE_LANGUAGES:
+        title = titles.get(lang)
+        if title:
+            return title
+    return next(iter(titles.values()), None)
 
-        title = manga.title.get("en")
-        if not title:
-            title = manga.title.get("ja")
-        if not title:
-            title = manga.title.get("ja-ro")
-        if not title and manga.title.values:
-            title = list(manga.title.values.values())[0]
 
+def get_manga_title(client: MangaDxClient, manga_id: str) -> str:
+    """Get proper manga title from API (cached for the rest of the process)."""
+    cached = _manga_title_cache.get(manga_id)
+    if cached is not None:
+        return cached
+
+    try:
+        title = _best_title(client.manga.get(manga_id).title.values)
+        if title:
+            _manga_title_cache[manga_id] = title
         return title
     except Exception as e:
-        print(f"{Fore.RED}Error getting title for {manga_id}: {e}")
+        _write(f"{Fore.RED}Error getting title for {manga_id}: {e}")
         return None
 
 
@@ -58,21 +109,31 @@ def get_current_structure(manga_dir: Path) -> Dict[str, Dict[str, Path]]:
     """
     structure = {}
 
-    # Check chapters in root
-    for item in manga_dir.iterdir():
-        if item.is_dir() and item.name.startswith("Ch."):
-            chapter_num = item.name.replace("Ch.", "")
-            structure[chapter_num] = {"volume": None, "path": item}
-
-    # Check chapters in volume folders
-    for vol_dir in manga_dir.iterdir():
-        if vol_dir.is_dir() and vol_dir.name.startswith("Vol."):
-            vol_num = vol_dir.name.replace("Vol.", "")
-
-            for chapter_dir in vol_dir.iterdir():
-                if chapter_dir.is_dir() and chapter_dir.name.startswith("Ch."):
-                    chapter_num = chapter_dir.name.replace("Ch.", "")
-                    structure[chapter_num] = {"volume": vol_num, "path": chapter_dir}
+    # os.scandir reports the entry type from the directory listing itself,
+    # so is_dir() needs no extra stat call per entry (unlike Path.is_dir())
+    with os.scandir(manga_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            name = entry.name
+
+            if name.startswith("Ch."):
+                # Chapters in root; a copy inside a volume folder wins
+                structure.setdefault(name[3:], {"volume": None, "path": Path(entry.path)})
+
+            elif name.startswith("Vol."):
+                # Chapters in volume folders
+                vol_num = name[4:]
+
+                with os.scandir(entry.path) as chapter_entries:
+                    for chapter_entry in chapter_entries:
+                        if chapter_entry.is_dir(
+                            follow_symlinks=False
+                        ) and chapter_entry.name.startswith("Ch."):
+                            structure[chapter_entry.name[3:]] = {
+                                "volume": vol_num,
+                                "path": Path(chapter_entry.path),
+                            }
 
     return structure
 
@@ -83,10 +144,18 @@ def get_api_structure(
     """
     Get current volume structure from MangaDx API.
 
+    Successful results are cached per (manga_id, language) for the rest of
+    the process; failures are not, so they are retried on the next call.
+
     Returns:
         Dict mapping chapter numbers to volume numbers
         Format: {chapter_num: vol_num or None}
     """
+    cache_key = (manga_id, language)
+    cached = _api_structure_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         chapters_data = client.manga.get_chapters_list(manga_id, translated_language=[language])
 
@@ -96,50 +165,77 @@ def get_api_structure(
             volume = chapter.get("volume")
 
             # Normalize volume (treat "none", "null", empty as None)
-            if volume and volume.lower() not in ["none", "null", ""]:
-                api_structure[chapter_num] = volume
-            else:
-                api_structure[chapter_num] = None
+            api_structure[chapter_num] = (
+                volume if volume and volume.lower() not in _NO_VOLUME else None
+            )
 
+        _api_structure_cache[cache_key] = api_structure
         return api_structure
 
     except Exception as e:
-        print(f"{Fore.RED}Error getting API structure: {e}")
+        _write(f"{Fore.RED}Error getting API structure: {e}")
         return {}
 
 
-def compare_structures(current: Dict, api: Dict) -> List[Dict]:
+def compare_structures(current: Dict, api: Dict) -> List[Change]:
     """
     Compare current and API structures to find changes.
 
     Returns:
         List of changes needed
-        Format: [{"chapter": ch_num, "from_vol": old_vol, "to_vol": new_vol, "path": current_path}]
     """
-    changes = []
+    # One lookup per chapter (local entries are always dicts, never None);
+    # only chapters whose volume assignment changed are kept
+    return [
+        Change(chapter_num, local["volume"], api_vol, local["path"])
+        for chapter_num, api_vol in api.items()
+        if (local := current.get(chapter_num)) is not None and local["volume"] != api_vol
+    ]
+
+
+def _move_chapter(
+    chapter_num: str, old_path: Path, new_path: str, route: str
+) -> Tuple[bool, str]:
+    """
+    Move one chapter folder.
 
-    for chapter_num, api_vol in api.items():
-        if chapter_num in current:
-            current_vol = current[chapter_num]["volume"]
+    Args:
+        chapter_num: Chapter number
+        old_path: Current chapter folder
+        new_path: Destination chapter folder
+        route: Source and destination for the progress line, e.g. "root → Vol.1"
 
-            # Check if volume assignment changed
-            if current_vol != api_vol:
-                changes.append(
-                    {
-                        "chapter": chapter_num,
-                        "from_vol": current_vol,
-                        "to_vol": api_vol,
-                        "path": current[chapter_num]["path"],
-                    }
-                )
+    Returns:
+        Tuple of (whether the folder was moved, progress line)
+    """
+    try:
+        if os.path.lexists(new_path):
+            return (
+                False,
+                f"{Fore.YELLOW}  ⚠ Ch.{chapter_num} already exists at destination, skipping",
+            )
+
+        # Source and destination share manga_dir, so a plain rename
+        # suffices; shutil.move is only needed across filesystems
+        try:
+            os.replace(old_path, new_path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(os.fspath(old_path), new_path)
+        return True, f"{Fore.GREEN}  ✓ Moved Ch.{chapter_num}: {route}"
 
-    return changes
+    except Exception as e:
+        return False, f"{Fore.RED}  ✗ Failed to move Ch.{chapter_num}: {e}"
 
 
-def apply_changes(manga_dir: Path, changes: List[Dict], dry_run: bool = False) -> int:
+def apply_changes(manga_dir: Path, changes: List[Change], dry_run: bool = False) -> int:
     """
     Apply volume structure changes.
 
+    Chapter folders are independent of each other, so they are moved
+    concurrently; emptied volume folders are removed once all moves finish.
+
     Args:
         manga_dir: Manga directory path
         changes: List of changes to apply
@@ -148,51 +244,61 @@ def apply_changes(manga_dir: Path, changes: List[Dict], dry_run: bool = False) -
     Returns:
         Number of chapters moved
     """
-    moved_count = 0
-
-    for change in changes:
-        chapter_num = change["chapter"]
-        from_vol = change["from_vol"]
-        to_vol = change["to_vol"]
-        old_path = change["path"]
-
-        # Determine new path
-        if to_vol:
-            new_path = manga_dir / f"Vol.{to_vol}" / f"Ch.{chapter_num}"
-        else:
-            new_path = manga_dir / f"Ch.{chapter_num}"
-
+    # Progress lines are collected and written once at the end
+    output = []
+    # Paths are assembled as plain strings with os.path, which avoids
+    # building intermediate Path objects for every change
+    base = os.fspath(manga_dir)
+    created_dirs = set()
+    moves = []
+
+    for chapter_num, from_vol, to_vol, old_path in changes:
         # Show change
         from_str = f"Vol.{from_vol}" if from_vol else "root"
         to_str = f"Vol.{to_vol}" if to_vol else "root"
+        route = f"{from_str} → {to_str}"
 
         if dry_run:
-            print(f"{Fore.YELLOW}  [DRY RUN] Would move Ch.{chapter_num}: {from_str} → {to_str}")
-        else:
-            try:
-                # Create parent directory if needed
-                new_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # Move chapter folder
-                if new_path.exists():
-                    print(
-                        f"{Fore.YELLOW}  ⚠ Ch.{chapter_num} already exists at destination, skipping"
-                    )
-                else:
-                    shutil.move(str(old_path), str(new_path))
-                    print(f"{Fore.GREEN}  ✓ Moved Ch.{chapter_num}: {from_str} → {to_str}")
-                    moved_count += 1
+            output.append(f"{Fore.YELLOW}  [DRY RUN] Would move Ch.{chapter_num}: {route}")
+            continue
 
-                # Clean up empty volume folder
-                if from_vol:
-                    old_vol_dir = manga_dir / f"Vol.{from_vol}"
-                    if old_vol_dir.exists() and not any(old_vol_dir.iterdir()):
-                        old_vol_dir.rmdir()
-                        print(f"{Fore.CYAN}    Removed empty Vol.{from_vol}")
+        # Determine new path
+        if to_vol:
+            new_parent = os.path.join(base, f"Vol.{to_vol}")
+            # Create each volume directory once, before any move starts
+            if new_parent not in created_dirs:
+                try:
+                    os.makedirs(new_parent, exist_ok=True)
+                except OSError as e:
+                    output.append(f"{Fore.RED}  ✗ Failed to move Ch.{chapter_num}: {e}")
+                    continue
+                created_dirs.add(new_parent)
+        else:
+            new_parent = base
+        moves.append(
+            (chapter_num, old_path, os.path.join(new_parent, f"Ch.{chapter_num}"), route)
+        )
 
-            except Exception as e:
-                print(f"{Fore.RED}  ✗ Failed to move Ch.{chapter_num}: {e}")
+    moved_count = 0
+    if moves:
+        with ThreadPoolExecutor(max_workers=min(MOVE_WORKERS, len(moves))) as executor:
+            # map() keeps results in submission order, so output is deterministic
+            for moved, line in executor.map(lambda move: _move_chapter(*move), moves):
+                output.append(line)
+                moved_count += moved
+
+        # Clean up emptied volume folders: rmdir only succeeds on an empty
+        # directory, so no exists()/listing probe is needed
+        for from_vol in dict.fromkeys(change.from_vol for change in changes if change.from_vol):
+            try:
+                os.rmdir(os.path.join(base, f"Vol.{from_vol}"))
+            except OSError:
+                pass  # missing or still has chapters
+            else:
+                output.append(f"{Fore.CYAN}    Removed empty Vol.{from_vol}")
 
+    if output:
+        _write(*output)
     return moved_count
 
 
@@ -202,92 +308,154 @@ def update_manga_volumes(
     client: MangaDxClient,
     language: str = "en",
     dry_run: bool = False,
+    api_structure: Optional[Dict[str, Optional[str]]] = None,
+    current_structure: Optional[Dict[str, Dict]] = None,
 ):
-    """Update volume structure for a single manga."""
+    """
+    Update volume structure for a single manga.
+
+    Args:
+        api_structure: Chapter -> volume map already fetched for this manga;
+            fetched from the API when not given
+        current_structure: Local structure already scanned for this manga;
+            scanned from manga_dir when not given
+    """
     manga_name = manga_dir.name
 
-    print(f"\n{Fore.CYAN}{'─' * 60}")
-    print(f"{Fore.CYAN}Checking: {manga_name}")
-    print(f"{Fore.CYAN}{'─' * 60}")
+    _write(
+        f"\n{Fore.CYAN}{'─' * 60}",
+        f"{Fore.CYAN}Checking: {manga_name}",
+        f"{Fore.CYAN}{'─' * 60}",
+    )
 
     # Get current structure
-    print(f"{Fore.WHITE}Scanning local folders...")
-    current_structure = get_current_structure(manga_dir)
-    print(f"{Fore.WHITE}Found {len(current_structure)} chapters locally")
+    if current_structure is None:
+        _write(f"{Fore.WHITE}Scanning local folders...")
+        current_structure = get_current_structure(manga_dir)
+    _write(f"{Fore.WHITE}Found {len(current_structure)} chapters locally")
+
+    # Nothing local to reorganize, so don't spend an API request on it
+    if not current_structure:
+        _write(f"{Fore.YELLOW}No local chapters, skipping")
+        return
 
     # Get API structure
-    print(f"{Fore.WHITE}Fetching structure from MangaDx API...")
-    api_structure = get_api_structure(client, manga_id, language)
+    if api_structure is None:
+        _write(f"{Fore.WHITE}Fetching structure from MangaDx API...")
+        api_structure = get_api_structure(client, manga_id, language)
 
     if not api_structure:
-        print(f"{Fore.RED}✗ Could not fetch API structure")
+        _write(f"{Fore.RED}✗ Could not fetch API structure")
         return
 
-    print(f"{Fore.WHITE}Found {len(api_structure)} chapters on MangaDx")
+    _write(f"{Fore.WHITE}Found {len(api_structure)} chapters on MangaDx")
 
     # Compare structures
     changes = compare_structures(current_structure, api_structure)
 
     if not changes:
-        print(f"{Fore.GREEN}✓ Structure is up to date, no changes needed")
+        _write(f"{Fore.GREEN}✓ Structure is up to date, no changes needed")
         return
 
     # Show changes
-    print(f"\n{Fore.YELLOW}Found {len(changes)} volume assignment changes:")
+    lines = [f"\n{Fore.YELLOW}Found {len(changes)} volume assignment changes:"]
     for change in changes:
-        from_str = f"Vol.{change['from_vol']}" if change["from_vol"] else "root"
-        to_str = f"Vol.{change['to_vol']}" if change["to_vol"] else "root"
-        print(f"{Fore.YELLOW}  • Ch.{change['chapter']}: {from_str} → {to_str}")
+        from_str = f"Vol.{change.from_vol}" if change.from_vol else "root"
+        to_str = f"Vol.{change.to_vol}" if change.to_vol else "root"
+        lines.append(f"{Fore.YELLOW}  • Ch.{change.chapter}: {from_str} → {to_str}")
+    _write(*lines)
 
     # Apply changes
     if not dry_run:
-        confirm = input(f"\n{Fore.CYAN}Apply these changes? (Y/n): ").strip().lower()
+        confirm = _prompt(f"\n{Fore.CYAN}Apply these changes? (Y/n): ").strip().lower()
         if confirm == "n":
-            print(f"{Fore.YELLOW}Skipped")
+            _write(f"{Fore.YELLOW}Skipped")
             return
 
-    print(f"\n{Fore.WHITE}Applying changes...")
+    _write(f"\n{Fore.WHITE}Applying changes...")
     moved = apply_changes(manga_dir, changes, dry_run)
 
     if not dry_run:
-        print(f"\n{Fore.GREEN}✓ Updated {moved} chapters")
+        _write(f"\n{Fore.GREEN}✓ Updated {moved} chapters")
 
 
 def scan_and_update(
     download_dir: Path, client: MangaDxClient, language: str = "en", dry_run: bool = False
 ):
     """Scan all manga and update volumes."""
-    print(f"\n{Fore.CYAN}{'=' * 60}")
-    print(f"{Fore.CYAN}  MangaDx Volume Structure Updater")
-    print(f"{Fore.CYAN}{'=' * 60}")
+    _write(
+        f"\n{Fore.CYAN}{'=' * 60}",
+        f"{Fore.CYAN}  MangaDx Volume Structure Updater",
+        f"{Fore.CYAN}{'=' * 60}",
+    )
 
     if dry_run:
-        print(f"{Fore.YELLOW}\n⚠ DRY RUN MODE - No changes will be made\n")
+        _write(f"{Fore.YELLOW}\n⚠ DRY RUN MODE - No changes will be made\n")
 
     # Get all manga folders
-    manga_folders = [d for d in download_dir.iterdir() if d.is_dir()]
+    with os.scandir(download_dir) as entries:
+        manga_folders = [
+            Path(entry.path) for entry in entries if entry.is_dir(follow_symlinks=False)
+        ]
 
     if not manga_folders:
-        print(f"\n{Fore.YELLOW}No manga folders found in {download_dir}")
+        _write(f"\n{Fore.YELLOW}No manga folders found in {download_dir}")
         return
 
-    print(f"\n{Fore.WHITE}Found {len(manga_folders)} manga folders")
-    print(f"{Fore.WHITE}Language: {language}\n")
+    _write(
+        f"\n{Fore.WHITE}Found {len(manga_folders)} manga folders",
+        f"{Fore.WHITE}Language: {language}\n",
+    )
 
-    # Process each manga
+    # Ask for every manga ID up front
+    selected = []
     for manga_dir in manga_folders:
-        # Ask for manga ID
-        print(f"\n{Fore.CYAN}Manga: {manga_dir.name}")
-        manga_id = input(f"{Fore.WHITE}Enter manga ID (or press Enter to skip): ").strip()
+        _write(f"\n{Fore.CYAN}Manga: {manga_dir.name}")
+
+        # Folders without chapters need neither an ID nor an API request
+        current_structure = get_current_structure(manga_dir)
+        if not current_structure:
+            _write(f"{Fore.YELLOW}No local chapters, skipping")
+            continue
+
+        manga_id = _prompt(f"{Fore.WHITE}Enter manga ID (or press Enter to skip): ").strip()
 
         if not manga_id:
-            print(f"{Fore.YELLOW}Skipped")
+            _write(f"{Fore.YELLOW}Skipped")
             continue
 
+        selected.append((manga_dir, manga_id, current_structure))
+
+    if not selected:
+        return
+
+    # Fetch all chapter lists concurrently so their HTTP round trips overlap
+    _write(f"\n{Fore.WHITE}Fetching structure for {len(selected)} manga from MangaDx API...")
+    manga_ids = list(dict.fromkeys(manga_id for _, manga_id, _ in selected))
+    with ThreadPoolExecutor(max_workers=min(API_FETCH_WORKERS, len(manga_ids))) as executor:
+        api_structures = dict(
+            zip(
+                manga_ids,
+                executor.map(
+                    lambda manga_id: get_api_structure(client, manga_id, language), manga_ids
+                ),
+            )
+        )
+
+    # Process each manga
+    for manga_dir, manga_id, current_structure in selected:
         try:
-            update_manga_volumes(manga_dir, manga_id, client, language, dry_run)
+            update_manga_volumes(
+                manga_dir,
+                manga_id,
+                client,
+                language,
+                dry_run,
+                api_structure=api_structures[manga_id],
+                current_structure=current_structure,
+            )
         except Exception as e:
-            print(f"{Fore.RED}✗ Error: {e}")
+            _write(f"{Fore.RED}✗ Error: {e}")
 
 
 def update_specific_manga(
@@ -298,24 +466,28 @@ def update_specific_manga(
     dry_run: bool = False,
 ):
     """Update volumes for a specific manga by ID."""
-    print(f"\n{Fore.CYAN}{'=' * 60}")
-    print(f"{Fore.CYAN}  Updating Manga: {manga_id}")
-    print(f"{Fore.CYAN}{'=' * 60}")
+    _write(
+        f"\n{Fore.CYAN}{'=' * 60}",
+        f"{Fore.CYAN}  Updating Manga: {manga_id}",
+        f"{Fore.CYAN}{'=' * 60}",
+    )
 
     # Get manga title
-    print(f"\n{Fore.WHITE}Fetching manga information...")
+    _write(f"\n{Fore.WHITE}Fetching manga information...")
     manga_title = get_manga_title(client, manga_id)
 
     if not manga_title:
-        print(f"{Fore.RED}✗ Could not fetch manga information")
+        _write(f"{Fore.RED}✗ Could not fetch manga information")
         return
 
     safe_title = sanitize_filename(manga_title)
     manga_dir = download_dir / safe_title
 
     if not manga_dir.exists():
-        print(f"{Fore.RED}✗ Manga folder not found: {manga_dir}")
-        print(f"{Fore.YELLOW}  Expected: {safe_title}")
+        _write(
+            f"{Fore.RED}✗ Manga folder not found: {manga_dir}",
+            f"{Fore.YELLOW}  Expected: {safe_title}",
+        )
         return
 
     update_manga_volumes(manga_dir, manga_id, client, language, dry_run)
@@ -338,7 +510,7 @@ def main():
     download_dir = Settings.DOWNLOAD_DIR
 
     if not download_dir.exists():
-        print(f"{Fore.RED}Download directory not found: {download_dir}")
+        _write(f"{Fore.RED}Download directory not found: {download_dir}")
         return
 
     client = MangaDxClient()
@@ -352,17 +524,19 @@ def main():
             scan_and_update(download_dir, client, args.language, args.dry_run)
         else:
             # Interactive mode
-            print(f"\n{Fore.CYAN}{'=' * 60}")
-            print(f"{Fore.CYAN}  MangaDx Volume Structure Updater")
-            print(f"{Fore.CYAN}{'=' * 60}\n")
-            print(f"{Fore.WHITE}1. Update specific manga by ID")
-            print(f"{Fore.WHITE}2. Scan all manga folders")
-            print(f"{Fore.WHITE}3. Exit\n")
+            _write(
+                f"\n{Fore.CYAN}{'=' * 60}",
+                f"{Fore.CYAN}  MangaDx Volume Structure Updater",
+                f"{Fore.CYAN}{'=' * 60}\n",
+                f"{Fore.WHITE}1. Update specific manga by ID",
+                f"{Fore.WHITE}2. Scan all manga folders",
+                f"{Fore.WHITE}3. Exit\n",
+            )
 
-            choice = input(f"{Fore.CYAN}Enter your choice: ").strip()
+            choice = _prompt(f"{Fore.CYAN}Enter your choice: ").strip()
 
             if choice == "1":
-                manga_id = input(f"\n{Fore.CYAN}Enter manga ID: ").strip()
+                manga_id = _prompt(f"\n{Fore.CYAN}Enter manga ID: ").strip()
                 if manga_id:
                     update_specific_manga(
                         manga_id, download_dir, client, args.language, args.dry_run
@@ -370,11 +544,13 @@ def main():
             elif choice == "2":
                 scan_and_update(download_dir, client, args.language, args.dry_run)
             else:
-                print(f"{Fore.YELLOW}Goodbye!")
+                _write(f"{Fore.YELLOW}Goodbye!")
 
-        print(f"\n{Fore.CYAN}{'=' * 60}")
-        print(f"{Fore.CYAN}  Update complete!")
-        print(f"{Fore.CYAN}{'=' * 60}\n")
+        _write(
+            f"\n{Fore.CYAN}{'=' * 60}",
+            f"{Fore.CYAN}  Update complete!",
+            f"{Fore.CYAN}{'=' * 60}\n",
+        )
 
     finally:
         client.close()
@@ -384,6 +560,6 @@ if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        print(f"\n\n{Fore.YELLOW}Operation cancelled by user")
+        _write(f"\n\n{Fore.YELLOW}Operation cancelled by user")
     except Exception as e:
-        print(f"\n{Fore.RED}Error: {e}")
+        _write(f"\n{Fore.RED}Error: {e}")